@@ -0,0 +1,107 @@
+"""Asynchronous HTTP client."""
+
+import asyncio
+import ssl
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncHttpClient:
+    """Asynchronous HTTP client.
+
+    Will use the API key if the URL starts with the Kili endpoint.
+
+    The body of the responses is read before they are returned,
+    so `await response.json()` or `await response.read()` can be called on them at any time.
+    """
+
+    def __init__(
+        self,
+        kili_endpoint: str,
+        api_key: str,
+        verify: Union[bool, str],
+        max_concurrent_requests: int = 10,
+    ) -> None:
+        """Initialize the asynchronous HTTP client."""
+        try:
+            import aiohttp  # pylint: disable=import-outside-toplevel # noqa: F401
+        except ImportError as e:
+            raise ImportError("Install with `pip install kili[async]` to use this feature.") from e
+
+        self._kili_endpoint = kili_endpoint.replace("/api/label/v2/graphql", "/api/label/v2")
+        self._ssl = ssl.create_default_context(cafile=verify) if isinstance(verify, str) else verify
+        self._auth_headers = {"Authorization": f"X-API-Key: {api_key}"}
+        self._max_concurrent_requests = max_concurrent_requests
+
+        # the session must be created from within the event loop that uses it
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the aiohttp session, creating it on first call."""
+        if self._session is None:
+            import aiohttp  # pylint: disable=import-outside-toplevel
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl, limit=self._max_concurrent_requests),
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        """Open the client."""
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the client."""
+        await self.close()
+
+    async def _send_request(self, method: str, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a request to the given URL."""
+        if url.startswith(self._kili_endpoint):
+            kwargs["headers"] = {**self._auth_headers, **(kwargs.get("headers") or {})}
+
+        timeout = kwargs.pop("timeout", None)
+        if timeout is not None:
+            import aiohttp  # pylint: disable=import-outside-toplevel
+
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        session = self._get_session()
+        assert self._semaphore is not None
+        async with self._semaphore, session.request(method, url, **kwargs) as response:
+            await response.read()
+            return response
+
+    async def get(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a GET request to the given URL."""
+        return await self._send_request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a POST request to the given URL."""
+        return await self._send_request("POST", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a HEAD request to the given URL."""
+        return await self._send_request("HEAD", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a PUT request to the given URL."""
+        return await self._send_request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a PATCH request to the given URL."""
+        return await self._send_request("PATCH", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any) -> "aiohttp.ClientResponse":
+        """Send a OPTIONS request to the given URL."""
+        return await self._send_request("OPTIONS", url, **kwargs)
@@ -0,0 +1,182 @@
+"""Transport adapter of requests sending the requests with httpx, over HTTP/2."""
+
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+if TYPE_CHECKING:
+    import httpx
+
+RequestsTimeout = Union[None, float, tuple[Optional[float], Optional[float]]]
+# bodies of the prepared requests, either encoded, or streamed by chunks
+RequestBody = Union[str, bytes, Iterable[bytes], None]
+
+
+class _HttpxRawResponse:
+    """File-like body of a response streamed by httpx, as expected by `requests.Response.raw`."""
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self._response = response
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+    def stream(self, chunk_size: Optional[int] = None, decode_content: bool = True):
+        """Iterate over the decoded chunks of the body, closing the response at the end."""
+        _ = decode_content
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        finally:
+            self._response.close()
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        """Read up to `amt` bytes of the decoded body, or the whole body if `amt` is None."""
+        _ = decode_content
+        if self._chunks is None:
+            self._chunks = self.stream()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = (
+            (self._buffer, b"") if amt is None else (self._buffer[:amt], self._buffer[amt:])
+        )
+        return data
+
+    def tell(self) -> int:
+        """Number of bytes of the body read from the wire so far."""
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        """Close the response, releasing its connection."""
+        self._response.close()
+
+    def release_conn(self) -> None:
+        """Release the connection of the response."""
+        self._response.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """Adapter sending the requests of a requests session with an httpx client.
+
+    The connections are negotiated in HTTP/2 with the servers supporting it,
+    so that the concurrent requests to a host are multiplexed over a few connections.
+    The TLS verification is the one given when creating the adapter. The proxies and the
+    client certificate of the requests, e.g. from the environment, are used as by requests,
+    with an httpx client per proxy and certificate.
+    """
+
+    def __init__(
+        self,
+        verify: Union[bool, str] = True,
+        max_keepalive_connections: Optional[int] = 10,
+        max_retries: int = 0,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            verify: Whether to verify the TLS certificates, or path to a CA bundle.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            max_retries: Number of retries of the requests that failed to connect.
+        """
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError("Install with `pip install kili[http2]` to use HTTP/2.") from err
+
+        super().__init__()
+        self._httpx = httpx
+        self._verify = verify
+        self._max_keepalive_connections = max_keepalive_connections
+        self._max_retries = max_retries
+        self._clients: dict[tuple[Optional[str], Any], "httpx.Client"] = {}
+        self._clients_lock = threading.Lock()
+
+    def _get_client(self, proxy: Optional[str], cert: Any) -> "httpx.Client":
+        """Get the httpx client sending the requests through a proxy, with a client certificate."""
+        with self._clients_lock:
+            client = self._clients.get((proxy, cert))
+            if client is None:
+                # the proxies and certificates of the environment are resolved by requests
+                client = self._httpx.Client(
+                    transport=self._httpx.HTTPTransport(
+                        http2=True,
+                        verify=self._verify,
+                        cert=cert,
+                        proxy=self._httpx.Proxy(proxy) if proxy else None,
+                        limits=self._httpx.Limits(
+                            max_keepalive_connections=self._max_keepalive_connections
+                        ),
+                        retries=self._max_retries,
+                    ),
+                    timeout=None,
+                    trust_env=False,
+                )
+                self._clients[(proxy, cert)] = client
+            return client
+
+    def _get_timeout(self, timeout: RequestsTimeout) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return self._httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        return self._httpx.Timeout(timeout)
+
+    def send(  # pylint: disable=too-many-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: RequestsTimeout = None,
+        verify: Union[bool, str] = True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        """Send a prepared request, raising the exceptions of requests."""
+        _ = verify
+        url = request.url or ""
+        client = self._get_client(
+            select_proxy(url, proxies) if proxies else None,
+            tuple(cert) if isinstance(cert, list) else cert,
+        )
+        httpx_request = client.build_request(
+            request.method or "GET",
+            url,
+            headers={
+                name: value if isinstance(value, str) else value.decode("latin-1")
+                for name, value in request.headers.items()
+            },
+            content=cast(RequestBody, request.body),
+            timeout=self._get_timeout(timeout),
+        )
+        try:
+            httpx_response = client.send(httpx_request, stream=True)
+        except self._httpx.TimeoutException as err:
+            raise requests.exceptions.Timeout(err, request=request) from err
+        except self._httpx.HTTPError as err:
+            raise requests.exceptions.ConnectionError(err, request=request) from err
+
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = url
+        response.request = request
+        response.raw = _HttpxRawResponse(httpx_response)
+        # typed as an HTTPAdapter by requests, but only its send method is used
+        response.connection = self  # pyright: ignore[reportAttributeAccessIssue]
+        if not stream:
+            _ = response.content
+        return response
+
+    def close(self) -> None:
+        """Close the connections of the adapter."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
@@ -1,29 +1,205 @@
 """HTTP client."""
 
-from typing import Union
+import functools
+import os
+import time
+from typing import TYPE_CHECKING, Any, Optional, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from kili.core.metrics import MetricsRecorder
+from kili.core.utils import json_codec
+from kili.utils.tracing import tracer
+
+if TYPE_CHECKING:
+    from kili.adapters.json_blob_cache import JsonBlobCache
+
+
+def _load_response_json(response: requests.Response, **kwargs) -> Any:
+    """Decode the JSON body of a response with the JSON codec of the SDK."""
+    if not kwargs:
+        try:
+            return json_codec.loads(response.content)
+        except ValueError:
+            pass
+    # raises the error of requests if the body is not valid JSON
+    return requests.Response.json(response, **kwargs)
+
+
+class JsonCodecSession(requests.Session):
+    """Session encoding and decoding the JSON bodies with the JSON codec of the SDK."""
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:  # type: ignore[override]
+        """Send a request, encoding the `json` argument with the JSON codec of the SDK."""
+        payload = kwargs.pop("json", None)
+        if payload is not None and not args and kwargs.get("data") is None:
+            headers = CaseInsensitiveDict(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["data"] = self.encode_json_body(payload, headers)
+            kwargs["headers"] = headers
+        elif payload is not None:
+            kwargs["json"] = payload
+
+        response = super().request(method, url, *args, **kwargs)
+        response.json = functools.partial(_load_response_json, response)  # type: ignore[method-assign]
+        return response
+
+    def encode_json_body(self, payload: Any, headers: CaseInsensitiveDict) -> bytes:
+        """Encode the JSON body of a request.
+
+        Args:
+            payload: Object to send as JSON.
+            headers: Headers of the request, that can be updated to describe the body.
+        """
+        _ = headers
+        # same as requests, that encodes the body with allow_nan=False
+        return json_codec.dumps(
+            payload, separators=json_codec.COMPACT_SEPARATORS, allow_nan=False
+        ).encode("utf-8")
+
+
+def get_nb_bytes_sent(request: requests.PreparedRequest) -> int:
+    """Get the size of the body of a request."""
+    body = request.body
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+def get_nb_bytes_received(response: requests.Response) -> int:
+    """Get the number of bytes of a response body read from the wire, or its announced length.
+
+    The body of a streamed response is not read, its length is the one of its headers if any.
+    """
+    tell = getattr(response.raw, "tell", None)
+    if tell is not None:
+        try:
+            nb_bytes = tell()
+        except (OSError, ValueError):
+            nb_bytes = None
+        if isinstance(nb_bytes, int) and nb_bytes > 0:
+            return nb_bytes
+    content_length = response.headers.get("content-length")
+    if isinstance(content_length, str) and content_length.isdigit():
+        return int(content_length)
+    return 0
+
+
+def get_nb_retries(response: requests.Response) -> int:
+    """Get the number of retries of a request by urllib3."""
+    retries = getattr(response.raw, "retries", None)
+    return len(getattr(retries, "history", ()))
+
+
+# statuses of the responses to idempotent requests that are retried, if retries are enabled
+RETRY_STATUS_FORCELIST = (429, 502, 503, 504)
+
+
+def get_default_pool_maxsize() -> int:
+    """Get the number of connections kept alive per host, sized for the concurrency of the SDK.
+
+    The media are uploaded and downloaded by thread pools of the default size of
+    `ThreadPoolExecutor`, and the JSON documents of assets and labels by 10 threads.
+    """
+    return max(min(32, (os.cpu_count() or 1) + 4), 10)
 
 
 class HttpClient:
     """HTTP client.
 
     Will use the API key if the URL starts with the Kili endpoint.
+    The metrics of the requests are recorded per host in `metrics`.
     """
 
-    def __init__(self, kili_endpoint: str, api_key: str, verify: Union[bool, str]) -> None:
-        """Initialize the HTTP client."""
+    def __init__(
+        self,
+        kili_endpoint: str,
+        api_key: str,
+        verify: Union[bool, str],
+        json_blob_cache: Optional["JsonBlobCache"] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_connections: int = 10,
+        keep_alive: bool = True,
+        max_retries: int = 0,
+        http2: bool = False,
+    ) -> None:
+        """Initialize the HTTP client.
+
+        If a json_blob_cache is given, the JSON documents of assets and labels are downloaded
+        through it.
+
+        Args:
+            kili_endpoint: Kili API endpoint.
+            api_key: Kili API key.
+            verify: Whether to verify the TLS certificates, or path to a CA bundle.
+            json_blob_cache: Cache of the JSON documents of assets and labels.
+            pool_maxsize: Number of connections kept alive per host. If None, it is sized
+                for the number of threads the SDK sends requests from.
+            pool_connections: Number of hosts whose connections are kept alive.
+            keep_alive: Whether the connections are reused between requests.
+            max_retries: Number of retries of the requests that failed to connect and,
+                for idempotent requests, of the 429, 502, 503 and 504 responses.
+            http2: Whether the requests are sent over HTTP/2 to the servers supporting it,
+                with httpx. Install with `pip install kili[http2]`.
+        """
+        self.json_blob_cache = json_blob_cache
         self._kili_endpoint = kili_endpoint.replace("/api/label/v2/graphql", "/api/label/v2")
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else get_default_pool_maxsize()
+        self.metrics = MetricsRecorder(prefix="kili.http", key_tag="host")
 
-        self._http_client = requests.Session()
-        self._http_client_with_auth = requests.Session()
+        # the sessions share their connections
+        adapter = self._build_adapter(
+            verify, self.pool_maxsize, pool_connections, keep_alive, max_retries, http2
+        )
+        self._http_client = JsonCodecSession()
+        self._http_client_with_auth = JsonCodecSession()
 
-        self._http_client.verify = verify
-        self._http_client_with_auth.verify = verify
+        for session in (self._http_client, self._http_client_with_auth):
+            session.verify = verify
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not keep_alive and not http2:
+                session.headers["Connection"] = "close"
 
         self._auth_headers = {"Authorization": f"X-API-Key: {api_key}"}
         self._http_client_with_auth.headers.update(self._auth_headers)
 
+    @staticmethod
+    def _build_adapter(  # pylint: disable=too-many-arguments
+        verify: Union[bool, str],
+        pool_maxsize: int,
+        pool_connections: int,
+        keep_alive: bool,
+        max_retries: int,
+        http2: bool,
+    ) -> BaseAdapter:
+        """Build the transport adapter of the sessions."""
+        if http2:
+            # pylint: disable=import-outside-toplevel
+            from kili.adapters.http2_adapter import Http2Adapter
+
+            return Http2Adapter(
+                verify=verify,
+                max_keepalive_connections=pool_connections * pool_maxsize if keep_alive else 0,
+                max_retries=max_retries,
+            )
+
+        return HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_FORCELIST,
+                # the last response is returned, so that the callers handle it as before
+                raise_on_status=False,
+            )
+            if max_retries > 0
+            else 0,
+        )
+
     def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Send a request to the given URL."""
         if url.startswith(self._kili_endpoint):
@@ -34,7 +210,30 @@ class HttpClient:
         else:
             http_client = self._http_client
 
-        return http_client.request(method, url, **kwargs)
+        host = urlparse(url).netloc
+        start_time = time.perf_counter()
+        try:
+            response = http_client.request(method, url, **kwargs)
+        except requests.RequestException as err:
+            latency = time.perf_counter() - start_time
+            self.metrics.record_request(host, latency=latency, error=True)
+            tracer.record_span(
+                f"{method} {host}", "http", duration=latency, error=type(err).__name__
+            )
+            raise
+        latency = time.perf_counter() - start_time
+        self.metrics.record_request(
+            host,
+            latency=latency,
+            nb_bytes_sent=get_nb_bytes_sent(response.request),
+            nb_bytes_received=get_nb_bytes_received(response),
+            nb_retries=get_nb_retries(response),
+            error=not response.ok,
+        )
+        tracer.record_span(
+            f"{method} {host}", "http", duration=latency, status_code=response.status_code
+        )
+        return response
 
     def get(self, url: str, **kwargs) -> requests.Response:
         """Send a GET request to the given URL."""
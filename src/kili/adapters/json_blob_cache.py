@@ -0,0 +1,251 @@
+"""Persistent cache of the JSON documents downloaded from storage urls.
+
+The JSON documents of assets and labels (e.g. `jsonResponseUrl`, `jsonContent`, `ocrMetadata`)
+are stored in the bucket and downloaded with signed urls, that change on each query while the
+documents rarely do.
+"""
+
+import contextlib
+import hashlib
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from filelock import FileLock
+
+from kili.core.utils import json_codec
+from kili.log.logging import logger
+
+if TYPE_CHECKING:
+    from kili.adapters.http_client import HttpClient
+
+DEFAULT_JSON_BLOB_CACHE_DIR = Path.home() / ".cache" / "kili" / "json_blobs"
+DEFAULT_JSON_BLOB_CACHE_MAX_SIZE = 2 * 1024**3  # 2 GiB
+
+# query parameters of the signed urls of GCS, S3 and Azure, lowercased
+SIGNING_QUERY_PARAMETER_PREFIXES = ("x-goog-", "x-amz-")
+SIGNING_QUERY_PARAMETERS = {
+    # GCS and S3 V2 signatures
+    "googleaccessid",
+    "awsaccesskeyid",
+    "expires",
+    "signature",
+    # Azure shared access signatures
+    "sig",
+    "se",
+    "sp",
+    "sr",
+    "st",
+    "sv",
+    "ss",
+    "srt",
+    "spr",
+    "si",
+    "skoid",
+    "sktid",
+    "skt",
+    "ske",
+    "sks",
+    "skv",
+    "sdd",
+}
+
+
+class _CacheEntry(NamedTuple):
+    content_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class JsonBlobCache:
+    """On-disk cache of JSON documents, revalidated with their ETag or Last-Modified headers.
+
+    The entries are keyed by the url without its signing query parameters, since the signed
+    urls of a document only differ by their signature. The other query parameters are kept,
+    since they may identify the document (e.g. `files?id=...`). The contents are stored by their hash,
+    so that identical documents are stored once. The least recently used entries are evicted
+    when the size of the contents exceeds the maximum size.
+
+    The index is a SQLite database whose updates are serialized by a file lock,
+    so that the cache can be shared by several processes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_JSON_BLOB_CACHE_DIR,
+        max_size: int = DEFAULT_JSON_BLOB_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the cache.
+            max_size: Maximum size of the cached contents, in bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.cache_dir / "index.sqlite"
+        self._lock = FileLock(self.cache_dir / "index.lock", timeout=15)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, content_hash TEXT,"
+                " etag TEXT, last_modified TEXT, last_access REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS contents (hash TEXT PRIMARY KEY, size INTEGER)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connect to the index, holding the lock of the cache until the transaction ends."""
+        with self._lock, contextlib.closing(sqlite3.connect(self._index_path)) as connection:
+            with connection:
+                yield connection
+
+    @staticmethod
+    def _get_key(url: str) -> str:
+        parsed_url = urlparse(url)
+        query = urlencode(
+            sorted(
+                (name, value)
+                for name, value in parse_qsl(parsed_url.query, keep_blank_values=True)
+                if name.lower() not in SIGNING_QUERY_PARAMETERS
+                and not name.lower().startswith(SIGNING_QUERY_PARAMETER_PREFIXES)
+            )
+        )
+        key = f"{parsed_url.netloc}{parsed_url.path}"
+        return f"{key}?{query}" if query else key
+
+    def _get_content_path(self, content_hash: str) -> Path:
+        return self.cache_dir / content_hash[:2] / f"{content_hash}.json"
+
+    def _get_entry(self, key: str) -> Optional[_CacheEntry]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT content_hash, etag, last_modified FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return _CacheEntry(*row) if row is not None else None
+
+    def _read_content(self, key: str, entry: _CacheEntry) -> Optional[bytes]:
+        try:
+            content = self._get_content_path(entry.content_hash).read_bytes()
+        except OSError:
+            return None
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+        except (OSError, sqlite3.Error) as err:
+            logger.debug("Could not write the JSON blob cache: %s", err)
+        return content
+
+    def _store(
+        self, key: str, content: bytes, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        content_hash = hashlib.sha256(content).hexdigest()
+        content_path = self._get_content_path(content_hash)
+        if not content_path.is_file():
+            content_path.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file first, so that a content is never read partially written
+            tmp_path = content_path.with_name(f"{content_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, content_path)
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, content_hash, etag, last_modified, time.time()),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO contents VALUES (?, ?)", (content_hash, len(content))
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict the least recently used entries, and delete the contents no entry refers to."""
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM contents WHERE hash IN"
+            " (SELECT content_hash FROM entries)"
+        ).fetchone()
+        if total_size > self.max_size:
+            entries = connection.execute(
+                "SELECT key, size FROM entries JOIN contents ON content_hash = hash"
+                " ORDER BY last_access"
+            ).fetchall()
+            for key, size in entries:
+                if total_size <= self.max_size:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total_size -= size
+
+        unreferenced_hashes = connection.execute(
+            "SELECT hash FROM contents WHERE hash NOT IN (SELECT content_hash FROM entries)"
+        ).fetchall()
+        for (content_hash,) in unreferenced_hashes:
+            self._get_content_path(content_hash).unlink(missing_ok=True)
+            connection.execute("DELETE FROM contents WHERE hash = ?", (content_hash,))
+
+    def get_json(self, http_client: "HttpClient", url: str, timeout: float = 30) -> Any:
+        """Get the JSON document at the url, from the cache if it did not change.
+
+        Args:
+            http_client: HttpClient instance with SSL verification already configured.
+            url: URL of the JSON document.
+            timeout: Timeout of the request, in seconds.
+        """
+        key = self._get_key(url)
+        try:
+            entry = self._get_entry(key)
+        except (OSError, sqlite3.Error) as err:
+            logger.debug("Could not read the JSON blob cache: %s", err)
+            entry = None
+
+        headers = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = http_client.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            content = self._read_content(key, entry)
+            if content is not None:
+                return json_codec.loads(content)
+            # the content was evicted meanwhile
+            response = http_client.get(url, timeout=timeout)
+
+        response.raise_for_status()
+        document = response.json()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            try:
+                self._store(key, response.content, etag, last_modified)
+            except (OSError, sqlite3.Error) as err:
+                logger.debug("Could not write the JSON blob cache: %s", err)
+
+        return document
+
+
+def get_json_from_url(http_client: "HttpClient", url: str, timeout: float = 30) -> Any:
+    """Download the JSON document at the url, through the JSON blob cache of the client if any.
+
+    Args:
+        http_client: HttpClient instance with SSL verification already configured.
+        url: URL of the JSON document.
+        timeout: Timeout of the request, in seconds.
+    """
+    json_blob_cache = getattr(http_client, "json_blob_cache", None)
+    if isinstance(json_blob_cache, JsonBlobCache):
+        return json_blob_cache.get_json(http_client, url, timeout=timeout)
+
+    response = http_client.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
@@ -2,12 +2,20 @@
 
 import asyncio
 import json
+from collections.abc import Generator, Iterable
+from functools import partial
 
 import requests
 
+from kili.adapters.async_http_client import AsyncHttpClient
 from kili.adapters.http_client import HttpClient
-from kili.adapters.kili_api_gateway.helpers.http_json import load_json_from_link
+from kili.adapters.json_blob_cache import get_json_from_url
+from kili.adapters.kili_api_gateway.helpers.http_json import load_json_from_link_async
+from kili.adapters.kili_api_gateway.helpers.json_blobs import JsonBlob, resolve_json_blobs
 from kili.core.helpers import is_url
+from kili.core.utils import json_codec
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
+from kili.core.utils.lazy_json import loads_json_object
 from kili.domain.types import ListOrTuple
 
 # Batch size for parallel JSON response downloads (same as export service)
@@ -26,9 +34,7 @@ async def _download_json_response(url: str, http_client: HttpClient) -> dict:
     """
     try:
         # Run synchronous requests call in a thread
-        response = await asyncio.to_thread(http_client.get, url, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return await asyncio.to_thread(get_json_from_url, http_client, url, timeout=30)
     except (requests.RequestException, json.JSONDecodeError):
         # Return empty dict on error to ensure consistent response format
         return {}
@@ -77,59 +83,128 @@ def download_json_responses_parallel(
         # No running loop, safe to use asyncio.run() for parallel downloads
         asyncio.run(_download_json_responses_async(url_to_label_mapping, http_client))
     else:
-        # Already in a loop - fall back to sequential downloads to avoid RuntimeError
-        # This happens in Jupyter notebooks, FastAPI, and other async contexts
-        for url, label in url_to_label_mapping:
-            try:
-                response = http_client.get(url, timeout=30)
-                response.raise_for_status()
-                label["jsonResponse"] = response.json()
-            except (requests.RequestException, json.JSONDecodeError):
-                label["jsonResponse"] = {}
-
-            if "jsonResponseUrl" in label:
-                del label["jsonResponseUrl"]
+        # Already in a loop (Jupyter notebooks, FastAPI...): asyncio.run() cannot be nested,
+        # so the parallel downloads run in their own event loop in a worker thread
+        with ContextThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                asyncio.run, _download_json_responses_async(url_to_label_mapping, http_client)
+            ).result()
 
 
-def _parse_label_json_response(label: dict) -> None:
+def _parse_label_json_response(label: dict, lazy: bool = False) -> None:
     """Parse jsonResponse string to dict for a single label.
 
     Args:
         label: Label dict to update in place
+        lazy: Whether the jsonResponse is parsed on first access
     """
     json_response_value = label.get("jsonResponse", "{}")
-    try:
-        label["jsonResponse"] = json.loads(json_response_value)
-    except json.JSONDecodeError:
-        label["jsonResponse"] = {}
+    label["jsonResponse"] = loads_json_object(json_response_value, lazy=lazy, fallback={})
 
 
-def _process_label_json_response(label: dict, url_to_label_mapping: list[tuple[str, dict]]) -> None:
+def _process_label_json_response(
+    label: dict, url_to_label_mapping: list[tuple[str, dict]], lazy: bool = False
+) -> None:
     """Process a single label's jsonResponse, either scheduling URL download or parsing.
 
     Args:
         label: Label dict to process
         url_to_label_mapping: List to append URL mapping if download needed
+        lazy: Whether an inline jsonResponse is parsed on first access
     """
     json_response_url = label.get("jsonResponseUrl")
     if json_response_url and is_url(json_response_url):
         url_to_label_mapping.append((json_response_url, label))
     else:
-        _parse_label_json_response(label)
+        _parse_label_json_response(label, lazy=lazy)
 
 
 def load_asset_json_fields(asset: dict, fields: ListOrTuple[str], http_client: HttpClient) -> dict:
     """Load json fields of an asset."""
+    return next(load_assets_json_fields([asset], fields, http_client))
+
+
+def get_asset_json_blobs(
+    asset: dict, fields: ListOrTuple[str], lazy: bool = False
+) -> list[JsonBlob]:
+    """Parse the inline json fields of an asset, and get the json blobs to download.
+
+    If lazy is True, the inline json objects are parsed on first access.
+    """
+    if "jsonMetadata" in fields:
+        asset["jsonMetadata"] = loads_json_object(
+            asset.get("jsonMetadata", "{}"), lazy=lazy, fallback={}
+        )
+
+    json_blobs = []
+
+    ocr_metadata = asset.get("ocrMetadata")
+    if "ocrMetadata" in fields and ocr_metadata is not None:
+        if ocr_metadata != "" and is_url(ocr_metadata):
+            json_blobs.append(JsonBlob(asset, "ocrMetadata", ocr_metadata))
+        else:
+            asset["ocrMetadata"] = {}
+
+    url_to_label_mapping = []
+
+    if "labels.jsonResponse" in fields:
+        for label in asset.get("labels", []):
+            _process_label_json_response(label, url_to_label_mapping, lazy=lazy)
+
+    if "latestLabel.jsonResponse" in fields and asset.get("latestLabel") is not None:
+        _process_label_json_response(asset["latestLabel"], url_to_label_mapping, lazy=lazy)
+
+    if "latestLabels.jsonResponse" in fields:
+        for label in asset.get("latestLabels", []):
+            if label is not None:
+                _process_label_json_response(label, url_to_label_mapping, lazy=lazy)
+
+    # an empty dict is set if the download fails, to ensure a consistent response format
+    json_blobs.extend(
+        JsonBlob(label, "jsonResponse", url, url_field="jsonResponseUrl", fallback={})
+        for url, label in url_to_label_mapping
+    )
+    return json_blobs
+
+
+def load_assets_json_fields(
+    assets: Iterable[dict], fields: ListOrTuple[str], http_client: HttpClient, lazy: bool = False
+) -> Generator[dict, None, None]:
+    """Load json fields of assets, downloading the json blobs of all the assets concurrently.
+
+    If lazy is True, the inline json objects are parsed on first access.
+    """
+    yield from resolve_json_blobs(
+        assets, partial(get_asset_json_blobs, fields=fields, lazy=lazy), http_client
+    )
+
+
+async def _download_json_response_with_async_client(url: str, http_client: AsyncHttpClient) -> dict:
+    """Download and parse JSON response from a URL with an asynchronous HTTP client."""
+    import aiohttp  # pylint: disable=import-outside-toplevel
+
+    try:
+        return await load_json_from_link_async(url, http_client)
+    except (aiohttp.ClientError, json.JSONDecodeError, asyncio.TimeoutError):
+        # Return empty dict on error to ensure consistent response format
+        return {}
+
+
+async def load_asset_json_fields_async(
+    asset: dict, fields: ListOrTuple[str], http_client: AsyncHttpClient
+) -> dict:
+    """Load json fields of an asset, downloading the json responses concurrently."""
     if "jsonMetadata" in fields:
         try:
-            asset["jsonMetadata"] = json.loads(asset.get("jsonMetadata", "{}"))
+            asset["jsonMetadata"] = json_codec.loads(asset.get("jsonMetadata", "{}"))
         except json.JSONDecodeError:
             asset["jsonMetadata"] = {}
 
     if "ocrMetadata" in fields and asset.get("ocrMetadata") is not None:
-        asset["ocrMetadata"] = load_json_from_link(asset.get("ocrMetadata", ""), http_client)
+        asset["ocrMetadata"] = await load_json_from_link_async(
+            asset.get("ocrMetadata", ""), http_client
+        )
 
-    # Collect all URLs to download in parallel (similar to export service)
     url_to_label_mapping = []
 
     if "labels.jsonResponse" in fields:
@@ -144,7 +219,15 @@ def load_asset_json_fields(asset: dict, fields: ListOrTuple[str], http_client: H
             if label is not None:
                 _process_label_json_response(label, url_to_label_mapping)
 
-    if url_to_label_mapping:
-        download_json_responses_parallel(url_to_label_mapping, http_client)
+    # the http client bounds the number of concurrent downloads
+    json_responses = await asyncio.gather(
+        *(
+            _download_json_response_with_async_client(url, http_client)
+            for url, _ in url_to_label_mapping
+        )
+    )
+    for (_, label), json_response in zip(url_to_label_mapping, json_responses, strict=True):
+        label["jsonResponse"] = json_response
+        del label["jsonResponseUrl"]
 
     return asset
@@ -1,9 +1,11 @@
 """Mixin extending Kili API Gateway class with Asset related operations."""
 
+import dataclasses
 from collections.abc import Generator
+from typing import Optional
 
 from kili.adapters.kili_api_gateway.asset.formatters import (
-    load_asset_json_fields,
+    load_assets_json_fields,
 )
 from kili.adapters.kili_api_gateway.asset.mappers import asset_where_mapper
 from kili.adapters.kili_api_gateway.asset.operations import (
@@ -13,16 +15,44 @@ from kili.adapters.kili_api_gateway.asset.operations import (
     get_assets_query,
 )
 from kili.adapters.kili_api_gateway.base import BaseOperationMixin
+from kili.adapters.kili_api_gateway.helpers.page_size import AdaptivePageSize
 from kili.adapters.kili_api_gateway.helpers.queries import (
+    KeysetPagination,
     PaginatedGraphQLQuery,
     QueryOptions,
     fragment_builder,
 )
+from kili.adapters.kili_api_gateway.helpers.sharding import (
+    CreatedAtShard,
+    can_shard_query,
+    get_created_at_shards,
+    list_created_at_shards,
+)
 from kili.adapters.kili_api_gateway.project.common import get_project
 from kili.core.graphql.operations.asset.mutations import GQL_SET_ASSET_CONSENSUS
 from kili.domain.asset import AssetFilters
 from kili.domain.types import ListOrTuple
 
+# input types for which the label jsonResponse can be too large to be sent inline
+# and must be downloaded from the jsonResponseUrl
+INPUT_TYPES_WITH_JSON_RESPONSE_URL = {
+    "GEOSPATIAL",
+    "LLM_INSTR_FOLLOWING",
+    "LLM_RLHF",
+    "LLM_STATIC",
+    "VIDEO",
+}
+
+# assets are sorted by creation date
+ASSET_KEYSET_PAGINATION = KeysetPagination(sort_field="createdAt", where_lower_bound="createdAtGte")
+
+
+def get_asset_keyset_pagination(fields: ListOrTuple[str]) -> Optional[KeysetPagination]:
+    """Get the keyset pagination of assets, if the requested fields allow it."""
+    if "createdAt" in fields and "id" in fields:
+        return ASSET_KEYSET_PAGINATION
+    return None
+
 
 class AssetOperationMixin(BaseOperationMixin):
     """Mixin extending Kili API Gateway class with Assets related operations."""
@@ -34,18 +64,16 @@ class AssetOperationMixin(BaseOperationMixin):
         options: QueryOptions,
     ) -> Generator[dict, None, None]:
         """List assets with given options."""
+        if can_shard_query(options):
+            yield from self.list_assets_sharded(filters, fields, options)
+            return
+
         if "labels.jsonResponse" in fields or "latestLabel.jsonResponse" in fields:
             # Check if we can get the jsonResponse of if we need to rebuild it.
             project_info = get_project(
                 self.graphql_client, filters.project_id, ("inputType", "jsonInterface")
             )
-            if project_info["inputType"] in {
-                "VIDEO",
-                "LLM_RLHF",
-                "LLM_INSTR_FOLLOWING",
-                "LLM_STATIC",
-                "GEOSPATIAL",
-            }:
+            if project_info["inputType"] in INPUT_TYPES_WITH_JSON_RESPONSE_URL:
                 yield from self.list_assets_split(filters, fields, options, project_info)
                 return
 
@@ -59,9 +87,10 @@ class AssetOperationMixin(BaseOperationMixin):
             "Retrieving assets",
             GQL_COUNT_ASSETS,
             "id" if "id" in fields else None,
+            get_asset_keyset_pagination(fields),
         )
-        assets_gen = (
-            load_asset_json_fields(asset, fields, self.http_client) for asset in assets_gen
+        assets_gen = load_assets_json_fields(
+            assets_gen, fields, self.http_client, lazy=options.lazy_json_fields
         )
 
         yield from assets_gen
@@ -77,7 +106,13 @@ class AssetOperationMixin(BaseOperationMixin):
         assets_batch_max_amount = 10 if project_info["inputType"] == "VIDEO" else 50
         batch_size_to_use = min(options.batch_size, assets_batch_max_amount)
 
-        options = QueryOptions(options.disable_tqdm, options.first, options.skip, batch_size_to_use)
+        # the first pages are small, and grow up to the requested batch size
+        # if the responses allow it
+        options = options._replace(
+            batch_size=batch_size_to_use,
+            adaptive_page_size=options.adaptive_page_size
+            or AdaptivePageSize(max_page_size=options.batch_size),
+        )
 
         required_fields = {"content", "jsonContent", "resolution.width", "resolution.height"}
         if "labels.jsonResponse" in fields:
@@ -93,14 +128,52 @@ class AssetOperationMixin(BaseOperationMixin):
         query = get_assets_query(fragment)
         where = asset_where_mapper(filters)
         assets_gen = PaginatedGraphQLQuery(self.graphql_client).execute_query_from_paginated_call(
-            query, where, options, "Retrieving assets", GQL_COUNT_ASSETS
+            query,
+            where,
+            options,
+            "Retrieving assets",
+            GQL_COUNT_ASSETS,
+            keyset=get_asset_keyset_pagination(fields),
         )
-        assets_gen = (
-            load_asset_json_fields(asset, fields, self.http_client) for asset in assets_gen
+        assets_gen = load_assets_json_fields(
+            assets_gen, fields, self.http_client, lazy=options.lazy_json_fields
         )
 
         yield from assets_gen
 
+    def list_assets_sharded(
+        self,
+        filters: AssetFilters,
+        fields: ListOrTuple[str],
+        options: QueryOptions,
+    ) -> Generator[dict, None, None]:
+        """List assets with several queries on disjoint windows of creation dates."""
+        nb_assets = self.count_assets(filters)
+        if nb_assets == 0:
+            return
+
+        shards = get_created_at_shards(
+            self.graphql_client,
+            get_assets_query(fragment_builder(("createdAt",))),
+            asset_where_mapper(filters),
+            nb_assets,
+            options,
+            filters.created_at_gte,
+            filters.created_at_lte,
+        )
+        shard_fields = fields if "createdAt" in fields else [*fields, "createdAt"]
+        shard_options = options._replace(disable_tqdm=True, parallelism=1)
+
+        def list_shard(shard: CreatedAtShard) -> Generator[dict, None, None]:
+            shard_filters = dataclasses.replace(
+                filters, created_at_gte=shard.created_at_gte, created_at_lte=shard.created_at_lte
+            )
+            return self.list_assets(shard_filters, shard_fields, shard_options)
+
+        yield from list_created_at_shards(
+            list_shard, shards, fields, options, nb_assets, "Retrieving assets"
+        )
+
     def count_assets(self, filters: AssetFilters) -> int:
         """Send a GraphQL request calling countIssues resolver."""
         where = asset_where_mapper(filters)
@@ -0,0 +1,180 @@
+"""Asynchronous Kili API Gateway module for interacting with Kili."""
+
+from collections.abc import AsyncGenerator
+from typing import Optional
+
+from kili.adapters.async_http_client import AsyncHttpClient
+from kili.adapters.kili_api_gateway.asset.formatters import load_asset_json_fields_async
+from kili.adapters.kili_api_gateway.asset.mappers import asset_where_mapper
+from kili.adapters.kili_api_gateway.asset.operations import GQL_COUNT_ASSETS, get_assets_query
+from kili.adapters.kili_api_gateway.asset.operations_mixin import (
+    INPUT_TYPES_WITH_JSON_RESPONSE_URL,
+)
+from kili.adapters.kili_api_gateway.helpers.queries import (
+    AsyncPaginatedGraphQLQuery,
+    QueryOptions,
+    fragment_builder,
+)
+from kili.adapters.kili_api_gateway.label.formatters import load_label_json_fields_async
+from kili.adapters.kili_api_gateway.label.mappers import (
+    append_label_data_mapper,
+    label_where_mapper,
+)
+from kili.adapters.kili_api_gateway.label.operations import (
+    GQL_COUNT_LABELS,
+    GQL_DELETE_LABELS,
+    get_append_many_labels_mutation,
+    get_labels_query,
+)
+from kili.adapters.kili_api_gateway.label.types import AppendManyLabelsData
+from kili.adapters.kili_api_gateway.project.formatters import load_project_json_fields
+from kili.adapters.kili_api_gateway.project.operations import get_projects_query
+from kili.core.constants import MUTATION_BATCH_SIZE
+from kili.core.graphql.async_graphql_client import AsyncGraphQLClient
+from kili.core.utils.pagination import batcher
+from kili.domain.asset import AssetFilters
+from kili.domain.label import LabelFilters, LabelId
+from kili.domain.project import ProjectId
+from kili.domain.types import ListOrTuple
+from kili.exceptions import NotFound
+
+
+class AsyncKiliAPIGateway:
+    """Asynchronous GraphQL gateway to communicate with Kili backend.
+
+    It is the asynchronous twin of the assets and labels operations of KiliAPIGateway.
+    """
+
+    def __init__(self, graphql_client: AsyncGraphQLClient, http_client: AsyncHttpClient) -> None:
+        """Initialize the asynchronous Kili API Gateway."""
+        self.graphql_client = graphql_client
+        self.http_client = http_client
+
+    async def get_project(self, project_id: ProjectId, fields: ListOrTuple[str]) -> dict:
+        """Get project."""
+        fragment = fragment_builder(fields)
+        query = get_projects_query(fragment)
+        result = await self.graphql_client.execute(
+            query=query, variables={"where": {"id": project_id}, "first": 1, "skip": 0}
+        )
+        projects = result["data"]
+
+        if len(projects) == 0:
+            raise NotFound(
+                f"project ID: {project_id}. The project does not exist or you do not have access"
+                " to it."
+            )
+        return load_project_json_fields(projects[0], fields)
+
+    async def count_assets(self, filters: AssetFilters) -> int:
+        """Count assets."""
+        count_result = await self.graphql_client.execute(
+            GQL_COUNT_ASSETS, {"where": asset_where_mapper(filters)}
+        )
+        return count_result["data"]
+
+    async def list_assets(
+        self,
+        filters: AssetFilters,
+        fields: ListOrTuple[str],
+        options: QueryOptions,
+    ) -> AsyncGenerator[dict, None]:
+        """List assets with given options."""
+        unicity_field = "id" if "id" in fields else None
+        if "labels.jsonResponse" in fields or "latestLabel.jsonResponse" in fields:
+            project_info = await self.get_project(filters.project_id, ("inputType",))
+            if project_info["inputType"] in INPUT_TYPES_WITH_JSON_RESPONSE_URL:
+                assets_batch_max_amount = 10 if project_info["inputType"] == "VIDEO" else 50
+                options = options._replace(
+                    batch_size=min(options.batch_size, assets_batch_max_amount)
+                )
+                fields = list(fields)
+                if "labels.jsonResponse" in fields:
+                    fields.append("labels.jsonResponseUrl")
+                if "latestLabel.jsonResponse" in fields:
+                    fields.append("latestLabel.jsonResponseUrl")
+                unicity_field = None
+
+        query = get_assets_query(fragment_builder(fields))
+        assets_gen = AsyncPaginatedGraphQLQuery(
+            self.graphql_client
+        ).execute_query_from_paginated_call(
+            query, asset_where_mapper(filters), options, GQL_COUNT_ASSETS, unicity_field
+        )
+        async for asset in assets_gen:
+            yield await load_asset_json_fields_async(asset, fields, self.http_client)
+
+    async def count_labels(self, filters: LabelFilters) -> int:
+        """Count labels."""
+        result = await self.graphql_client.execute(
+            GQL_COUNT_LABELS, {"where": label_where_mapper(filters)}
+        )
+        return result["data"]
+
+    async def list_labels(
+        self,
+        filters: LabelFilters,
+        fields: ListOrTuple[str],
+        options: QueryOptions,
+    ) -> AsyncGenerator[dict, None]:
+        """List labels."""
+        if "jsonResponse" in fields:
+            project_info = await self.get_project(filters.project_id, ("inputType",))
+            if project_info["inputType"] in INPUT_TYPES_WITH_JSON_RESPONSE_URL:
+                if project_info["inputType"] == "VIDEO":
+                    options = options._replace(batch_size=min(options.batch_size, 20))
+                fields = list(fields)
+                if "jsonResponseUrl" not in fields:
+                    fields.append("jsonResponseUrl")
+
+        query = get_labels_query(fragment_builder(fields))
+        labels_gen = AsyncPaginatedGraphQLQuery(
+            self.graphql_client
+        ).execute_query_from_paginated_call(
+            query, label_where_mapper(filters), options, GQL_COUNT_LABELS
+        )
+        async for label in labels_gen:
+            yield await load_label_json_fields_async(label, fields, self.http_client)
+
+    async def append_many_labels(
+        self,
+        data: AppendManyLabelsData,
+        fields: ListOrTuple[str],
+        project_id: Optional[ProjectId],
+    ) -> list[dict]:
+        """Append many labels."""
+        query = get_append_many_labels_mutation(fragment=fragment_builder(fields))
+
+        added_labels: list[dict] = []
+        for batch_of_label_data in batcher(data.labels_data, batch_size=MUTATION_BATCH_SIZE):
+            variables = {
+                "data": {
+                    "labelType": data.label_type,
+                    "stepName": data.step_name,
+                    "overwrite": data.overwrite,
+                    "labelsData": [
+                        append_label_data_mapper(label) for label in batch_of_label_data
+                    ],
+                },
+                "where": {
+                    "idIn": [label.asset_id for label in batch_of_label_data],
+                },
+            }
+            if project_id is not None:
+                variables["where"]["project"] = {"id": project_id}
+
+            # we increase the timeout because the import can take a long time
+            batch_result = await self.graphql_client.execute(query, variables, timeout=120)
+            added_labels.extend(batch_result["data"])
+
+        return added_labels
+
+    async def delete_labels(self, ids: ListOrTuple[LabelId]) -> list[LabelId]:
+        """Delete labels."""
+        deleted_label_ids: list[LabelId] = []
+        for batch_of_label_ids in batcher(ids, batch_size=MUTATION_BATCH_SIZE):
+            result = await self.graphql_client.execute(
+                GQL_DELETE_LABELS, {"ids": batch_of_label_ids}
+            )
+            deleted_label_ids.extend(result["data"])
+        return deleted_label_ids
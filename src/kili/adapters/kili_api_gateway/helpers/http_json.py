@@ -1,7 +1,10 @@
 """HTTP JSON helpers for downloading JSON data from URLs."""
 
+from kili.adapters.async_http_client import AsyncHttpClient
 from kili.adapters.http_client import HttpClient
+from kili.adapters.json_blob_cache import get_json_from_url
 from kili.core.helpers import is_url
+from kili.core.utils import json_codec
 
 
 def load_json_from_link(link: str, http_client: HttpClient) -> dict:
@@ -17,6 +20,22 @@ def load_json_from_link(link: str, http_client: HttpClient) -> dict:
     if link == "" or not is_url(link):
         return {}
 
-    response = http_client.get(link, timeout=30)
+    return get_json_from_url(http_client, link, timeout=30)
+
+
+async def load_json_from_link_async(link: str, http_client: AsyncHttpClient) -> dict:
+    """Load json from link with an asynchronous HTTP client.
+
+    Args:
+        link: URL to download JSON from
+        http_client: AsyncHttpClient instance with SSL verification already configured
+
+    Returns:
+        Parsed JSON response as a dictionary, or empty dict if link is invalid
+    """
+    if link == "" or not is_url(link):
+        return {}
+
+    response = await http_client.get(link, timeout=30)
     response.raise_for_status()
-    return response.json()
+    return await response.json(content_type=None, loads=json_codec.loads)
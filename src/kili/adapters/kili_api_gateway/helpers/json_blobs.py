@@ -0,0 +1,93 @@
+"""Resolution of the JSON blobs of listed elements (e.g. `jsonResponseUrl`, `ocrMetadata`)."""
+
+import json
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future
+from typing import NamedTuple, Optional
+
+import requests
+
+from kili.adapters.http_client import HttpClient
+from kili.adapters.json_blob_cache import get_json_from_url
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
+
+# the downloads share the connections of the http client session, kept alive between downloads
+# its connection pool holds 10 connections per host
+MAX_CONCURRENT_JSON_BLOB_DOWNLOADS = 10
+
+# maximum number of elements waiting for their blobs, to bound the memory
+MAX_PENDING_ELEMENTS = 100
+
+
+class JsonBlob(NamedTuple):
+    """JSON blob to download and to set in a field of an element."""
+
+    container: dict
+    field: str
+    url: str
+    # field holding the url in the container, removed once the blob is downloaded
+    url_field: Optional[str] = None
+    # value to set if the download fails. If None, the error is raised
+    fallback: Optional[dict] = None
+
+
+def _download_json_blob(blob: JsonBlob, http_client: HttpClient) -> dict:
+    try:
+        return get_json_from_url(http_client, blob.url, timeout=30)
+    except (requests.RequestException, json.JSONDecodeError):
+        if blob.fallback is None:
+            raise
+        return blob.fallback
+
+
+def _set_json_blobs(blobs_and_futures: list[tuple[JsonBlob, "Future[dict]"]]) -> None:
+    for blob, future in blobs_and_futures:
+        blob.container[blob.field] = future.result()
+        if blob.url_field is not None:
+            blob.container.pop(blob.url_field, None)
+
+
+def resolve_json_blobs(
+    elements: Iterable[dict],
+    get_json_blobs: Callable[[dict], list[JsonBlob]],
+    http_client: HttpClient,
+) -> Generator[dict, None, None]:
+    """Download the JSON blobs of elements, and fill them in the elements.
+
+    The blobs of all the elements, across pages, are downloaded by a single pool of threads,
+    while the next elements are being fetched. The elements are yielded in order,
+    as soon as their blobs are downloaded.
+
+    Args:
+        elements: Elements to resolve.
+        get_json_blobs: Function returning the blobs to download for an element.
+        http_client: HttpClient instance with SSL verification already configured.
+    """
+    pending: deque[tuple[dict, list[tuple[JsonBlob, Future[dict]]]]] = deque()
+    executor = ContextThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_JSON_BLOB_DOWNLOADS, thread_name_prefix="kili-json-blobs"
+    )
+    try:
+        for element in elements:
+            blobs_and_futures = [
+                (blob, executor.submit(_download_json_blob, blob, http_client))
+                for blob in get_json_blobs(element)
+            ]
+            pending.append((element, blobs_and_futures))
+
+            while pending and (
+                len(pending) > MAX_PENDING_ELEMENTS
+                or all(future.done() for _, future in pending[0][1])
+            ):
+                element, blobs_and_futures = pending.popleft()
+                _set_json_blobs(blobs_and_futures)
+                yield element
+
+        while pending:
+            element, blobs_and_futures = pending.popleft()
+            _set_json_blobs(blobs_and_futures)
+            yield element
+    finally:
+        # the downloads of the elements not consumed are not needed anymore
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,115 @@
+"""Adaptive size of the pages of paginated queries."""
+
+from collections.abc import Callable
+from typing import NamedTuple, Optional
+
+from kili.log.logging import logger
+
+
+class PageSizeDecision(NamedTuple):
+    """Decision of the page size controller, taken after one page was received."""
+
+    # number of elements requested and received for the page
+    page_size: int
+    nb_elements: int
+    # measures of the response
+    nb_bytes: Optional[int]
+    latency: float
+    complexity: int
+    # measure that is the furthest from its target: "latency", "bytes" or "complexity"
+    limiting_factor: str
+    next_page_size: int
+
+
+class AdaptivePageSize(NamedTuple):
+    """Settings of the adaptive page size of a paginated query.
+
+    After each page, the size of the next page is scaled so that the latency,
+    the size in bytes and the complexity of the responses get close to their targets.
+    """
+
+    min_page_size: int = 1
+    max_page_size: int = 100
+    # targets of a response
+    target_latency: float = 2.0
+    target_bytes: int = 5 * 1024 * 1024
+    target_complexity: Optional[int] = None
+    # maximum factor by which the page size changes from one page to the next
+    max_scaling: float = 2.0
+    # the page size only grows if the measures are at least this factor below their targets,
+    # to avoid oscillations around the targets
+    growth_threshold: float = 1.25
+    # called with each decision of the controller, e.g. to tune the settings
+    on_decision: Optional[Callable[[PageSizeDecision], None]] = None
+
+
+class PageSizeController:
+    """Controller of the size of the pages of one paginated query."""
+
+    def __init__(self, settings: AdaptivePageSize, initial_page_size: int) -> None:
+        """Initialize the controller."""
+        if not 0 < settings.min_page_size <= settings.max_page_size:
+            raise ValueError(
+                "The page size bounds must verify 0 < min_page_size <= max_page_size, got"
+                f" {settings.min_page_size} and {settings.max_page_size}"
+            )
+        self.settings = settings
+        self.page_size = self._clamp(initial_page_size)
+        self.decisions: list[PageSizeDecision] = []
+
+    def _clamp(self, page_size: int) -> int:
+        return min(max(page_size, self.settings.min_page_size), self.settings.max_page_size)
+
+    # pylint: disable=too-many-arguments
+    def observe(
+        self,
+        page_size: int,
+        nb_elements: int,
+        nb_bytes: Optional[int],
+        latency: float,
+        complexity: int,
+    ) -> Optional[PageSizeDecision]:
+        """Update the page size from the measures of a response.
+
+        Args:
+            page_size: The number of elements requested
+            nb_elements: The number of elements received
+            nb_bytes: The size of the response in bytes, if known
+            latency: The duration of the request in seconds
+            complexity: The complexity of the operation returned by the backend
+        """
+        if nb_elements == 0:
+            return None
+
+        ratios = {"latency": self.settings.target_latency / max(latency, 1e-3)}
+        if nb_bytes:
+            ratios["bytes"] = self.settings.target_bytes / nb_bytes
+        if self.settings.target_complexity and complexity:
+            ratios["complexity"] = self.settings.target_complexity / complexity
+        limiting_factor = min(ratios, key=lambda factor: ratios[factor])
+        ratio = ratios[limiting_factor]
+
+        if 1 <= ratio < self.settings.growth_threshold:
+            next_page_size = self.page_size
+        else:
+            ratio = min(max(ratio, 1 / self.settings.max_scaling), self.settings.max_scaling)
+            # the measures are proportional to the number of elements actually received
+            next_page_size = self._clamp(int(nb_elements * ratio))
+            if ratio > 1:
+                next_page_size = max(next_page_size, self.page_size)
+
+        decision = PageSizeDecision(
+            page_size=page_size,
+            nb_elements=nb_elements,
+            nb_bytes=nb_bytes,
+            latency=latency,
+            complexity=complexity,
+            limiting_factor=limiting_factor,
+            next_page_size=next_page_size,
+        )
+        self.decisions.append(decision)
+        self.page_size = next_page_size
+        logger.debug("Page size decision: %s", decision)
+        if self.settings.on_decision is not None:
+            self.settings.on_decision(decision)
+        return decision
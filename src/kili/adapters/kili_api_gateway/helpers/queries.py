@@ -1,13 +1,21 @@
 """GraphQL module."""
 
-from collections.abc import Generator
+import json
+import time
+from collections.abc import AsyncGenerator, Generator
 from typing import Any, NamedTuple, Optional
 
 from pyparsing import Union
 from typeguard import typechecked
 
+from kili.adapters.kili_api_gateway.helpers.page_size import (
+    AdaptivePageSize,
+    PageSizeController,
+)
 from kili.core.constants import QUERY_BATCH_SIZE
+from kili.core.graphql.async_graphql_client import AsyncGraphQLClient
 from kili.core.graphql.graphql_client import GraphQLClient
+from kili.core.utils.pagination import prefetch_iterator
 from kili.domain.types import ListOrTuple
 from kili.utils.tqdm import tqdm
 
@@ -19,6 +27,32 @@ class QueryOptions(NamedTuple):
     first: Optional[int] = None
     skip: int = 0
     batch_size: int = QUERY_BATCH_SIZE
+    # number of pages fetched ahead by a background thread while the current page is consumed
+    prefetch_pages: int = 0
+    # number of shards listed concurrently, by the resources that can be split in shards
+    # the GraphQL client must allow as many concurrent requests, else they are serialized
+    parallelism: int = 1
+    # whether the elements of the shards are returned in the order of a single listing
+    ordered: bool = True
+    # if given, the size of the pages adapts to the responses, starting from batch_size
+    adaptive_page_size: Optional[AdaptivePageSize] = None
+    # whether the inline json objects (e.g. jsonMetadata, jsonResponse) are parsed on first access
+    lazy_json_fields: bool = False
+
+
+class KeysetPagination(NamedTuple):
+    """Keyset pagination of a resource sorted by an ascending, non-unique field.
+
+    Instead of skipping all the elements already retrieved, the next page is queried with a
+    lower bound on the sort field, and only the elements sharing the bound value are skipped.
+    The cost of a page does not grow with its offset, and elements cannot shift between pages.
+    """
+
+    # field on which the elements are sorted, e.g. "createdAt"
+    sort_field: str
+    # where argument setting an inclusive lower bound on the sort field, e.g. "createdAtGte"
+    where_lower_bound: str
+    unique_field: str = "id"
 
 
 class PaginatedGraphQLQuery:
@@ -40,6 +74,7 @@ class PaginatedGraphQLQuery:
         tqdm_desc: str,
         count_query: Optional[str],
         unicity_field: Optional[str] = None,
+        keyset: Optional[KeysetPagination] = None,
     ) -> Generator[dict, None, None]:
         """Build a row generator from paginated query calls with the first and skip pattern.
 
@@ -53,6 +88,9 @@ class PaginatedGraphQLQuery:
                 If given, it will show a progress bar if tqdm is not disabled in options
             unicity_field: Field that must be unique, most likely an id, to prevent
             duplicates because of values being updated during the pagination process.
+            keyset: Keyset pagination of the resource, if it can be sorted.
+                It is used instead of skip/first pagination when no elements are skipped
+                in the options, and makes the unicity check unnecessary.
         """
         nb_elements_to_query = (
             self.get_number_of_elements_to_query(count_query, where, options)
@@ -60,65 +98,187 @@ class PaginatedGraphQLQuery:
             else None
         )
         disable_tqdm = nb_elements_to_query is None or options.disable_tqdm
-        unicity_values = {}
 
         if nb_elements_to_query == 0:
-            yield from ()
+            return
+
+        page_size_controller = (
+            PageSizeController(options.adaptive_page_size, options.batch_size)
+            if options.adaptive_page_size is not None
+            else None
+        )
+        if keyset is not None and options.skip == 0:
+            pages = self._iter_keyset_pages(
+                query, where, options, nb_elements_to_query, keyset, page_size_controller
+            )
         else:
+            pages = self._iter_offset_pages(
+                query, where, options, nb_elements_to_query, unicity_field, page_size_controller
+            )
+        if options.prefetch_pages > 0:
+            pages = prefetch_iterator(pages, options.prefetch_pages)
+
+        try:
             with tqdm(total=nb_elements_to_query, disable=disable_tqdm, desc=tqdm_desc) as pbar:
-                count_elements_retrieved = 0
-                while True:
-                    if (
-                        nb_elements_to_query is not None
-                        # If we need an unicity check, it means that new values can be inserted
-                        # during the pagination process, so that the initial number of element to
-                        # query, ie nb_elements_to_query, cannot be trusted.
-                        and unicity_field is None
-                        and count_elements_retrieved >= nb_elements_to_query
-                    ):
-                        break
-
-                    skip = count_elements_retrieved + options.skip
-                    first = (
-                        min(options.batch_size, nb_elements_to_query - count_elements_retrieved)
-                        if nb_elements_to_query is not None and unicity_field is None
-                        else options.batch_size
-                    )
-                    payload = {"where": where, "skip": skip, "first": first}
-                    elements = self._graphql_client.execute(query, payload)["data"]
-                    if not isinstance(elements, list):
-                        raise TypeError(
-                            "PaginatedGraphQLQuery only support operations returning a list of"
-                            " objects"
-                        )
-
-                    if len(elements) == 0:
-                        break
-
-                    if unicity_field is None:
-                        yield from elements
-                        pbar.update(len(elements))
-                    else:
-                        check_unicity_field_presence(unicity_field, elements[0])
-
-                        for element in elements:
-                            unicity_value = element[unicity_field]
-
-                            if unicity_value not in unicity_values:
-                                yield element
-                                unicity_values[unicity_value] = True
-                                pbar.update(1)
-
-                                if (
-                                    options.first is not None
-                                    and len(unicity_values) >= options.first
-                                ):
-                                    break
-
-                    count_elements_retrieved += len(elements)
-
-                    if len(elements) < first:
-                        break
+                for page in pages:
+                    yield from page
+                    pbar.update(len(page))
+        finally:
+            # stops the background prefetching if the consumer stops early
+            pages.close()
+
+    def _execute_page_query(
+        self,
+        query: str,
+        payload: dict[str, Any],
+        page_size_controller: Optional[PageSizeController],
+    ) -> list[dict]:
+        """Execute the query of one page, and report its measures to the page size controller."""
+        start_time = time.perf_counter()
+        elements = self._graphql_client.execute(query, payload)["data"]
+        latency = time.perf_counter() - start_time
+        if not isinstance(elements, list):
+            raise TypeError(
+                "PaginatedGraphQLQuery only support operations returning a list of objects"
+            )
+
+        if page_size_controller is not None:
+            response_info = self._graphql_client.last_response_info
+            nb_bytes = response_info.nb_bytes if response_info is not None else None
+            if nb_bytes is None:
+                # the backend did not send the length of the response, we estimate it
+                nb_bytes = len(json.dumps(elements, default=str))
+            if response_info is not None and response_info.latency is not None:
+                # the waits for the rate limiter and the locks do not depend on the page size
+                latency = response_info.latency
+            page_size_controller.observe(
+                page_size=payload["first"],
+                nb_elements=len(elements),
+                nb_bytes=nb_bytes,
+                latency=latency,
+                complexity=response_info.complexity if response_info is not None else 0,
+            )
+        return elements
+
+    # pylint: disable=too-many-arguments
+    def _iter_offset_pages(
+        self,
+        query: str,
+        where: dict[str, Any],
+        options: QueryOptions,
+        nb_elements_to_query: Optional[int],
+        unicity_field: Optional[str],
+        page_size_controller: Optional[PageSizeController],
+    ) -> Generator[list[dict], None, None]:
+        """Generate the pages of elements with the first and skip pattern."""
+        unicity_values = {}
+        count_elements_retrieved = 0
+        while True:
+            if (
+                nb_elements_to_query is not None
+                # If we need an unicity check, it means that new values can be inserted
+                # during the pagination process, so that the initial number of element to
+                # query, ie nb_elements_to_query, cannot be trusted.
+                and unicity_field is None
+                and count_elements_retrieved >= nb_elements_to_query
+            ):
+                break
+
+            skip = count_elements_retrieved + options.skip
+            batch_size = (
+                page_size_controller.page_size if page_size_controller else options.batch_size
+            )
+            first = (
+                min(batch_size, nb_elements_to_query - count_elements_retrieved)
+                if nb_elements_to_query is not None and unicity_field is None
+                else batch_size
+            )
+            payload = {"where": where, "skip": skip, "first": first}
+            elements = self._execute_page_query(query, payload, page_size_controller)
+
+            if len(elements) == 0:
+                break
+
+            if unicity_field is None:
+                yield elements
+            else:
+                check_unicity_field_presence(unicity_field, elements[0])
+
+                page = []
+                for element in elements:
+                    unicity_value = element[unicity_field]
+                    if unicity_value not in unicity_values:
+                        page.append(element)
+                        unicity_values[unicity_value] = True
+
+                        if options.first is not None and len(unicity_values) >= options.first:
+                            break
+                yield page
+
+                if options.first is not None and len(unicity_values) >= options.first:
+                    break
+
+            count_elements_retrieved += len(elements)
+
+            if len(elements) < first:
+                break
+
+    # pylint: disable=too-many-arguments
+    def _iter_keyset_pages(
+        self,
+        query: str,
+        where: dict[str, Any],
+        options: QueryOptions,
+        nb_elements_to_query: Optional[int],
+        keyset: KeysetPagination,
+        page_size_controller: Optional[PageSizeController],
+    ) -> Generator[list[dict], None, None]:
+        """Generate the pages of elements with the keyset pattern."""
+        count_elements_retrieved = 0
+        # lower bound of the next page, and elements already retrieved with this sort value
+        bound_value = None
+        bound_unique_values = set()
+        while nb_elements_to_query is None or count_elements_retrieved < nb_elements_to_query:
+            batch_size = (
+                page_size_controller.page_size if page_size_controller else options.batch_size
+            )
+            first = (
+                min(batch_size, nb_elements_to_query - count_elements_retrieved)
+                if nb_elements_to_query is not None
+                else batch_size
+            )
+            payload = (
+                {"where": where, "skip": 0, "first": first}
+                if bound_value is None
+                else {
+                    "where": {**where, keyset.where_lower_bound: bound_value},
+                    "skip": len(bound_unique_values),
+                    "first": first,
+                }
+            )
+            elements = self._execute_page_query(query, payload, page_size_controller)
+
+            if len(elements) == 0:
+                break
+
+            check_unicity_field_presence(keyset.sort_field, elements[0])
+            check_unicity_field_presence(keyset.unique_field, elements[0])
+
+            page = []
+            for element in elements:
+                sort_value, unique_value = element[keyset.sort_field], element[keyset.unique_field]
+                if sort_value == bound_value:
+                    if unique_value in bound_unique_values:
+                        continue
+                    bound_unique_values.add(unique_value)
+                else:
+                    bound_value, bound_unique_values = sort_value, {unique_value}
+                page.append(element)
+            yield page
+            count_elements_retrieved += len(page)
+
+            if len(elements) < first:
+                break
 
     def get_number_of_elements_to_query(
         self,
@@ -150,6 +310,116 @@ class PaginatedGraphQLQuery:
         return min(nb_elements_queried, first)
 
 
+class AsyncPaginatedGraphQLQuery:
+    """Asynchronous twin of PaginatedGraphQLQuery.
+
+    It factorizes code for executing paginated queries with an AsyncGraphQLClient.
+    """
+
+    def __init__(self, graphql_client: AsyncGraphQLClient) -> None:
+        """Initialize the paginator."""
+        self._graphql_client = graphql_client
+
+    # pylint: disable=too-many-arguments
+    async def execute_query_from_paginated_call(
+        self,
+        query: str,
+        where: dict[str, Any],
+        options: QueryOptions,
+        count_query: Optional[str],
+        unicity_field: Optional[str] = None,
+    ) -> AsyncGenerator[dict, None]:
+        """Build an async row generator from paginated query calls with the first and skip pattern.
+
+        Args:
+            query: The object query to execute and to send to graphQL, in string format
+            where: The where payload to send in the graphQL query
+            options: The query options with skip and first
+            count_query: The query to count the number of objects to be retrieved.
+                It should have the same where input as the query.
+            unicity_field: Field that must be unique, most likely an id, to prevent
+            duplicates because of values being updated during the pagination process.
+        """
+        nb_elements_to_query = (
+            await self.get_number_of_elements_to_query(count_query, where, options)
+            if count_query is not None
+            else None
+        )
+        unicity_values = {}
+
+        if nb_elements_to_query == 0:
+            return
+
+        count_elements_retrieved = 0
+        while True:
+            if (
+                nb_elements_to_query is not None
+                and unicity_field is None
+                and count_elements_retrieved >= nb_elements_to_query
+            ):
+                break
+
+            skip = count_elements_retrieved + options.skip
+            first = (
+                min(options.batch_size, nb_elements_to_query - count_elements_retrieved)
+                if nb_elements_to_query is not None and unicity_field is None
+                else options.batch_size
+            )
+            payload = {"where": where, "skip": skip, "first": first}
+            elements = (await self._graphql_client.execute(query, payload))["data"]
+            if not isinstance(elements, list):
+                raise TypeError(
+                    "AsyncPaginatedGraphQLQuery only support operations returning a list of"
+                    " objects"
+                )
+
+            if len(elements) == 0:
+                break
+
+            if unicity_field is None:
+                for element in elements:
+                    yield element
+            else:
+                check_unicity_field_presence(unicity_field, elements[0])
+
+                for element in elements:
+                    unicity_value = element[unicity_field]
+
+                    if unicity_value not in unicity_values:
+                        yield element
+                        unicity_values[unicity_value] = True
+
+                        if options.first is not None and len(unicity_values) >= options.first:
+                            return
+
+            count_elements_retrieved += len(elements)
+
+            if len(elements) < first:
+                break
+
+    async def get_number_of_elements_to_query(
+        self,
+        count_query: str,
+        where: dict[str, Any],
+        options: QueryOptions,
+    ) -> int:
+        """Give the total number of elements to query for one query that will be paginated.
+
+        Args:
+            count_query: the query to count the number of objects to be retrieved
+            where: the where payload to the count query,
+            options: the query options with skip and first
+
+        Returns:
+            The number of elements to query
+        """
+        count_result = await self._graphql_client.execute(count_query, {"where": where})
+        nb_elements_queried = max(count_result["data"] - options.skip, 0)
+        if options.first is None:
+            return nb_elements_queried
+        return min(nb_elements_queried, options.first)
+
+
 def check_unicity_field_presence(field: str, object: dict):
     """Check the presence of unicity field in queried elements."""
     if field not in object:
@@ -0,0 +1,119 @@
+"""Helpers to list elements with several paginated queries running concurrently."""
+
+import math
+import warnings
+from collections.abc import Callable, Generator, Iterator
+from typing import Any, NamedTuple, Optional
+
+from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
+from kili.core.graphql.graphql_client import GraphQLClient
+from kili.core.utils.pagination import merge_iterators_concurrently
+from kili.domain.types import ListOrTuple
+from kili.utils.tqdm import tqdm
+
+
+class CreatedAtShard(NamedTuple):
+    """Window of creation dates of the elements listed by one shard.
+
+    The bounds are inclusive, None meaning that the window is not bounded.
+    """
+
+    created_at_gte: Optional[str]
+    created_at_lte: Optional[str]
+    # the elements created at the lower bound are listed by the previous shard
+    exclude_lower_bound: bool = False
+
+
+def can_shard_query(options: QueryOptions) -> bool:
+    """Tell if the elements queried with these options can be listed by shards."""
+    return options.parallelism > 1 and options.skip == 0 and options.first is None
+
+
+# pylint: disable=too-many-arguments
+def get_created_at_shards(
+    graphql_client: GraphQLClient,
+    query: str,
+    where: dict[str, Any],
+    nb_elements: int,
+    options: QueryOptions,
+    created_at_gte: Optional[str],
+    created_at_lte: Optional[str],
+) -> list[CreatedAtShard]:
+    """Split the elements, sorted by creation date, in windows of about the same size.
+
+    Args:
+        graphql_client: The GraphQL client
+        query: The query of the elements, requesting at least their createdAt field
+        where: The where payload of the query
+        nb_elements: The number of elements matching the where payload
+        options: The query options, giving the number of shards and the size of a page
+        created_at_gte: The lower bound of the creation dates of the elements, if any
+        created_at_lte: The upper bound of the creation dates of the elements, if any
+    """
+    if graphql_client.max_concurrent_requests == 1:
+        warnings.warn(
+            "The shards are listed one request at a time, since the GraphQL client serializes"
+            " its requests. Create the client with max_concurrent_requests > 1 to list them"
+            " concurrently.",
+            stacklevel=2,
+        )
+    nb_shards = min(options.parallelism, math.ceil(nb_elements / options.batch_size))
+
+    bounds: list[str] = []
+    for shard_index in range(1, nb_shards):
+        payload = {"where": where, "skip": shard_index * nb_elements // nb_shards, "first": 1}
+        elements = graphql_client.execute(query, payload)["data"]
+        if len(elements) > 0 and (len(bounds) == 0 or elements[0]["createdAt"] != bounds[-1]):
+            bounds.append(elements[0]["createdAt"])
+
+    lower_bounds = [created_at_gte, *bounds]
+    upper_bounds = [*bounds, created_at_lte]
+    return [
+        CreatedAtShard(lower_bound, upper_bound, exclude_lower_bound=shard_index > 0)
+        for shard_index, (lower_bound, upper_bound) in enumerate(
+            zip(lower_bounds, upper_bounds, strict=True)
+        )
+    ]
+
+
+# pylint: disable=too-many-arguments
+def list_created_at_shards(
+    list_shard: Callable[[CreatedAtShard], Iterator[dict]],
+    shards: list[CreatedAtShard],
+    fields: ListOrTuple[str],
+    options: QueryOptions,
+    nb_elements: int,
+    tqdm_desc: str,
+) -> Generator[dict, None, None]:
+    """List the elements of all the shards concurrently.
+
+    Args:
+        list_shard: Function listing the elements of one shard, with their createdAt field
+        shards: The shards to list
+        fields: The fields requested by the caller
+        options: The query options, telling if the elements must be returned in order
+        nb_elements: The number of elements to list, for the progress bar
+        tqdm_desc: The description to show in the progress bar
+    """
+
+    def iter_shard(shard: CreatedAtShard) -> Generator[dict, None, None]:
+        for element in list_shard(shard):
+            if shard.exclude_lower_bound and element["createdAt"] == shard.created_at_gte:
+                continue
+            if "createdAt" not in fields:
+                del element["createdAt"]
+            yield element
+
+    # in ordered mode, the next shards fetch a page ahead, then wait for their turn
+    elements = merge_iterators_concurrently(
+        [iter_shard(shard) for shard in shards],
+        ordered=options.ordered,
+        max_prefetched=options.batch_size,
+    )
+    try:
+        with tqdm(total=nb_elements, disable=options.disable_tqdm, desc=tqdm_desc) as pbar:
+            for element in elements:
+                yield element
+                pbar.update(1)
+    finally:
+        elements.close()
@@ -1,24 +1,63 @@
 """Formatters for labels retrieved from Kili API."""
 
 import json
+from collections.abc import Generator, Iterable
+from functools import partial
 
+from kili.adapters.async_http_client import AsyncHttpClient
 from kili.adapters.http_client import HttpClient
-from kili.adapters.kili_api_gateway.helpers.http_json import load_json_from_link
+from kili.adapters.kili_api_gateway.helpers.http_json import load_json_from_link_async
+from kili.adapters.kili_api_gateway.helpers.json_blobs import JsonBlob, resolve_json_blobs
 from kili.core.helpers import is_url
+from kili.core.utils import json_codec
+from kili.core.utils.lazy_json import loads_json_object
 from kili.domain.types import ListOrTuple
 
 
-def load_label_json_fields(label: dict, fields: ListOrTuple[str], http_client: HttpClient) -> dict:
-    """Load json fields of a label."""
+def get_label_json_blobs(
+    label: dict, fields: ListOrTuple[str], lazy: bool = False
+) -> list[JsonBlob]:
+    """Parse the inline json fields of a label, and get the json blobs to download.
+
+    If lazy is True, the inline json objects are parsed on first access.
+    """
+    if "jsonResponse" in fields:
+        json_response_url = label.get("jsonResponseUrl")
+        if json_response_url and is_url(json_response_url):
+            return [JsonBlob(label, "jsonResponse", json_response_url, url_field="jsonResponseUrl")]
+
+        label["jsonResponse"] = loads_json_object(
+            label.get("jsonResponse", "{}"), lazy=lazy, fallback={}
+        )
+
+    return []
+
+
+def load_labels_json_fields(
+    labels: Iterable[dict], fields: ListOrTuple[str], http_client: HttpClient, lazy: bool = False
+) -> Generator[dict, None, None]:
+    """Load json fields of labels, downloading the json blobs of all the labels concurrently.
+
+    If lazy is True, the inline json objects are parsed on first access.
+    """
+    yield from resolve_json_blobs(
+        labels, partial(get_label_json_blobs, fields=fields, lazy=lazy), http_client
+    )
+
+
+async def load_label_json_fields_async(
+    label: dict, fields: ListOrTuple[str], http_client: AsyncHttpClient
+) -> dict:
+    """Load json fields of a label with an asynchronous HTTP client."""
     if "jsonResponse" in fields:
         json_response_url = label.get("jsonResponseUrl")
         if json_response_url and is_url(json_response_url):
-            label["jsonResponse"] = load_json_from_link(json_response_url, http_client)
+            label["jsonResponse"] = await load_json_from_link_async(json_response_url, http_client)
             del label["jsonResponseUrl"]
         else:
             json_response_value = label.get("jsonResponse", "{}")
             try:
-                label["jsonResponse"] = json.loads(json_response_value)
+                label["jsonResponse"] = json_codec.loads(json_response_value)
             except json.JSONDecodeError:
                 label["jsonResponse"] = {}
 
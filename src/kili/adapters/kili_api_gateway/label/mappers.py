@@ -1,9 +1,8 @@
 """GraphQL payload data mappers for label operations."""
 
-import json
-
 from kili.adapters.kili_api_gateway.asset.mappers import asset_where_mapper
 from kili.adapters.kili_api_gateway.user.mappers import user_where_mapper
+from kili.core.utils import json_codec
 from kili.domain.label import LabelFilters
 
 from .types import AppendLabelData, AppendToLabelsData, UpdateLabelData
@@ -36,7 +35,7 @@ def update_label_data_mapper(data: UpdateLabelData) -> dict:
     """Map UpdateLabelData to GraphQL LabelData input."""
     return {
         "isSentBackToQueue": data.is_sent_back_to_queue,
-        "jsonResponse": json.dumps(data.json_response) if data.json_response else None,
+        "jsonResponse": json_codec.dumps(data.json_response) if data.json_response else None,
         "modelName": data.model_name,
         "secondsToLabel": data.seconds_to_label,
     }
@@ -48,7 +47,7 @@ def append_label_data_mapper(data: AppendLabelData) -> dict:
         "assetID": data.asset_id,
         "authorID": data.author_id,
         "clientVersion": data.client_version,
-        "jsonResponse": json.dumps(data.json_response),
+        "jsonResponse": json_codec.dumps(data.json_response),
         "modelName": data.model_name,
         "referencedLabelId": data.referenced_label_id,
         "secondsToLabel": data.seconds_to_label,
@@ -60,7 +59,7 @@ def append_to_labels_data_mapper(data: AppendToLabelsData) -> dict:
     return {
         "authorID": data.author_id,
         "clientVersion": data.client_version,
-        "jsonResponse": json.dumps(data.json_response),
+        "jsonResponse": json_codec.dumps(data.json_response),
         "labelType": data.label_type,
         "secondsToLabel": data.seconds_to_label,
         "skipped": data.skipped,
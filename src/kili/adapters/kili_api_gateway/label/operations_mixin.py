@@ -1,17 +1,29 @@
 """Mixin extending Kili API Gateway class with label related operations."""
 
-import json
+import dataclasses
 from collections.abc import Generator
 from typing import Optional
 
+from kili.adapters.kili_api_gateway.asset.operations_mixin import (
+    INPUT_TYPES_WITH_JSON_RESPONSE_URL,
+)
 from kili.adapters.kili_api_gateway.base import BaseOperationMixin
+from kili.adapters.kili_api_gateway.helpers.page_size import AdaptivePageSize
 from kili.adapters.kili_api_gateway.helpers.queries import (
+    KeysetPagination,
     PaginatedGraphQLQuery,
     QueryOptions,
     fragment_builder,
 )
+from kili.adapters.kili_api_gateway.helpers.sharding import (
+    CreatedAtShard,
+    can_shard_query,
+    get_created_at_shards,
+    list_created_at_shards,
+)
 from kili.adapters.kili_api_gateway.project.common import get_project
 from kili.core.constants import MUTATION_BATCH_SIZE
+from kili.core.utils import json_codec
 from kili.core.utils.pagination import batcher
 from kili.domain.asset import AssetId
 from kili.domain.label import LabelFilters, LabelId
@@ -19,7 +31,7 @@ from kili.domain.project import ProjectId
 from kili.domain.types import ListOrTuple
 from kili.utils.tqdm import tqdm
 
-from .formatters import load_label_json_fields
+from .formatters import load_labels_json_fields
 from .mappers import append_label_data_mapper, append_to_labels_data_mapper, label_where_mapper
 from .operations import (
     GQL_COPY_LABELS,
@@ -32,6 +44,16 @@ from .operations import (
 )
 from .types import AppendManyLabelsData, AppendToLabelsData
 
+# labels are sorted by creation date
+LABEL_KEYSET_PAGINATION = KeysetPagination(sort_field="createdAt", where_lower_bound="createdAtGte")
+
+
+def get_label_keyset_pagination(fields: ListOrTuple[str]) -> Optional[KeysetPagination]:
+    """Get the keyset pagination of labels, if the requested fields allow it."""
+    if "createdAt" in fields and "id" in fields:
+        return LABEL_KEYSET_PAGINATION
+    return None
+
 
 class LabelOperationMixin(BaseOperationMixin):
     """Mixin extending Kili API Gateway class with label related operations."""
@@ -49,17 +71,16 @@ class LabelOperationMixin(BaseOperationMixin):
         options: QueryOptions,
     ) -> Generator[dict, None, None]:
         """List labels."""
+        # an exact creation date filter leaves nothing to split
+        if can_shard_query(options) and filters.created_at is None:
+            yield from self.list_labels_sharded(filters, fields, options)
+            return
+
         if "jsonResponse" in fields:
             project_info = get_project(
                 self.graphql_client, filters.project_id, ("inputType", "jsonInterface")
             )
-            if project_info["inputType"] in {
-                "GEOSPATIAL",
-                "VIDEO",
-                "LLM_RLHF",
-                "LLM_INSTR_FOLLOWING",
-                "LLM_STATIC",
-            }:
+            if project_info["inputType"] in INPUT_TYPES_WITH_JSON_RESPONSE_URL:
                 yield from self.list_labels_split(filters, fields, options, project_info)
                 return
 
@@ -67,13 +88,51 @@ class LabelOperationMixin(BaseOperationMixin):
         query = get_labels_query(fragment)
         where = label_where_mapper(filters)
         labels_gen = PaginatedGraphQLQuery(self.graphql_client).execute_query_from_paginated_call(
-            query, where, options, "Retrieving labels", GQL_COUNT_LABELS
+            query,
+            where,
+            options,
+            "Retrieving labels",
+            GQL_COUNT_LABELS,
+            keyset=get_label_keyset_pagination(fields),
         )
-        labels_gen = (
-            load_label_json_fields(label, fields, self.http_client) for label in labels_gen
+        labels_gen = load_labels_json_fields(
+            labels_gen, fields, self.http_client, lazy=options.lazy_json_fields
         )
         yield from labels_gen
 
+    def list_labels_sharded(
+        self,
+        filters: LabelFilters,
+        fields: ListOrTuple[str],
+        options: QueryOptions,
+    ) -> Generator[dict, None, None]:
+        """List labels with several queries on disjoint windows of creation dates."""
+        nb_labels = self.count_labels(filters)
+        if nb_labels == 0:
+            return
+
+        shards = get_created_at_shards(
+            self.graphql_client,
+            get_labels_query(fragment_builder(("createdAt",))),
+            label_where_mapper(filters),
+            nb_labels,
+            options,
+            filters.created_at_gte,
+            filters.created_at_lte,
+        )
+        shard_fields = fields if "createdAt" in fields else [*fields, "createdAt"]
+        shard_options = options._replace(disable_tqdm=True, parallelism=1)
+
+        def list_shard(shard: CreatedAtShard) -> Generator[dict, None, None]:
+            shard_filters = dataclasses.replace(
+                filters, created_at_gte=shard.created_at_gte, created_at_lte=shard.created_at_lte
+            )
+            return self.list_labels(shard_filters, shard_fields, shard_options)
+
+        yield from list_created_at_shards(
+            list_shard, shards, fields, options, nb_labels, "Retrieving labels"
+        )
+
     def list_labels_split(
         self,
         filters: LabelFilters,
@@ -82,10 +141,17 @@ class LabelOperationMixin(BaseOperationMixin):
         project_info,
     ) -> Generator[dict, None, None]:
         """List labels."""
-        if project_info["inputType"] == "VIDEO":
-            options = QueryOptions(
-                options.disable_tqdm, options.first, options.skip, min(options.batch_size, 20)
-            )
+        # the first pages of video labels are small, and grow up to the requested batch size
+        # if the responses allow it
+        options = options._replace(
+            batch_size=(
+                min(options.batch_size, 20)
+                if project_info["inputType"] == "VIDEO"
+                else options.batch_size
+            ),
+            adaptive_page_size=options.adaptive_page_size
+            or AdaptivePageSize(max_page_size=options.batch_size),
+        )
 
         fields = list(fields)
         if "jsonResponse" in fields and "jsonResponseUrl" not in fields:
@@ -95,10 +161,15 @@ class LabelOperationMixin(BaseOperationMixin):
         query = get_labels_query(fragment)
         where = label_where_mapper(filters)
         labels_gen = PaginatedGraphQLQuery(self.graphql_client).execute_query_from_paginated_call(
-            query, where, options, "Retrieving labels", GQL_COUNT_LABELS
+            query,
+            where,
+            options,
+            "Retrieving labels",
+            GQL_COUNT_LABELS,
+            keyset=get_label_keyset_pagination(fields),
         )
-        labels_gen = (
-            load_label_json_fields(label, fields, self.http_client) for label in labels_gen
+        labels_gen = load_labels_json_fields(
+            labels_gen, fields, self.http_client, lazy=options.lazy_json_fields
         )
         yield from labels_gen
 
@@ -177,7 +248,7 @@ class LabelOperationMixin(BaseOperationMixin):
         fragment = fragment_builder(fields)
         query = get_create_honeypot_mutation(fragment)
         variables = {
-            "data": {"jsonResponse": json.dumps(json_response)},
+            "data": {"jsonResponse": json_codec.dumps(json_response)},
             "where": {"id": asset_id},
         }
         result = self.graphql_client.execute(query, variables)
@@ -0,0 +1,302 @@
+"""Kili Python SDK asynchronous client."""
+
+import os
+from collections.abc import AsyncGenerator
+from typing import Any, Optional, Union
+
+from kili.adapters.async_http_client import AsyncHttpClient
+from kili.adapters.kili_api_gateway.async_kili_api_gateway import AsyncKiliAPIGateway
+from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
+from kili.adapters.kili_api_gateway.label.types import AppendLabelData, AppendManyLabelsData
+from kili.core.config_loader import load_config_from_file
+from kili.core.constants import QUERY_BATCH_SIZE
+from kili.core.graphql.async_graphql_client import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    AsyncGraphQLClient,
+)
+from kili.core.graphql.clientnames import GraphQLClientName
+from kili.domain.asset import AssetFilters, AssetId, get_asset_default_fields
+from kili.domain.label import LabelFilters, LabelId, LabelType
+from kili.domain.project import ProjectId
+from kili.domain.types import ListOrTuple
+from kili.exceptions import AuthenticationFailed
+
+DEFAULT_LABEL_FIELDS = (
+    "author.email",
+    "author.id",
+    "id",
+    "jsonResponse",
+    "labelType",
+    "secondsToLabel",
+    "isLatestLabelForUser",
+    "assetId",
+)
+
+
+class AsyncKili:
+    """Kili asynchronous client.
+
+    It gives access to the main assets and labels operations with `async`/`await`,
+    so that many calls can be in flight concurrently from a single event loop.
+    Requires the `async` extra: `pip install kili[async]`.
+
+    The client holds connection pools that must be closed,
+    either with `await kili.close()` or by using it as an async context manager.
+
+    Examples:
+        ```python
+        from kili.async_client import AsyncKili
+
+        async with AsyncKili() as kili:
+            async for asset in kili.list_assets(project_id, fields=["id", "externalId"]):
+                ...
+        ```
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_endpoint: Optional[str] = None,
+        verify: Optional[Union[bool, str]] = None,
+        client_name: GraphQLClientName = GraphQLClientName.SDK,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Initialize Kili asynchronous client.
+
+        Args:
+            api_key: User API key generated
+                from https://cloud.kili-technology.com/label/my-account/api-key.
+                Default to `KILI_API_KEY` environment variable.
+            api_endpoint: Recipient of the HTTP operation.
+                Default to `KILI_API_ENDPOINT` environment variable.
+                If not passed, default to Kili SaaS:
+                'https://cloud.kili-technology.com/api/label/v2/graphql'
+            verify: similar to `requests`' verify.
+                Either a boolean, in which case it controls whether we verify
+                the server's TLS certificate, or a string, in which case it must be a path
+                to a CA bundle to use. Defaults to ``True``.
+            client_name: For internal use only.
+                Define the name of the graphQL client whith which graphQL calls will be sent.
+            max_concurrent_requests: Maximum number of GraphQL requests, and of HTTP downloads,
+                that can be in flight at the same time.
+        """
+        config_file = load_config_from_file()
+
+        api_key = api_key or os.getenv("KILI_API_KEY") or config_file.get("api_key")
+        if api_endpoint is None:
+            api_endpoint = (
+                os.getenv("KILI_API_ENDPOINT")
+                or config_file.get("api_endpoint")
+                or "https://cloud.kili-technology.com/api/label/v2/graphql"
+            )
+        if verify is None:
+            verify_env = os.getenv("KILI_VERIFY")
+            if verify_env is not None:
+                verify = verify_env.lower() in ("true", "1", "yes")
+            else:
+                verify = config_file.get("verify_ssl", True)
+
+        if not api_key:
+            raise AuthenticationFailed(api_key, api_endpoint)
+
+        assert api_endpoint is not None
+        assert verify is not None
+        self.api_key = api_key
+        self.api_endpoint = api_endpoint
+        self.verify = verify
+        self.client_name = client_name
+        self.http_client = AsyncHttpClient(
+            kili_endpoint=api_endpoint,
+            api_key=api_key,
+            verify=verify,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        self.graphql_client = AsyncGraphQLClient(
+            endpoint=api_endpoint,
+            api_key=api_key,
+            client_name=client_name,
+            verify=verify,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        self.kili_api_gateway = AsyncKiliAPIGateway(self.graphql_client, self.http_client)
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        await self.graphql_client.close()
+        await self.http_client.close()
+
+    async def __aenter__(self) -> "AsyncKili":
+        """Open the client."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the client."""
+        await self.close()
+
+    async def execute(self, query: str, variables: Optional[dict] = None) -> dict[str, Any]:
+        """Execute a GraphQL query or mutation.
+
+        Args:
+            query: The GraphQL operation.
+            variables: The variables of the operation.
+
+        Returns:
+            The data returned by the backend.
+        """
+        return await self.graphql_client.execute(query, variables)
+
+    async def count_assets(self, project_id: str, **filters: Any) -> int:
+        """Count the assets of a project.
+
+        Args:
+            project_id: Identifier of the project.
+            **filters: Asset filters, with the same names as the fields of `AssetFilters`.
+
+        Returns:
+            The number of assets matching the filters.
+        """
+        return await self.kili_api_gateway.count_assets(
+            AssetFilters(project_id=ProjectId(project_id), **filters)
+        )
+
+    async def list_assets(
+        self,
+        project_id: str,
+        fields: Optional[ListOrTuple[str]] = None,
+        first: Optional[int] = None,
+        skip: int = 0,
+        batch_size: int = QUERY_BATCH_SIZE,
+        **filters: Any,
+    ) -> AsyncGenerator[dict, None]:
+        """Iterate over the assets of a project.
+
+        Args:
+            project_id: Identifier of the project.
+            fields: All the fields to request among the possible fields for the assets.
+                Defaults to the same fields as `kili.assets()`.
+            first: Maximum number of assets to return.
+            skip: Number of assets to skip (they are ordered by their date of creation, first to last).
+            batch_size: Number of assets fetched per request.
+            **filters: Asset filters, with the same names as the fields of `AssetFilters`.
+
+        Yields:
+            The assets, as dicts.
+        """
+        if fields is None:
+            project = await self.kili_api_gateway.get_project(
+                ProjectId(project_id), ("workflowVersion",)
+            )
+            fields = get_asset_default_fields(project_workflow_version=project["workflowVersion"])
+
+        async for asset in self.kili_api_gateway.list_assets(
+            AssetFilters(project_id=ProjectId(project_id), **filters),
+            fields,
+            QueryOptions(disable_tqdm=True, first=first, skip=skip, batch_size=batch_size),
+        ):
+            yield asset
+
+    async def count_labels(self, project_id: str, **filters: Any) -> int:
+        """Count the labels of a project.
+
+        Args:
+            project_id: Identifier of the project.
+            **filters: Label filters, with the same names as the fields of `LabelFilters`.
+
+        Returns:
+            The number of labels matching the filters.
+        """
+        return await self.kili_api_gateway.count_labels(
+            LabelFilters(project_id=ProjectId(project_id), **filters)
+        )
+
+    async def list_labels(
+        self,
+        project_id: str,
+        fields: ListOrTuple[str] = DEFAULT_LABEL_FIELDS,
+        first: Optional[int] = None,
+        skip: int = 0,
+        batch_size: int = QUERY_BATCH_SIZE,
+        **filters: Any,
+    ) -> AsyncGenerator[dict, None]:
+        """Iterate over the labels of a project.
+
+        Args:
+            project_id: Identifier of the project.
+            fields: All the fields to request among the possible fields for the labels.
+            first: Maximum number of labels to return.
+            skip: Number of labels to skip (they are ordered by their date of creation, first to last).
+            batch_size: Number of labels fetched per request.
+            **filters: Label filters, with the same names as the fields of `LabelFilters`.
+
+        Yields:
+            The labels, as dicts.
+        """
+        async for label in self.kili_api_gateway.list_labels(
+            LabelFilters(project_id=ProjectId(project_id), **filters),
+            fields,
+            QueryOptions(disable_tqdm=True, first=first, skip=skip, batch_size=batch_size),
+        ):
+            yield label
+
+    async def append_labels(
+        self,
+        asset_id_array: ListOrTuple[str],
+        json_response_array: ListOrTuple[dict],
+        project_id: Optional[str] = None,
+        label_type: LabelType = "DEFAULT",
+        model_name: Optional[str] = None,
+        overwrite: bool = False,
+        step_name: Optional[str] = None,
+        fields: ListOrTuple[str] = ("id",),
+    ) -> list[dict]:
+        """Append labels to assets.
+
+        Args:
+            asset_id_array: list of asset internal ids to append labels on.
+            json_response_array: list of labels to append.
+            project_id: Identifier of the project.
+            label_type: Can be one of `AUTOSAVE`, `DEFAULT`, `PREDICTION`, `REVIEW` or `INFERENCE`.
+            model_name: Name of the model that generated the labels.
+            overwrite: when uploading prediction or inference labels, if True,
+                it will overwrite existing labels with the same model name.
+            step_name: Name of the step to which the labels belong.
+            fields: The fields to return for the created labels.
+
+        Returns:
+            The created labels.
+        """
+        if len(asset_id_array) != len(json_response_array):
+            raise ValueError("asset_id_array and json_response_array must have the same length")
+
+        data = AppendManyLabelsData(
+            labels_data=[
+                AppendLabelData(
+                    asset_id=AssetId(asset_id),
+                    author_id=None,
+                    client_version=None,
+                    json_response=json_response,
+                    model_name=model_name,
+                    referenced_label_id=None,
+                    seconds_to_label=None,
+                )
+                for asset_id, json_response in zip(asset_id_array, json_response_array, strict=True)
+            ],
+            label_type=label_type,
+            overwrite=overwrite,
+            step_name=step_name,
+        )
+        return await self.kili_api_gateway.append_many_labels(
+            data, fields, ProjectId(project_id) if project_id else None
+        )
+
+    async def delete_labels(self, ids: ListOrTuple[str]) -> list[LabelId]:
+        """Delete labels.
+
+        Args:
+            ids: List of label ids to delete.
+
+        Returns:
+            The deleted label ids.
+        """
+        return await self.kili_api_gateway.delete_labels([LabelId(id_) for id_ in ids])
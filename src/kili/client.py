@@ -1,18 +1,23 @@
 """Kili Python SDK client."""
 
 import getpass
-import logging
 import os
 import sys
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import Optional, TypedDict, Union
 
 from kili.adapters.authentification import is_api_key_valid
 from kili.adapters.http_client import HttpClient
+from kili.adapters.json_blob_cache import JsonBlobCache
 from kili.adapters.kili_api_gateway.kili_api_gateway import KiliAPIGateway
 from kili.core.config_loader import load_config_from_file
+from kili.core.graphql.circuit_breaker import CircuitBreaker
 from kili.core.graphql.graphql_client import GraphQLClient, GraphQLClientName
+from kili.core.graphql.rate_limiter import RateLimiter
+from kili.core.graphql.retry_budget import RetryBudget
+from kili.core.utils.concurrency import run_in_background
 from kili.entrypoints.mutations.asset import MutationsAsset
 from kili.entrypoints.mutations.issue import MutationsIssue
 from kili.entrypoints.mutations.notification import MutationsNotification
@@ -42,22 +47,35 @@ from kili.use_cases.api_key import ApiKeyUseCases
 warnings.filterwarnings("default", module="kili", category=DeprecationWarning)
 
 
+def _get_flag(config_file: dict, env_variable: str, config_key: str) -> bool:
+    """Get a boolean option from an environment variable, else from the config file."""
+    env_value = os.getenv(env_variable)
+    if env_value is not None:
+        return env_value.lower() in ("true", "1", "yes")
+    return bool(config_file.get(config_key, False))
+
+
 class GraphQLClientParams(TypedDict, total=False):
     """Parameters for GraphQLClient initialization."""
 
     enable_schema_caching: bool
     graphql_schema_cache_dir: Optional[Union[str, Path]]
+    max_concurrent_requests: int
+    rate_limiter: RateLimiter
+    lazy_bootstrap: bool
+    request_compression_threshold: Optional[int]
+    retry_budget: RetryBudget
+    circuit_breaker: CircuitBreaker
 
 
-class FilterPoolFullWarning(logging.Filter):
-    """Filter out the specific urllib3 warning related to the connection pool."""
-
-    def filter(self, record) -> bool:
-        """urllib3.connectionpool:Connection pool is full, discarding connection: ..."""
-        return "Connection pool is full, discarding connection" not in record.getMessage()
+class HttpClientParams(TypedDict, total=False):
+    """Parameters for HttpClient initialization."""
 
-
-logging.getLogger("urllib3.connectionpool").addFilter(FilterPoolFullWarning())
+    pool_maxsize: Optional[int]
+    pool_connections: int
+    keep_alive: bool
+    max_retries: int
+    http2: bool
 
 
 class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
@@ -93,6 +111,7 @@ class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
         client_name: GraphQLClientName = GraphQLClientName.SDK,
         graphql_client_params: Optional[GraphQLClientParams] = None,
         disable_tqdm: bool | None = None,
+        http_client_params: Optional[HttpClientParams] = None,
     ) -> None:
         """Initialize Kili client.
 
@@ -120,10 +139,16 @@ class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
             client_name: For internal use only.
                 Define the name of the graphQL client whith which graphQL calls will be sent.
             graphql_client_params: Parameters to pass to the graphQL client.
+                With `lazy_bootstrap` set to True, the API key checks and the loading of the
+                GraphQL schema run in background, and the first request waits for them.
             disable_tqdm: Global setting to disable progress bars (tqdm) for all operations.
                 Can be overridden by individual function calls.
                 Default to `KILI_DISABLE_TQDM` environment variable.
                 If not passed, default to `disable_tqdm` in config file or False.
+            http_client_params: Parameters to pass to the HTTP client that uploads and
+                downloads the media and the JSON documents, e.g. the size of its connection
+                pools, its retries, or `http2` to send the requests over HTTP/2.
+                By default, the connection pools are sized for the concurrency of the SDK.
 
         Returns:
             Instance of the Kili client.
@@ -176,6 +201,11 @@ class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
                 disable_tqdm = config_file["disable_tqdm"]
             # Otherwise keep as None to let individual functions use their own defaults
 
+        # The JSON documents of assets and labels can be cached on disk
+        enable_json_blob_cache = _get_flag(config_file, "KILI_JSON_BLOB_CACHE", "json_blob_cache")
+        # The json fields of listed assets and labels can be parsed on first access
+        lazy_json_fields = _get_flag(config_file, "KILI_LAZY_JSON_FIELDS", "lazy_json_fields")
+
         assert api_endpoint is not None
         assert verify is not None
 
@@ -187,16 +217,18 @@ class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
         self.verify = verify
         self.client_name = client_name
         self.disable_tqdm = disable_tqdm
-        self.http_client = HttpClient(kili_endpoint=api_endpoint, verify=verify, api_key=api_key)
+        self.lazy_json_fields = lazy_json_fields
+        self.http_client = HttpClient(
+            kili_endpoint=api_endpoint,
+            verify=verify,
+            api_key=api_key,
+            json_blob_cache=JsonBlobCache() if enable_json_blob_cache else None,
+            **(http_client_params or {}),
+        )
         skip_checks = os.getenv("KILI_SDK_SKIP_CHECKS") is not None
-        if not skip_checks and not is_api_key_valid(
-            self.http_client, api_key, api_endpoint, client_name
-        ):
-            raise AuthenticationFailed(
-                api_key=self.api_key,
-                api_endpoint=self.api_endpoint,
-                error_msg="Api key does not seem to be valid.",
-            )
+        lazy_bootstrap = (graphql_client_params or {}).get("lazy_bootstrap", False)
+        if not skip_checks and not lazy_bootstrap:
+            self._check_api_key_is_valid()
 
         self.graphql_client = GraphQLClient(
             endpoint=api_endpoint,
@@ -212,5 +244,31 @@ class Kili(  # pylint: disable=too-many-ancestors,too-many-instance-attributes
         self.events = EventClientMethods(self.kili_api_gateway)
 
         if not skip_checks:
-            api_key_use_cases = ApiKeyUseCases(self.kili_api_gateway)
-            api_key_use_cases.check_expiry_of_key_is_close(api_key)
+            self._check_api_key(lazy_bootstrap)
+
+    def _check_api_key(self, lazy_bootstrap: bool) -> None:
+        """Check the api key once the clients are created, in background if lazy_bootstrap."""
+        api_key_use_cases = ApiKeyUseCases(self.kili_api_gateway)
+        if not lazy_bootstrap:
+            api_key_use_cases.check_expiry_of_key_is_close(self.api_key)
+            return
+        # the requests wait for the validation of the api key
+        # while the expiry check only warns, so nothing waits for it
+        self.graphql_client.add_pending_check(
+            run_in_background(self._check_api_key_is_valid, name="kili-api-key-check")
+        )
+        run_in_background(
+            partial(api_key_use_cases.check_expiry_of_key_is_close, self.api_key),
+            name="kili-api-key-expiry-check",
+        )
+
+    def _check_api_key_is_valid(self) -> None:
+        """Raise an AuthenticationFailed error if the api key is not valid."""
+        if not is_api_key_valid(
+            self.http_client, self.api_key, self.api_endpoint, self.client_name
+        ):
+            raise AuthenticationFailed(
+                api_key=self.api_key,
+                api_endpoint=self.api_endpoint,
+                error_msg="Api key does not seem to be valid.",
+            )
@@ -1,11 +1,10 @@
 """Kili Python SDK client."""
 
-import logging
 import warnings
 from functools import cached_property
 from typing import TYPE_CHECKING, Optional, Union
 
-from kili.client import GraphQLClientParams
+from kili.client import GraphQLClientParams, HttpClientParams
 from kili.client import Kili as KiliLegacy
 from kili.core.graphql.graphql_client import GraphQLClientName
 
@@ -26,17 +25,6 @@ if TYPE_CHECKING:
 warnings.filterwarnings("default", module="kili", category=DeprecationWarning)
 
 
-class FilterPoolFullWarning(logging.Filter):
-    """Filter out the specific urllib3 warning related to the connection pool."""
-
-    def filter(self, record) -> bool:
-        """urllib3.connectionpool:Connection pool is full, discarding connection: ..."""
-        return "Connection pool is full, discarding connection" not in record.getMessage()
-
-
-logging.getLogger("urllib3.connectionpool").addFilter(FilterPoolFullWarning())
-
-
 class Kili:
     """Kili Client (domain mode)."""
 
@@ -49,6 +37,7 @@ class Kili:
         verify: Optional[Union[bool, str]] = None,
         graphql_client_params: Optional[GraphQLClientParams] = None,
         disable_tqdm: bool | None = None,
+        http_client_params: Optional[HttpClientParams] = None,
     ) -> None:
         """Initialize Kili client (domain mode).
 
@@ -78,6 +67,8 @@ class Kili:
                 Can be overridden by individual function calls.
                 Default to `KILI_DISABLE_TQDM` environment variable.
                 If not passed, default to `disable_tqdm` in config file or False.
+            http_client_params: Parameters to pass to the HTTP client, e.g. the size of its
+                connection pools, its retries, or `http2` to send the requests over HTTP/2.
 
         Returns:
             Instance of the Kili client.
@@ -108,6 +99,7 @@ class Kili:
             GraphQLClientName.SDK_DOMAIN,
             graphql_client_params,
             disable_tqdm,
+            http_client_params,
         )
 
     # Domain API Namespaces - Lazy loaded properties
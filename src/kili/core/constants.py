@@ -41,5 +41,7 @@ mime_extensions_for_txt_files = ["text/plain"]
 mime_extensions_that_need_post_processing = ["application/vnd.nitf", "image/jp2", "image/tiff"]
 
 QUERY_BATCH_SIZE = 100
+# number of pages of assets or labels fetched in the background while a page is consumed
+QUERY_PREFETCH_PAGES = 1
 MUTATION_BATCH_SIZE = 100
 MAX_CALLS_PER_MINUTE = 500
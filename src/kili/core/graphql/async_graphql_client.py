@@ -0,0 +1,244 @@
+"""Asynchronous GraphQL Client."""
+
+import asyncio
+import functools
+import os
+import ssl
+import time
+import warnings
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import graphql
+from gql.client import AsyncClientSession
+from gql.transport import exceptions
+from graphql import DocumentNode
+
+import kili.exceptions
+from kili.core.graphql import graphql_client
+from kili.core.graphql.clientnames import GraphQLClientName
+from kili.core.graphql.document_cache import CachedValidationClient, parse_query
+from kili.core.graphql.exceptions import extract_error_context
+from kili.core.graphql.graphql_client import (
+    get_graphql_headers,
+    get_introspection_args,
+    get_operation_name,
+    remove_nullable_inputs,
+    retry_graphql_execution,
+)
+from kili.core.graphql.rate_limiter import RateLimiter
+from kili.core.utils import json_codec
+from kili.utils.logcontext import LogContext
+
+if TYPE_CHECKING:
+    from aiohttp import TraceRequestEndParams
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+
+
+class AsyncGraphQLClient:
+    """Asynchronous GraphQL client.
+
+    It relies on the aiohttp transport of gql. A single connection pool is used
+    for all the requests, and up to `max_concurrent_requests` requests can be in flight.
+
+    The client must be closed with `close` (or used as an async context manager)
+    to release the connections.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        client_name: GraphQLClientName,
+        verify: Union[bool, str] = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        """Initialize the asynchronous GraphQL client.
+
+        Args:
+            endpoint: Kili API endpoint.
+            api_key: Kili API key.
+            client_name: Name of the client.
+            verify: Whether to verify the SSL certificate, or path to a CA bundle.
+            max_concurrent_requests: Maximum number of requests that can be in flight at the
+                same time.
+            rate_limiter: Rate limiter of the requests. By default, the rate limiter
+                shared with the synchronous clients of the process.
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            from aiohttp import TraceConfig
+            from gql.transport.aiohttp import AIOHTTPTransport
+        except ImportError as e:
+            raise ImportError("Install with `pip install kili[async]` to use this feature.") from e
+
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"max_concurrent_requests must be greater than 0, got {max_concurrent_requests}"
+            )
+
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.client_name = client_name
+        self.verify = verify
+        self.created_at = time.time()
+        self.complexity_consumed = 0
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = rate_limiter
+
+        # the response headers stored on the transport are overwritten by concurrent requests
+        # so the complexity is read from the responses with an aiohttp trace hook instead
+        trace_config = TraceConfig()
+        trace_config.on_request_end.append(self._on_request_end)
+
+        self._gql_transport = AIOHTTPTransport(
+            url=endpoint,
+            headers=get_graphql_headers(api_key, client_name),
+            timeout=60,
+            ssl=self._get_ssl_context(verify),
+            client_session_args={"trace_configs": [trace_config]},
+            json_serialize=functools.partial(
+                json_codec.dumps, separators=json_codec.COMPACT_SEPARATORS
+            ),
+        )
+        self._gql_client = CachedValidationClient(
+            transport=self._gql_transport,
+            fetch_schema_from_transport=os.environ.get("KILI_SDK_SKIP_CHECKS", None) is None,
+            introspection_args=get_introspection_args(),
+        )
+        self._session: Optional[AsyncClientSession] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _get_ssl_context(verify: Union[bool, str]) -> Union[bool, ssl.SSLContext]:
+        """Convert the `verify` argument to the aiohttp ssl argument."""
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return verify
+
+    async def _on_request_end(
+        self, _session: Any, context: Any, params: "TraceRequestEndParams"
+    ) -> None:
+        """Count the complexity returned by the backend for each request."""
+        returned_complexity = params.response.headers.get("x-complexity")
+        if returned_complexity is not None:
+            self.complexity_consumed += int(returned_complexity)
+            # the context of the request, given in the trace_request_ctx argument
+            response_info = getattr(context, "trace_request_ctx", None)
+            if isinstance(response_info, dict):
+                response_info["complexity"] = int(returned_complexity)
+
+    async def _get_session(self) -> AsyncClientSession:
+        """Get the gql session, connecting the transport on first call."""
+        if self._session is not None:
+            return self._session
+
+        # asyncio primitives are created lazily to be bound to the running loop
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async with self._connect_lock:
+            if self._session is None:
+                self._session = await self._gql_client.connect_async(reconnecting=False)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        if self._session is not None:
+            await self._gql_client.close_async()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncGraphQLClient":
+        """Connect the client."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the client."""
+        await self.close()
+
+    async def execute(
+        self, query: Union[str, DocumentNode], variables: Optional[dict] = None, **kwargs
+    ) -> dict[str, Any]:
+        """Execute a query.
+
+        Args:
+            query: the GraphQL query
+            variables: the payload of the query
+            kwargs: additional arguments to pass to the GraphQL client
+        """
+        document = query if isinstance(query, DocumentNode) else parse_query(query)
+        variables = remove_nullable_inputs(variables) if variables else None
+
+        should_retry = kwargs.pop("retry", True)
+
+        try:
+            if should_retry:
+                return await self._execute_with_retries(document, variables, **kwargs)
+            return await self._raw_execute(document, variables, **kwargs)
+
+        except graphql.GraphQLError as err:  # local validation error
+            raise kili.exceptions.GraphQLError(error=err.message) from err
+
+        except exceptions.TransportQueryError as err:  # remote validation error
+            context = extract_error_context(str(err.errors))
+            raise kili.exceptions.GraphQLError(error=err.errors, context=context) from err
+
+    @retry_graphql_execution
+    async def _execute_with_retries(
+        self, document: DocumentNode, variables: Optional[dict], **kwargs
+    ) -> dict[str, Any]:
+        return await self._raw_execute(document, variables, **kwargs)
+
+    async def _raw_execute(
+        self, document: DocumentNode, variables: Optional[dict], **kwargs
+    ) -> dict[str, Any]:
+        session = await self._get_session()
+        # by default, the rate limiter is shared with the synchronous clients of the process
+        rate_limiter = self.rate_limiter or graphql_client._limiter  # pylint: disable=protected-access
+        operation_name = get_operation_name(document)
+        await asyncio.to_thread(rate_limiter.try_acquire, operation_name)
+        log_context = LogContext()
+        log_context.set_client_name(self.client_name)
+
+        response_info: dict[str, int] = {}
+        extra_args: dict[str, Any] = {
+            "headers": {**log_context},
+            "trace_request_ctx": response_info,
+        }
+        timeout = kwargs.pop("timeout", None)
+        if timeout is not None:
+            import aiohttp  # pylint: disable=import-outside-toplevel
+
+            extra_args["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        assert self._semaphore is not None
+        async with self._semaphore:
+            res = await session.execute(
+                document=document,
+                variable_values=variables,
+                get_execution_result=True,
+                extra_args=extra_args,
+                **kwargs,
+            )
+
+        rate_limiter.report(operation_name, response_info.get("complexity", 0))
+
+        extensions = getattr(res, "extensions", None)
+        if isinstance(extensions, dict):
+            for item in extensions.get("deprecations") or []:
+                warnings.warn(
+                    f"[Kili SDK] Deprecated GraphQL field used: "
+                    f"{item.get('path')} – {item.get('reason')}"
+                )
+
+        if res.data is None:
+            raise kili.exceptions.GraphQLError(
+                error="GraphQL response contains no data",
+            )
+
+        return res.data
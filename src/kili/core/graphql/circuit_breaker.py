@@ -0,0 +1,128 @@
+"""Circuit breaker of the requests sent to the GraphQL endpoint."""
+
+import threading
+import time
+from enum import Enum
+
+from kili.exceptions import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    # the requests are sent
+    CLOSED = "closed"
+    # a few probe requests are sent to check whether the backend recovered
+    HALF_OPEN = "half_open"
+    # the requests fail right away, without being sent
+    OPEN = "open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker, failing fast while the backend is unavailable.
+
+    The circuit opens after `failure_threshold` consecutive failures, i.e. 5xx responses,
+    timeouts or connection errors. Once open, the requests raise a `CircuitOpenError`
+    without being sent. After `recovery_timeout` seconds, the circuit is half-open:
+    up to `half_open_max_requests` probe requests are sent, and the circuit closes
+    if they succeed, or opens again if one of them fails. The probes must be released
+    with `release_probe` once answered, so that an interrupted probe does not keep the
+    circuit half-open forever.
+    It can be shared between the clients of a process.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_requests: int = 1,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Number of consecutive failures opening the circuit.
+            recovery_timeout: Time during which the circuit stays open, in seconds.
+            half_open_max_requests: Number of probe requests sent when the circuit is half-open.
+        """
+        if failure_threshold < 1 or half_open_max_requests < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_requests must be greater than 0, got"
+                f" {failure_threshold} and {half_open_max_requests}"
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_requests = half_open_max_requests
+        self.nb_rejected_requests = 0
+        self._state = CircuitState.CLOSED
+        self._nb_consecutive_failures = 0
+        self._opened_at = 0.0
+        self._nb_probes = 0
+        self._lock = threading.Lock()
+
+    def _update_state(self) -> None:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._nb_probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def before_request(self) -> bool:
+        """Check that a request can be sent, right before sending it.
+
+        Returns:
+            Whether the request is a probe of the half-open circuit, to release with
+                `release_probe` once the request is answered or failed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or if the probes of the half-open
+                circuit are already being sent.
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CircuitState.CLOSED:
+                return False
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._nb_probes < self.half_open_max_requests
+            ):
+                self._nb_probes += 1
+                return True
+            self.nb_rejected_requests += 1
+            retry_in = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+            nb_failures = self._nb_consecutive_failures
+        raise CircuitOpenError(
+            f"The Kili backend failed {nb_failures} times in a row,"
+            f" the requests are not sent for {retry_in:.0f} seconds."
+        )
+
+    def release_probe(self) -> None:
+        """Release a probe taken by `before_request`, after its outcome was recorded."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._nb_probes > 0:
+                self._nb_probes -= 1
+
+    def record_success(self) -> None:
+        """Report that the backend answered a request."""
+        with self._lock:
+            self._nb_consecutive_failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        """Report that a request failed because of the backend, opening the circuit if needed."""
+        with self._lock:
+            self._nb_consecutive_failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._nb_consecutive_failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
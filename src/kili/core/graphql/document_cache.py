@@ -0,0 +1,143 @@
+"""Cache of parsed and validated GraphQL documents."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from gql import Client, gql
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, validate
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 256
+
+
+class DocumentCacheInfo(NamedTuple):
+    """Statistics of a GraphQLDocumentCache."""
+
+    hits: int
+    misses: int
+    validation_hits: int
+    validation_misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass
+class _CacheEntry:
+    document: DocumentNode
+    # schema against which the document was validated, and the resulting errors
+    validated_schema: Optional[GraphQLSchema] = None
+    validation_errors: list[GraphQLError] = field(default_factory=list)
+
+
+class GraphQLDocumentCache:
+    """Bounded LRU cache of GraphQL documents keyed by query text.
+
+    It stores the parsed document of each query, and the result of its validation
+    against the schema, so that a query sent many times (e.g. the pages of a paginated query)
+    is parsed and validated only once.
+
+    It is thread-safe.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_DOCUMENT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of documents kept in the cache.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # the cached documents are kept alive by the entries, so their ids are unique
+        self._entries_by_document_id: dict[int, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+        self._validation_hits = self._validation_misses = 0
+
+    def get_document(self, query: str) -> Optional[DocumentNode]:
+        """Get the parsed document of a query, or None if the query is not cached."""
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(query)
+            self._hits += 1
+            return entry.document
+
+    def add_document(self, query: str, document: DocumentNode) -> None:
+        """Add the parsed document of a query to the cache."""
+        with self._lock:
+            if query in self._entries:
+                return
+            entry = _CacheEntry(document=document)
+            self._entries[query] = entry
+            self._entries_by_document_id[id(document)] = entry
+            while len(self._entries) > self.maxsize:
+                _, evicted_entry = self._entries.popitem(last=False)
+                del self._entries_by_document_id[id(evicted_entry.document)]
+
+    def validate(self, schema: GraphQLSchema, document: DocumentNode) -> list[GraphQLError]:
+        """Validate a document against a schema, reusing the result of previous validations.
+
+        Documents that are not in the cache are validated without storing the result.
+        """
+        with self._lock:
+            entry = self._entries_by_document_id.get(id(document))
+            if entry is not None and entry.validated_schema is schema:
+                self._validation_hits += 1
+                return entry.validation_errors
+            self._validation_misses += 1
+
+        validation_errors = validate(schema, document)
+
+        if entry is not None:
+            with self._lock:
+                entry.validated_schema = schema
+                entry.validation_errors = validation_errors
+        return validation_errors
+
+    def info(self) -> DocumentCacheInfo:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return DocumentCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                validation_hits=self._validation_hits,
+                validation_misses=self._validation_misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Remove all the documents from the cache and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._entries_by_document_id.clear()
+            self._hits = self._misses = 0
+            self._validation_hits = self._validation_misses = 0
+
+
+# shared between all instances of Kili client within the same process
+graphql_document_cache = GraphQLDocumentCache()
+
+
+def parse_query(query: str) -> DocumentNode:
+    """Parse a query, reusing the document of the shared cache if the query was already parsed."""
+    document = graphql_document_cache.get_document(query)
+    if document is None:
+        document = gql(query)
+        graphql_document_cache.add_document(query, document)
+    return document
+
+
+class CachedValidationClient(Client):
+    """gql Client that validates the documents with the shared document cache."""
+
+    def validate(self, document: DocumentNode) -> None:
+        """Validate a document against the client schema."""
+        assert self.schema, "Cannot validate the document locally, you need to pass a schema."
+
+        validation_errors = graphql_document_cache.validate(self.schema, document)
+        if validation_errors:
+            raise validation_errors[0]
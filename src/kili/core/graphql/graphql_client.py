@@ -1,24 +1,33 @@
 """GraphQL Client."""
 
+import contextlib
 import logging
 import os
 import threading
 import time
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, NamedTuple, Optional, Union
 from urllib.parse import urlparse
 
 import graphql
+import requests
 from filelock import FileLock
-from gql import Client, gql
+from gql import Client
 from gql.transport import exceptions
-from gql.transport.requests import RequestsHTTPTransport
 from gql.transport.requests import log as gql_requests_logger
-from graphql import DocumentNode, print_schema
-from pyrate_limiter import Duration, Rate
-from pyrate_limiter.limiter import Limiter
+from graphql import (
+    DocumentNode,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    build_ast_schema,
+    parse,
+    print_schema,
+)
 from tenacity import (
+    RetryCallState,
     retry,
     retry_all,
     retry_any,
@@ -28,14 +37,29 @@ from tenacity import (
     stop_after_delay,
     wait_exponential,
 )
+from tenacity.retry import retry_base
+from urllib3.util.request import ACCEPT_ENCODING
 
 import kili.exceptions
 from kili import __version__
 from kili.adapters.http_client import HttpClient
-from kili.core.constants import MAX_CALLS_PER_MINUTE
+from kili.core.graphql.circuit_breaker import CircuitBreaker, CircuitState
 from kili.core.graphql.clientnames import GraphQLClientName
+from kili.core.graphql.document_cache import CachedValidationClient, parse_query
 from kili.core.graphql.exceptions import extract_error_context
+from kili.core.graphql.rate_limiter import CallRateLimiter, RateLimiter
+from kili.core.graphql.retry_budget import RetryBudget
+from kili.core.graphql.schema_cache import (
+    COMPILED_SCHEMA_SUFFIX,
+    get_compiled_schema_path,
+    load_compiled_schema,
+    save_compiled_schema,
+)
+from kili.core.graphql.transport import HttpExchange, KiliRequestsHTTPTransport
+from kili.core.metrics import MetricsRecorder
+from kili.core.utils.concurrency import completed_future, run_in_background
 from kili.utils.logcontext import LogContext
+from kili.utils.tracing import tracer
 
 gql_requests_logger.setLevel(logging.WARNING)
 
@@ -43,15 +67,140 @@ gql_requests_logger.setLevel(logging.WARNING)
 # they need to be shared between all instances of Kili client within the same process
 
 # rate limiter to avoid sending too many queries to the backend
-_limiter = Limiter(Rate(MAX_CALLS_PER_MINUTE, Duration.MINUTE), max_delay=120 * 1000)
+# used by the clients that are not given their own rate limiter (default)
+_limiter: RateLimiter = CallRateLimiter()
 
 # mutex to avoid multiple threads sending queries to the backend at the same time
+# used by the clients that do not allow concurrent requests (default)
 _execute_lock = threading.Lock()
 
 DEFAULT_GRAPHQL_SCHEMA_CACHE_DIR = Path.home() / ".cache" / "kili" / "graphql"
 
 
-# pylint: disable=too-many-instance-attributes, too-few-public-methods
+def _record_retry(retry_state: RetryCallState) -> None:
+    """Count the retry of an operation in the metrics of the client retrying it."""
+    if len(retry_state.args) < 2:
+        return
+    client, document = retry_state.args[:2]
+    metrics = getattr(client, "metrics", None)
+    if isinstance(metrics, MetricsRecorder) and isinstance(document, DocumentNode):
+        metrics.record_retry(get_operation_name(document))
+
+
+class _RetryIfWithinRetryBudget(retry_base):  # pylint: disable=too-few-public-methods
+    """Retry strategy spending a retry of the budget of the client retrying the operation."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        client = retry_state.args[0] if retry_state.args else None
+        retry_budget = getattr(client, "retry_budget", None)
+        return not isinstance(retry_budget, RetryBudget) or retry_budget.try_acquire_retry()
+
+
+# retry policy for the transient errors returned by the backend
+retry_graphql_execution = retry(
+    reraise=True,  # re-raise the last exception
+    retry=retry_all(
+        retry_if_exception_type(  # error received from server
+            (exceptions.TransportQueryError, exceptions.TransportServerError)
+        ),
+        retry_if_not_exception_message(
+            match=r'.*Variable "(\$\w+)" of required type "(\w+!)" was not provided.*'
+        ),
+        retry_if_not_exception_message(match=r'.*Variable "(\$\w+)" got invalid value .*'),
+        retry_if_not_exception_message(match=r'.*Field "(\w+)" is not defined by type "(\w+)".*'),
+        retry_any(
+            retry_if_exception_message(match=r".*Invalid request made to Flagsmith API.*"),
+            retry_if_exception_message(match=r".*Failed to fetch data connection.*"),
+            retry_if_exception_message(match=r".*Unauthorized for url.*"),
+        ),
+        _RetryIfWithinRetryBudget(),  # last, to spend the budget only for the retried errors
+    ),
+    stop=stop_after_delay(3 * 60),
+    wait=wait_exponential(multiplier=0.5, min=1, max=10),
+    before_sleep=_record_retry,
+)
+
+
+class GraphQLResponseInfo(NamedTuple):
+    """Information about a response of the GraphQL endpoint."""
+
+    # complexity of the operation, from the x-complexity header
+    complexity: int
+    # size of the decoded response body, or from the content-length header if not measured
+    nb_bytes: Optional[int]
+    # sizes of the request and response bodies on the wire, i.e. compressed, if measured
+    nb_bytes_sent: Optional[int] = None
+    nb_bytes_received: Optional[int] = None
+    # from the request sent to the response received, in seconds, without the waits
+    # for the rate limiter and for the lock limiting the concurrent requests
+    latency: Optional[float] = None
+
+
+class _RequestTimings(NamedTuple):
+    """Times measured while sending a request, from `time.perf_counter`, or durations in seconds."""
+
+    called_at: float
+    rate_limiter_wait: float
+    lock_wait: float
+    sent_at: float
+    # from the request sent to the response received, set once received
+    latency: float = 0.0
+
+
+def is_backend_failure(err: BaseException) -> bool:
+    """Whether a request failed because the backend is unavailable, i.e. 5xx or no response."""
+    if isinstance(err, exceptions.TransportServerError):
+        return err.code is None or err.code >= 500
+    return isinstance(
+        err,
+        (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.RetryError,
+        ),
+    )
+
+
+def get_operation_name(document: DocumentNode) -> str:
+    """Get the name of the operation of a GraphQL document."""
+    for definition in getattr(document, "definitions", ()):
+        if isinstance(definition, OperationDefinitionNode) and definition.name is not None:
+            return definition.name.value
+    return "anonymous"
+
+
+def get_introspection_args() -> dict[str, bool]:
+    """Get the arguments of the introspection query fetching the GraphQL schema."""
+    return {
+        "descriptions": True,  # descriptions for the schema, types, fields, and arguments
+        "specified_by_url": False,  # https://spec.graphql.org/draft/#sec--specifiedBy
+        "directive_is_repeatable": True,  # include repeatability of directives
+        "schema_description": True,  # include schema description
+        "input_value_deprecation": True,  # request deprecated input fields
+    }
+
+
+def remove_nullable_inputs(variables: dict) -> dict:
+    """Remove nullable inputs from the variables of a GraphQL operation."""
+    for key in ("data", "where", "project", "asset", "label", "issue"):
+        if key in variables and isinstance(variables[key], dict):
+            variables[key] = remove_nullable_inputs(variables[key])
+
+    return {k: v for k, v in variables.items() if v is not None}
+
+
+def get_graphql_headers(api_key: str, client_name: GraphQLClientName) -> dict[str, str]:
+    """Get the headers to send with the GraphQL requests."""
+    return {
+        "Authorization": f"X-API-Key: {api_key}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "apollographql-client-name": client_name.value,
+        "apollographql-client-version": __version__,
+    }
+
+
+# pylint: disable=too-many-instance-attributes
 class GraphQLClient:
     """GraphQL client."""
 
@@ -65,6 +214,12 @@ class GraphQLClient:
         verify: Union[bool, str] = True,
         enable_schema_caching: bool = True,
         graphql_schema_cache_dir: Optional[Union[str, Path]] = DEFAULT_GRAPHQL_SCHEMA_CACHE_DIR,
+        max_concurrent_requests: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
+        lazy_bootstrap: bool = False,
+        request_compression_threshold: Optional[int] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         """Initialize the GraphQL client.
 
@@ -76,7 +231,31 @@ class GraphQLClient:
             verify: Whether to verify the SSL certificate.
             enable_schema_caching: Whether to cache the GraphQL schema on disk.
             graphql_schema_cache_dir: Directory where to cache the GraphQL schema.
+            max_concurrent_requests: Maximum number of requests that can be in flight at the
+                same time. With the default value of 1, requests are serialized between all the
+                clients of the process. Higher values allow threads sharing this client to send
+                requests concurrently, each thread using its own transport session.
+            rate_limiter: Rate limiter of the requests, e.g. a `ComplexityRateLimiter`, or a
+                `SharedCallRateLimiter` shared between the processes of the host using the same
+                endpoint and API key. By default, the number of calls is limited by a rate
+                limiter shared between all the clients of the process.
+            lazy_bootstrap: If True, the GraphQL schema is loaded in a background thread,
+                and the first request waits for it, so that the client is created right away.
+            request_compression_threshold: Size in bytes from which the request bodies are
+                compressed with gzip, e.g. for mutations with large json responses.
+                If None, the request bodies are not compressed. The responses are compressed
+                whenever the backend supports it.
+            retry_budget: Budget limiting the retries of the failed requests to a ratio of
+                the requests sent, e.g. shared between the clients of the process.
+                If None, the failed requests are retried for up to 3 minutes.
+            circuit_breaker: Circuit breaker failing the requests right away after repeated
+                5xx responses or timeouts of the backend. If None, the requests are always sent.
         """
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"max_concurrent_requests must be greater than 0, got {max_concurrent_requests}"
+            )
+
         self.endpoint = endpoint
         self.api_key = api_key
         self.client_name = client_name
@@ -85,30 +264,44 @@ class GraphQLClient:
         self.enable_schema_caching = enable_schema_caching
         self.created_at = time.time()
         self.complexity_consumed = 0
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = rate_limiter
+        self.lazy_bootstrap = lazy_bootstrap
+        self.request_compression_threshold = request_compression_threshold
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.metrics = MetricsRecorder(prefix="kili.graphql", key_tag="operation")
+        if circuit_breaker is not None:
+            # 0 when closed, 1 when half-open, 2 when open
+            self.metrics.add_gauge(
+                "circuit_breaker.state", lambda: list(CircuitState).index(circuit_breaker.state)
+            )
+        if retry_budget is not None:
+            self.metrics.add_gauge(
+                "retry_budget.available_retries",
+                lambda: retry_budget.state().nb_available_retries,
+            )
+            self.metrics.add_gauge(
+                "retry_budget.denied_retries", lambda: retry_budget.state().nb_denied_retries
+            )
         self.graphql_schema_cache_dir = (
             Path(graphql_schema_cache_dir) if graphql_schema_cache_dir else None
         )
 
         self.ws_endpoint = self.endpoint.replace("http", "ws")
 
-        self._gql_transport = RequestsHTTPTransport(
-            url=endpoint,
-            headers=self._get_headers(),
-            timeout=60,
-            verify=verify,
-            retries=10,
-            retry_backoff_factor=0.1,  # last retry will take 0.1*2**10 = 100s
-            retry_status_forcelist=(
-                429,  # 429 Too Many Requests
-                502,  # 502 Bad Gateway
-                503,  # 503 Service Unavailable
-                504,  # 504 Gateway Timeout
-                520,  # Unknown Error: Generic response for an unexpected result.
-                521,  # Web Server Is Down
-                522,  # Connection Timed Out
-            ),
+        self._complexity_lock = threading.Lock()
+        self._schema_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._pending_checks: list[Future] = []
+        self._execute_semaphore = (
+            _execute_lock
+            if max_concurrent_requests == 1
+            else threading.BoundedSemaphore(max_concurrent_requests)
         )
 
+        self._gql_transport = self._build_gql_transport()
+
         if self.enable_schema_caching is True:
             if self.graphql_schema_cache_dir is None:
                 raise ValueError(
@@ -122,40 +315,96 @@ class GraphQLClient:
                 self.graphql_schema_cache_dir / "cache_dir.lock", timeout=15
             )
 
-        self._gql_client = self._initizalize_graphql_client()
+        if lazy_bootstrap:
+            self._gql_client_future = run_in_background(
+                self._initizalize_graphql_client, name="kili-schema-loading"
+            )
+        else:
+            self._gql_client = self._initizalize_graphql_client()
+
+    @property
+    def _gql_client(self) -> Client:
+        """Main gql client, waiting for the schema loaded in background if needed.
+
+        If the schema failed to load in background, it is loaded again from the calling thread,
+        so that the error is raised to the caller.
+        """
+        future = self._gql_client_future
+        if future.done() and future.exception() is not None:
+            with self._schema_lock:
+                if self._gql_client_future is future:
+                    self._gql_client_future = completed_future(self._initizalize_graphql_client())
+            future = self._gql_client_future
+        return future.result()
+
+    @_gql_client.setter
+    def _gql_client(self, gql_client: Client) -> None:
+        self._gql_client_future = completed_future(gql_client)
+
+    def add_pending_check(self, check: Future) -> None:
+        """Add a check running in background, that must succeed before sending requests.
+
+        The requests wait for the check, and raise its exception if it failed.
+        """
+        self._pending_checks.append(check)
+
+    def _wait_for_pending_checks(self) -> None:
+        """Wait for the checks running in background, raising the exception of a failed one."""
+        for check in list(self._pending_checks):
+            check.result()
+            with contextlib.suppress(ValueError):  # removed by a concurrent request
+                self._pending_checks.remove(check)
+
+    def _build_gql_transport(self) -> KiliRequestsHTTPTransport:
+        """Build a transport to the GraphQL endpoint.
+
+        A transport holds a requests session and the headers of the last response,
+        so it must not be shared between threads sending requests concurrently.
+        """
+        return KiliRequestsHTTPTransport(
+            url=self.endpoint,
+            headers=self._get_headers(),
+            timeout=60,
+            verify=self.verify,
+            retries=10,
+            retry_backoff_factor=0.1,  # last retry will take 0.1*2**10 = 100s
+            compression_threshold=self.request_compression_threshold,
+            retry_budget=self.retry_budget,
+            retry_status_forcelist=(
+                429,  # 429 Too Many Requests
+                502,  # 502 Bad Gateway
+                503,  # 503 Service Unavailable
+                504,  # 504 Gateway Timeout
+                520,  # Unknown Error: Generic response for an unexpected result.
+                521,  # Web Server Is Down
+                522,  # Connection Timed Out
+            ),
+        )
 
     def _get_headers(self) -> dict[str, str]:
         """Get the headers."""
+        # the encodings that urllib3 can decode, e.g. brotli and zstd if their packages are installed
         return {
-            "Authorization": f"X-API-Key: {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "apollographql-client-name": self.client_name.value,
-            "apollographql-client-version": __version__,
+            **get_graphql_headers(self.api_key, self.client_name),
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
 
     @staticmethod
     def _get_introspection_args() -> dict[str, bool]:
         """Get the introspection arguments."""
-        return {
-            "descriptions": True,  # descriptions for the schema, types, fields, and arguments
-            "specified_by_url": False,  # https://spec.graphql.org/draft/#sec--specifiedBy
-            "directive_is_repeatable": True,  # include repeatability of directives
-            "schema_description": True,  # include schema description
-            "input_value_deprecation": True,  # request deprecated input fields
-        }
+        return get_introspection_args()
 
     def _initizalize_graphql_client(self) -> Client:
         """Initialize the GraphQL client."""
         if os.environ.get("KILI_SDK_SKIP_CHECKS", None) is not None:
-            return Client(
+            return CachedValidationClient(
                 transport=self._gql_transport,
                 fetch_schema_from_transport=False,
                 introspection_args=self._get_introspection_args(),
             )
 
         if self.enable_schema_caching is False:
-            return Client(
+            return CachedValidationClient(
                 transport=self._gql_transport,
                 fetch_schema_from_transport=True,
                 introspection_args=self._get_introspection_args(),
@@ -165,7 +414,7 @@ class GraphQLClient:
         # and therefore we cannot determine the schema version, so we don't cache the schema
         graphql_schema_path = self._get_graphql_schema_path()
         if graphql_schema_path is None:
-            return Client(
+            return CachedValidationClient(
                 transport=self._gql_transport,
                 fetch_schema_from_transport=True,
                 introspection_args=self._get_introspection_args(),
@@ -180,15 +429,30 @@ class GraphQLClient:
             else:
                 schema_str = graphql_schema_path.read_text(encoding="utf-8")
 
-        return Client(
+            schema = self._load_graphql_schema(graphql_schema_path, schema_str)
+
+        return CachedValidationClient(
             transport=self._gql_transport,
-            schema=schema_str,
+            schema=schema,
             introspection_args=self._get_introspection_args(),
         )
 
+    @staticmethod
+    def _load_graphql_schema(graphql_schema_path: Path, schema_str: str) -> GraphQLSchema:
+        """Load a cached schema, from its compiled version if it is up to date.
+
+        Otherwise, the schema is built from its SDL and compiled for the next loads.
+        """
+        compiled_schema_path = get_compiled_schema_path(graphql_schema_path)
+        schema = load_compiled_schema(compiled_schema_path, schema_str)
+        if schema is None:
+            schema = build_ast_schema(parse(schema_str))
+            save_compiled_schema(compiled_schema_path, schema_str, schema)
+        return schema
+
     def _get_graphql_schema_from_endpoint(self) -> str:
         """Get the GraphQL schema from the endpoint."""
-        with Client(
+        with CachedValidationClient(
             transport=self._gql_transport,
             fetch_schema_from_transport=True,
             introspection_args=self._get_introspection_args(),
@@ -212,6 +476,8 @@ class GraphQLClient:
         with self._cache_dir_lock:
             for file in self.graphql_schema_cache_dir.glob("*.graphql"):
                 file.unlink()
+            for file in self.graphql_schema_cache_dir.glob(f"*{COMPILED_SCHEMA_SUFFIX}"):
+                file.unlink()
 
     def _get_graphql_schema_path(self) -> Optional[Path]:
         """Get the path of the GraphQL schema.
@@ -240,14 +506,46 @@ class GraphQLClient:
             return response_json["version"]
         return None
 
+    def _get_thread_gql_client(self) -> Client:
+        """Get the gql client to use to send a request from the current thread.
+
+        When requests are serialized, the main gql client is used.
+        Otherwise, each thread gets its own gql client and transport, sharing the main client schema.
+        """
+        if self.max_concurrent_requests == 1:
+            return self._gql_client
+
+        main_client = self._gql_client
+        thread_client = getattr(self._thread_local, "gql_client", None)
+        # the main client is replaced when the schema is refreshed
+        if thread_client is not None and self._thread_local.main_client is main_client:
+            return thread_client
+
+        with self._schema_lock:
+            if main_client.fetch_schema_from_transport and main_client.schema is None:
+                # connecting the main client fetches the schema once for all threads
+                with main_client:
+                    pass
+
+        thread_client = CachedValidationClient(
+            transport=self._build_gql_transport(),
+            schema=main_client.schema,
+            fetch_schema_from_transport=False,
+            introspection_args=self._get_introspection_args(),
+        )
+        self._thread_local.gql_client = thread_client
+        self._thread_local.main_client = main_client
+        return thread_client
+
+    @property
+    def last_response_info(self) -> Optional[GraphQLResponseInfo]:
+        """Information about the last response received by the calling thread, if any."""
+        return getattr(self._thread_local, "last_response_info", None)
+
     @classmethod
     def _remove_nullable_inputs(cls, variables: dict) -> dict:
         """Remove nullable inputs from the variables."""
-        for key in ("data", "where", "project", "asset", "label", "issue"):
-            if key in variables and isinstance(variables[key], dict):
-                variables[key] = cls._remove_nullable_inputs(variables[key])
-
-        return {k: v for k, v in variables.items() if v is not None}
+        return remove_nullable_inputs(variables)
 
     def execute(
         self, query: Union[str, DocumentNode], variables: Optional[dict] = None, **kwargs
@@ -259,10 +557,13 @@ class GraphQLClient:
             variables: the payload of the query
             kwargs: additional arguments to pass to the GraphQL client
         """
-        document = query if isinstance(query, DocumentNode) else gql(query)
+        self._wait_for_pending_checks()
+        document = query if isinstance(query, DocumentNode) else parse_query(query)
         variables = self._remove_nullable_inputs(variables) if variables else None
 
         should_retry = kwargs.pop("retry", True)
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
 
         try:
             if should_retry:
@@ -289,70 +590,178 @@ class GraphQLClient:
             context = extract_error_context(str(err.errors))
             raise kili.exceptions.GraphQLError(error=err.errors, context=context) from err
 
-    @retry(
-        reraise=True,  # re-raise the last exception
-        retry=retry_all(
-            retry_if_exception_type(  # error received from server
-                (exceptions.TransportQueryError, exceptions.TransportServerError)
-            ),
-            retry_if_not_exception_message(
-                match=r'.*Variable "(\$\w+)" of required type "(\w+!)" was not provided.*'
-            ),
-            retry_if_not_exception_message(match=r'.*Variable "(\$\w+)" got invalid value .*'),
-            retry_if_not_exception_message(
-                match=r'.*Field "(\w+)" is not defined by type "(\w+)".*'
-            ),
-            retry_any(
-                retry_if_exception_message(match=r".*Invalid request made to Flagsmith API.*"),
-                retry_if_exception_message(match=r".*Failed to fetch data connection.*"),
-                retry_if_exception_message(match=r".*Unauthorized for url.*"),
-            ),
-        ),
-        stop=stop_after_delay(3 * 60),
-        wait=wait_exponential(multiplier=0.5, min=1, max=10),
-    )
+    @retry_graphql_execution
     def _execute_with_retries(
         self, document: DocumentNode, variables: Optional[dict], **kwargs
     ) -> dict[str, Any]:
         return self._raw_execute(document, variables, **kwargs)
 
+    @contextlib.contextmanager
+    def _track_request(self, operation_name: str) -> Iterator[None]:
+        """Check the circuit breaker right before sending a request, and report its outcome.
+
+        The gauges are sent once the outcome is known, whether the request was sent or not.
+        """
+        try:
+            is_probe = (
+                self.circuit_breaker.before_request() if self.circuit_breaker is not None else False
+            )
+        except kili.exceptions.CircuitOpenError:
+            self.metrics.record_rejection(operation_name)
+            self.metrics.send_gauges()
+            raise
+        try:
+            yield
+        except Exception as err:
+            if self.circuit_breaker is not None:
+                if is_backend_failure(err):
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+            raise
+        else:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+        finally:
+            if is_probe and self.circuit_breaker is not None:
+                self.circuit_breaker.release_probe()
+            self.metrics.send_gauges()
+
+    def _record_failed_request(self, operation_name: str, timings: _RequestTimings) -> None:
+        """Record a request that got no GraphQL response in the metrics and the traces."""
+        self.metrics.record_request(
+            operation_name,
+            latency=time.perf_counter() - timings.sent_at,
+            rate_limiter_wait=timings.rate_limiter_wait,
+            lock_wait=timings.lock_wait,
+            error=True,
+        )
+        tracer.record_span(
+            operation_name,
+            "graphql",
+            duration=time.perf_counter() - timings.called_at,
+            rate_limiter_wait=timings.rate_limiter_wait,
+            lock_wait=timings.lock_wait,
+            error=True,
+        )
+
+    def _record_response(  # pylint: disable=too-many-arguments
+        self,
+        operation_name: str,
+        timings: _RequestTimings,
+        complexity: int,
+        headers: Optional[Any],
+        exchange: Optional[HttpExchange],
+        has_data: bool,
+    ) -> None:
+        """Record a GraphQL response in the metrics, the traces and the last response info."""
+        self.metrics.record_request(
+            operation_name,
+            latency=timings.latency,
+            nb_bytes_sent=exchange.nb_bytes_sent if exchange is not None else 0,
+            nb_bytes_received=exchange.nb_bytes_received if exchange is not None else 0,
+            nb_bytes_decoded=exchange.nb_bytes_decoded if exchange is not None else 0,
+            complexity=complexity,
+            nb_retries=exchange.nb_retries if exchange is not None else 0,
+            rate_limiter_wait=timings.rate_limiter_wait,
+            lock_wait=timings.lock_wait,
+            error=not has_data,
+        )
+        tracer.record_span(
+            operation_name,
+            "graphql",
+            duration=time.perf_counter() - timings.called_at,
+            complexity=complexity,
+            rate_limiter_wait=timings.rate_limiter_wait,
+            lock_wait=timings.lock_wait,
+            nb_bytes_received=exchange.nb_bytes_received if exchange is not None else None,
+        )
+        if exchange is not None:
+            self._thread_local.last_response_info = GraphQLResponseInfo(
+                complexity=complexity,
+                nb_bytes=exchange.nb_bytes_decoded,
+                nb_bytes_sent=exchange.nb_bytes_sent,
+                nb_bytes_received=exchange.nb_bytes_received,
+                latency=timings.latency,
+            )
+        else:
+            content_length = headers.get("content-length") if headers else None
+            self._thread_local.last_response_info = GraphQLResponseInfo(
+                complexity=complexity,
+                nb_bytes=int(content_length) if content_length is not None else None,
+                latency=timings.latency,
+            )
+
     def _raw_execute(
         self, document: DocumentNode, variables: Optional[dict], **kwargs
     ) -> dict[str, Any]:
-        _limiter.try_acquire("GraphQLClient.execute")
+        rate_limiter = self.rate_limiter or _limiter
+        operation_name = get_operation_name(document)
+        called_at = time.perf_counter()
+        rate_limiter.try_acquire(operation_name)
+        rate_limiter_wait = time.perf_counter() - called_at
         log_context = LogContext()
         log_context.set_client_name(self.client_name)
-        with _execute_lock:
-            res = self._gql_client.execute(
-                document=document,
-                variable_values=variables,
-                get_execution_result=True,
-                extra_args={
-                    "headers": {
-                        **(self._gql_transport.headers or {}),
-                        **log_context,
-                    }
-                },
-                **kwargs,
+        gql_client = self._get_thread_gql_client()
+        lock_requested_at = time.perf_counter()
+        with self._execute_semaphore, self._track_request(operation_name):
+            sent_at = time.perf_counter()
+            timings = _RequestTimings(
+                called_at=called_at,
+                rate_limiter_wait=rate_limiter_wait,
+                lock_wait=sent_at - lock_requested_at,
+                sent_at=sent_at,
             )
-
-            extensions = getattr(res, "extensions", None)
-            if isinstance(extensions, dict):
-                for item in extensions.get("deprecations") or []:
-                    warnings.warn(
-                        f"[Kili SDK] Deprecated GraphQL field used: "
-                        f"{item.get('path')} – {item.get('reason')}"
-                    )
-
-            transport = self._gql_client.transport
-            if transport:
-                headers = transport.response_headers  # pyright: ignore[reportAttributeAccessIssue]
-                returned_complexity = int(headers.get("x-complexity", 0)) if headers else 0
-                self.complexity_consumed += returned_complexity
-
-            if res.data is None:
-                raise kili.exceptions.GraphQLError(
-                    error="GraphQL response contains no data",
+            try:
+                res = gql_client.execute(
+                    document=document,
+                    variable_values=variables,
+                    get_execution_result=True,
+                    extra_args={
+                        "headers": {
+                            **(self._gql_transport.headers or {}),
+                            **log_context,
+                        }
+                    },
+                    **kwargs,
+                )
+            except Exception:
+                self._record_failed_request(operation_name, timings)
+                raise
+            timings = timings._replace(latency=time.perf_counter() - sent_at)
+
+            transport = gql_client.transport
+            headers = (
+                transport.response_headers  # pyright: ignore[reportAttributeAccessIssue]
+                if transport
+                else None
+            )
+            exchange = getattr(transport, "last_exchange", None)
+
+        extensions = getattr(res, "extensions", None)
+        if isinstance(extensions, dict):
+            for item in extensions.get("deprecations") or []:
+                warnings.warn(
+                    f"[Kili SDK] Deprecated GraphQL field used: "
+                    f"{item.get('path')} – {item.get('reason')}"
                 )
 
-            return res.data
+        returned_complexity = int(headers.get("x-complexity", 0)) if headers else 0
+        with self._complexity_lock:
+            self.complexity_consumed += returned_complexity
+        rate_limiter.report(operation_name, returned_complexity)
+        self._record_response(
+            operation_name,
+            timings,
+            returned_complexity,
+            headers,
+            exchange if isinstance(exchange, HttpExchange) else None,
+            has_data=res.data is not None,
+        )
+
+        if res.data is None:
+            raise kili.exceptions.GraphQLError(
+                error="GraphQL response contains no data",
+            )
+
+        return res.data
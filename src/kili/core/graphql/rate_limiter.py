@@ -0,0 +1,232 @@
+"""Rate limiters of the requests sent to the GraphQL endpoint."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Optional, Union
+
+from filelock import FileLock
+from pyrate_limiter import Duration, LimiterDelayException, Rate, RateItem
+from pyrate_limiter.limiter import Limiter
+
+from kili.core.constants import MAX_CALLS_PER_MINUTE
+
+DEFAULT_SHARED_RATE_LIMITER_DIR = Path.home() / ".cache" / "kili" / "rate_limiter"
+
+
+class RateLimiter(ABC):
+    """Interface of the rate limiters of the GraphQL requests.
+
+    `try_acquire` is called before sending a request, and blocks until the request can be sent.
+    `report` is called with the complexity returned by the backend once the response is received.
+    """
+
+    @abstractmethod
+    def try_acquire(self, name: str) -> bool:
+        """Wait until a request of the operation can be sent.
+
+        Args:
+            name: Name of the GraphQL operation.
+        """
+
+    def report(self, name: str, complexity: int) -> None:
+        """Report the complexity of a response of the operation.
+
+        Args:
+            name: Name of the GraphQL operation.
+            complexity: Complexity returned by the backend in the `x-complexity` header.
+        """
+
+
+class CallRateLimiter(RateLimiter):
+    """Rate limiter counting the calls, whatever their complexity."""
+
+    def __init__(
+        self,
+        max_calls: int = MAX_CALLS_PER_MINUTE,
+        period: float = 60,
+        max_delay: float = 120,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_calls: Maximum number of calls during a period.
+            period: Duration of the period in seconds.
+            max_delay: Maximum time to wait for a call, in seconds.
+        """
+        self._limiter = Limiter(
+            Rate(max_calls, int(period * Duration.SECOND)), max_delay=int(max_delay * 1000)
+        )
+
+    def try_acquire(self, name: str) -> bool:
+        """Wait until a request of the operation can be sent."""
+        acquired = self._limiter.try_acquire(name)
+        # the in-memory bucket of the limiter is synchronous
+        assert isinstance(acquired, bool)
+        return acquired
+
+
+class SharedCallRateLimiter(RateLimiter):
+    """Rate limiter counting the calls of all the processes of the host to an endpoint.
+
+    The calls are recorded in a SQLite database, whose accesses are serialized by a file lock,
+    so that the worker processes sharing the same endpoint and API key share the same budget
+    of calls. The database is named after a hash of the endpoint and of the API key,
+    so that the clients of other users or of other endpoints have their own budget.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        max_calls: int = MAX_CALLS_PER_MINUTE,
+        period: float = 60,
+        max_delay: float = 120,
+        cache_dir: Union[str, Path] = DEFAULT_SHARED_RATE_LIMITER_DIR,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            endpoint: Kili API endpoint the calls are sent to.
+            api_key: Kili API key the calls are sent with.
+            max_calls: Maximum number of calls during a period.
+            period: Duration of the period in seconds.
+            max_delay: Maximum time to wait for a call, in seconds.
+            cache_dir: Directory of the SQLite databases shared by the processes.
+        """
+        key_hash = hashlib.sha256(f"{endpoint}\n{api_key}".encode()).hexdigest()
+        self.path = Path(cache_dir) / f"{key_hash}.sqlite"
+        self.max_calls = max_calls
+        self.period = period
+        self.max_delay = max_delay
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_lock = FileLock(f"{self.path}.lock")
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS calls (name TEXT, timestamp REAL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS calls_timestamp ON calls (timestamp)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connect to the database, holding the file lock until the transaction ends."""
+        with self._file_lock:
+            with closing(sqlite3.connect(self.path)) as connection:
+                with connection:
+                    yield connection
+
+    def _try_record_call(self, name: str) -> float:
+        """Record a call if the budget allows it, else return the time to wait before retrying."""
+        with self._connect() as connection:
+            # the wall clock is used since the monotonic clock is not shared between processes
+            now = time.time()
+            connection.execute("DELETE FROM calls WHERE timestamp <= ?", (now - self.period,))
+            nb_calls, oldest_call = connection.execute(
+                "SELECT COUNT(*), MIN(timestamp) FROM calls"
+            ).fetchone()
+            if nb_calls < self.max_calls:
+                connection.execute("INSERT INTO calls VALUES (?, ?)", (name, now))
+                return 0
+            return oldest_call + self.period - now
+
+    def try_acquire(self, name: str) -> bool:
+        """Wait until a request of the operation can be sent."""
+        waited = 0.0
+        while True:
+            delay = self._try_record_call(name)
+            if delay <= 0:
+                return True
+            if waited + delay > self.max_delay:
+                raise LimiterDelayException(
+                    RateItem(name, int(time.time() * 1000)),
+                    Rate(self.max_calls, int(self.period * Duration.SECOND)),
+                    int((waited + delay) * 1000),
+                    int(self.max_delay * 1000),
+                )
+            time.sleep(delay)
+            waited += delay
+
+
+class ComplexityRateLimiter(RateLimiter):
+    """Token bucket rate limiter budgeting the complexity of the requests.
+
+    The bucket is refilled with `max_complexity` tokens per period. Before a request is sent,
+    the complexity estimated for its operation is withdrawn from the bucket, waiting for the
+    bucket to be refilled if needed. The estimates are learned from the complexity reported
+    by the backend, and the bucket is corrected with the actual complexity of each response.
+
+    The number of calls per period stays limited by a `CallRateLimiter`.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        max_complexity: int,
+        period: float = 60,
+        max_calls: Optional[int] = MAX_CALLS_PER_MINUTE,
+        default_complexity: int = 1,
+        smoothing: float = 0.3,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_complexity: Maximum complexity consumed during a period.
+            period: Duration of the period in seconds.
+            max_calls: Maximum number of calls during a period, if limited.
+            default_complexity: Complexity assumed for an operation never sent before.
+            smoothing: Weight of the last response in the complexity estimate of an operation.
+        """
+        if max_complexity <= 0:
+            raise ValueError(f"max_complexity must be greater than 0, got {max_complexity}")
+
+        self.max_complexity = max_complexity
+        self.period = period
+        self.default_complexity = default_complexity
+        self.smoothing = smoothing
+        self._call_limiter = CallRateLimiter(max_calls, period) if max_calls else None
+        self._lock = threading.Lock()
+        self._tokens = float(max_complexity)
+        self._last_refill = time.monotonic()
+        self._estimates: dict[str, float] = {}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        refill = (now - self._last_refill) * self.max_complexity / self.period
+        self._tokens = min(self.max_complexity, self._tokens + refill)
+        self._last_refill = now
+
+    def estimate(self, name: str) -> float:
+        """Get the complexity estimated for a request of the operation."""
+        with self._lock:
+            return min(self._estimates.get(name, self.default_complexity), self.max_complexity)
+
+    def try_acquire(self, name: str) -> bool:
+        """Wait until the bucket holds the complexity estimated for the operation."""
+        if self._call_limiter is not None:
+            self._call_limiter.try_acquire(name)
+
+        estimate = self.estimate(name)
+        with self._lock:
+            self._refill()
+            # the tokens are reserved right away, so that concurrent requests wait in turn
+            self._tokens -= estimate
+            delay = -self._tokens * self.period / self.max_complexity if self._tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def report(self, name: str, complexity: int) -> None:
+        """Correct the bucket with the actual complexity, and update the estimate."""
+        with self._lock:
+            estimate = min(self._estimates.get(name, self.default_complexity), self.max_complexity)
+            self._refill()
+            self._tokens -= complexity - estimate
+            self._estimates[name] = (
+                complexity
+                if name not in self._estimates
+                else (1 - self.smoothing) * self._estimates[name] + self.smoothing * complexity
+            )
@@ -0,0 +1,129 @@
+"""Budget limiting the retries of the requests sent to the GraphQL endpoint."""
+
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+
+class RetryBudgetState(NamedTuple):
+    """Requests and retries counted by a retry budget over its window."""
+
+    nb_requests: int
+    nb_retries: int
+    # retries refused since the creation of the budget
+    nb_denied_retries: int
+    # retries that can still be sent in the window
+    nb_available_retries: int
+
+
+class RetryBudget:
+    """Thread-safe budget of retries, as a ratio of the requests sent recently.
+
+    During an incident of the backend, every request fails and would be retried
+    many times, piling up the work of the clients. The budget only allows retries
+    up to a fraction of the requests sent during the last `window` seconds,
+    so that the failing requests fail fast once the budget is spent.
+    It can be shared between the clients of a process.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60) -> None:
+        """Initialize the retry budget.
+
+        Args:
+            ratio: Maximum number of retries per request sent during the window.
+            min_retries: Number of retries allowed during the window whatever the number
+                of requests, so that the clients sending few requests can still retry them.
+            window: Duration of the sliding window, in seconds.
+        """
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise ValueError(
+                "ratio and min_retries must be positive, and window strictly positive, got"
+                f" ratio={ratio}, min_retries={min_retries}, window={window}"
+            )
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._nb_denied_retries = 0
+        self._lock = threading.Lock()
+
+    def _forget_old_events(self, now: float) -> None:
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def _get_nb_available_retries(self) -> int:
+        nb_allowed_retries = max(self.min_retries, int(self.ratio * len(self._requests)))
+        return max(0, nb_allowed_retries - len(self._retries))
+
+    def record_request(self) -> None:
+        """Count a request sent for the first time."""
+        now = time.monotonic()
+        with self._lock:
+            self._forget_old_events(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """Spend a retry of the budget, if any is left.
+
+        Returns:
+            Whether the failed request can be retried.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._forget_old_events(now)
+            if self._get_nb_available_retries() == 0:
+                self._nb_denied_retries += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def state(self) -> RetryBudgetState:
+        """Get the requests and retries counted over the window."""
+        with self._lock:
+            self._forget_old_events(time.monotonic())
+            return RetryBudgetState(
+                nb_requests=len(self._requests),
+                nb_retries=len(self._retries),
+                nb_denied_retries=self._nb_denied_retries,
+                nb_available_retries=self._get_nb_available_retries(),
+            )
+
+
+class BudgetedRetry(Retry):
+    """Retry policy of urllib3 spending a retry budget, and giving up once it is spent."""
+
+    def __init__(self, *args, retry_budget: Optional[RetryBudget] = None, **kwargs) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            args: Arguments of `Retry`.
+            retry_budget: Budget spent by the retries. If None, the retries are not limited.
+            kwargs: Keyword arguments of `Retry`.
+        """
+        super().__init__(*args, **kwargs)
+        self.retry_budget = retry_budget
+
+    def new(self, **kw) -> "BudgetedRetry":
+        """Copy the retry policy, keeping its budget."""
+        new_retry = super().new(**kw)
+        new_retry.retry_budget = self.retry_budget
+        return new_retry
+
+    def increment(
+        self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None
+    ):
+        """Count a retry, raising a `MaxRetryError` if the budget is spent."""
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.retry_budget is not None and not self.retry_budget.try_acquire_retry():
+            raise MaxRetryError(
+                _pool,  # pyright: ignore[reportArgumentType]
+                url or "",
+                error or ResponseError("the retry budget is spent"),
+            )
+        return new_retry
@@ -0,0 +1,91 @@
+"""Precompiled GraphQL schemas stored next to the cached SDL schemas.
+
+Building a schema from its SDL text requires parsing and validating the whole SDL,
+which is slow for the Kili schema. The compiled schema stores the introspection result
+of the built schema instead, from which the schema is rebuilt without validation.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import graphql
+from graphql import GraphQLSchema, build_client_schema, introspection_from_schema
+
+logger = logging.getLogger(__name__)
+
+# to change whenever the content of the compiled schemas changes
+COMPILED_SCHEMA_FORMAT_VERSION = 1
+COMPILED_SCHEMA_SUFFIX = ".schema.json"
+
+
+def get_compiled_schema_path(graphql_schema_path: Path) -> Path:
+    """Get the path of the compiled schema of a cached SDL schema."""
+    return graphql_schema_path.with_suffix(COMPILED_SCHEMA_SUFFIX)
+
+
+def _get_compiled_schema_header(schema_str: str) -> dict[str, object]:
+    """Get the header identifying the SDL schema and the format of a compiled schema."""
+    return {
+        "format_version": COMPILED_SCHEMA_FORMAT_VERSION,
+        "graphql_core_version": graphql.__version__,
+        "sdl_sha256": hashlib.sha256(schema_str.encode("utf-8")).hexdigest(),
+    }
+
+
+def load_compiled_schema(compiled_schema_path: Path, schema_str: str) -> Optional[GraphQLSchema]:
+    """Load a compiled schema.
+
+    Args:
+        compiled_schema_path: Path of the compiled schema.
+        schema_str: SDL of the schema, that the compiled schema must have been built from.
+
+    Returns:
+        The schema, or None if the compiled schema is missing, unreadable or outdated.
+    """
+    try:
+        compiled_schema = json.loads(compiled_schema_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(compiled_schema, dict)
+        or compiled_schema.get("header") != _get_compiled_schema_header(schema_str)
+        or "introspection" not in compiled_schema
+    ):
+        return None
+
+    # the schema was validated when it was compiled
+    return build_client_schema(compiled_schema["introspection"], assume_valid=True)
+
+
+def save_compiled_schema(
+    compiled_schema_path: Path, schema_str: str, schema: GraphQLSchema
+) -> None:
+    """Save the compiled schema of a schema built from its SDL.
+
+    The compiled schema is written to a temporary file first, so that it is never read
+    partially written. Failing to write it is not an error, since it only speeds up loading.
+    """
+    compiled_schema = {
+        "header": _get_compiled_schema_header(schema_str),
+        "introspection": introspection_from_schema(
+            schema,
+            descriptions=True,
+            directive_is_repeatable=True,
+            schema_description=True,
+            input_value_deprecation=True,
+        ),
+    }
+    tmp_path = compiled_schema_path.with_name(f"{compiled_schema_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(compiled_schema), encoding="utf-8")
+        os.replace(tmp_path, compiled_schema_path)
+    except OSError as err:
+        logger.debug("Could not save the compiled GraphQL schema: %s", err)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,127 @@
+"""Transport of the synchronous GraphQL client."""
+
+import gzip
+from typing import Any, NamedTuple, Optional
+
+import requests
+from gql.transport.requests import RequestsHTTPTransport
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from kili.adapters.http_client import (
+    JsonCodecSession,
+    get_nb_bytes_received,
+    get_nb_bytes_sent,
+    get_nb_retries,
+)
+from kili.core.graphql.retry_budget import BudgetedRetry, RetryBudget
+
+# compression level of the request bodies, favoring speed since the bodies are sent right away
+REQUEST_COMPRESSION_LEVEL = 5
+
+
+class HttpExchange(NamedTuple):
+    """Sizes of a request and of its response."""
+
+    # sizes on the wire, i.e. compressed if the body was compressed
+    nb_bytes_sent: int
+    nb_bytes_received: int
+    # size of the decoded response body
+    nb_bytes_decoded: int
+    # number of retries of the request by urllib3, e.g. after 429 or 5xx responses
+    nb_retries: int = 0
+
+
+class GraphQLSession(JsonCodecSession):
+    """Session of the GraphQL transport, compressing the large request bodies.
+
+    The sizes of the last request and of its response are kept in `last_exchange`.
+    """
+
+    def __init__(self, compression_threshold: Optional[int] = None) -> None:
+        """Initialize the session.
+
+        Args:
+            compression_threshold: Size in bytes from which the request bodies are compressed
+                with gzip. If None, the request bodies are not compressed.
+        """
+        super().__init__()
+        self.compression_threshold = compression_threshold
+        self.last_exchange: Optional[HttpExchange] = None
+
+    def encode_json_body(self, payload: Any, headers: CaseInsensitiveDict) -> bytes:
+        """Encode the JSON body of a request, compressing it if it is large enough."""
+        body = super().encode_json_body(payload, headers)
+        if self.compression_threshold is not None and len(body) >= self.compression_threshold:
+            body = gzip.compress(body, compresslevel=REQUEST_COMPRESSION_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        return body
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:  # type: ignore[override]
+        """Send a request, and keep the sizes of the request and of its response."""
+        response = super().request(method, url, *args, **kwargs)
+        self.last_exchange = HttpExchange(
+            nb_bytes_sent=get_nb_bytes_sent(response.request),
+            nb_bytes_received=get_nb_bytes_received(response) or len(response.content),
+            nb_bytes_decoded=len(response.content),
+            nb_retries=get_nb_retries(response),
+        )
+        return response
+
+
+class KiliRequestsHTTPTransport(RequestsHTTPTransport):
+    """Requests transport sending its requests with a `GraphQLSession`.
+
+    The request and response bodies go through the JSON codec of the SDK, and the sizes
+    of the last request and of its response are kept in `last_exchange`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        compression_threshold: Optional[int] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            args: Arguments of `RequestsHTTPTransport`.
+            compression_threshold: Size in bytes from which the request bodies are compressed
+                with gzip. If None, the request bodies are not compressed.
+            retry_budget: Budget spent by the retries of the transport. If None, the requests
+                are retried up to `retries` times.
+            kwargs: Keyword arguments of `RequestsHTTPTransport`.
+        """
+        super().__init__(*args, **kwargs)
+        self.compression_threshold = compression_threshold
+        self.retry_budget = retry_budget
+        self.last_exchange: Optional[HttpExchange] = None
+
+    def connect(self) -> None:
+        """Create the session of the transport, with the retry adapters of gql."""
+        super().connect()
+        session = GraphQLSession(compression_threshold=self.compression_threshold)
+        for prefix, adapter in self.session.adapters.items():  # pyright: ignore[reportOptionalMemberAccess]
+            session.mount(prefix, adapter)
+        if self.retries > 0 and self.retry_budget is not None:
+            adapter = HTTPAdapter(
+                max_retries=BudgetedRetry(
+                    total=self.retries,
+                    backoff_factor=self.retry_backoff_factor,
+                    status_forcelist=self.retry_status_forcelist,
+                    allowed_methods=None,
+                    retry_budget=self.retry_budget,
+                )
+            )
+            for prefix in "http://", "https://":
+                session.mount(prefix, adapter)
+        self.session = session
+
+    def execute(self, *args, **kwargs):
+        """Execute a request, keeping the sizes of the request and of its response."""
+        self.last_exchange = None
+        result = super().execute(*args, **kwargs)
+        # the session is closed and dropped with the transport, after the request
+        self.last_exchange = getattr(self.session, "last_exchange", None)
+        return result
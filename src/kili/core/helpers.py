@@ -8,7 +8,6 @@ import os
 import re
 import warnings
 from collections.abc import Callable
-from json import dumps, loads
 from typing import Any, Optional, TypeVar, Union, get_args, get_origin
 
 import pyparsing as pp
@@ -16,7 +15,10 @@ import requests
 import tenacity
 
 from kili.adapters.http_client import HttpClient
+from kili.adapters.json_blob_cache import get_json_from_url
 from kili.core.constants import MIME_EXTENSIONS_FOR_IV2
+from kili.core.utils import json_codec
+from kili.core.utils.lazy_json import LazyJsonObject, is_json_object_string
 from kili.log.logging import logger
 
 T = TypeVar("T")
@@ -73,7 +75,7 @@ def is_url(path: object):
     return isinstance(path, str) and re.match(r"^(http://|https://)", path.lower())
 
 
-def __format_json_dict(result: dict, http_client: HttpClient) -> dict:
+def __format_json_dict(result: dict, http_client: HttpClient, lazy: bool = False) -> dict:
     """Parse a dictionary inside the result of a graphQL query to format json fields.
 
     If json fields (i.e "jsonInterface", "jsonMetadata" and "jsonResponse")
@@ -84,6 +86,8 @@ def __format_json_dict(result: dict, http_client: HttpClient) -> dict:
     Args:
         result: a dictionary included in the result of a GraphQL query
         http_client: http client to use for the query
+        lazy: whether the json objects given as strings are parsed on first access.
+            The strings not looking like whole json objects are still parsed right away.
     """
     for key, value in result.items():
         if key in ["jsonInterface", "jsonMetadata", "jsonResponse"]:  # TODO: also parse jsonContent
@@ -92,15 +96,17 @@ def __format_json_dict(result: dict, http_client: HttpClient) -> dict:
             elif isinstance(value, str):
                 try:
                     if is_url(value):
-                        result[key] = http_client.get(value, timeout=30).json()
+                        result[key] = get_json_from_url(http_client, value, timeout=30)
+                    elif lazy and is_json_object_string(value):
+                        result[key] = LazyJsonObject(value)
                     else:
-                        result[key] = loads(value)
+                        result[key] = json_codec.loads(value)
                 except Exception as exception:
                     raise ValueError(
                         "Json Metadata / json response / json interface should be valid jsons"
                     ) from exception
         else:
-            result[key] = format_json(value, http_client)
+            result[key] = format_json(value, http_client, lazy)
     return result
 
 
@@ -108,20 +114,22 @@ D = TypeVar("D")
 
 
 def format_json(
-    result: Union[None, list, dict, D], http_client: HttpClient
+    result: Union[None, list, dict, D], http_client: HttpClient, lazy: bool = False
 ) -> Union[None, list, dict, D]:
     """Recusively parse the result of a GraphQL query in order to get json fields as a dictionary.
 
     Args:
         result: result of a GraphQL query
         http_client: http client to use for the query
+        lazy: whether the json objects given as strings are parsed on first access,
+            in which case they are `LazyJsonObject` mappings
     """
     if result is None:
         return result
     if isinstance(result, list):
-        return [format_json(elem, http_client) for elem in result]
+        return [format_json(elem, http_client, lazy) for elem in result]
     if isinstance(result, dict):
-        return __format_json_dict(result, http_client)
+        return __format_json_dict(result, http_client, lazy)
     return result
 
 
@@ -174,7 +182,7 @@ def format_metadata(metadata: object):
     if isinstance(metadata, str):
         return metadata
     if isinstance(metadata, (dict, list)):
-        return dumps(metadata)
+        return json_codec.dumps(metadata)
     raise TypeError(
         f"Metadata {metadata} of type {type(metadata)} must either be None,"
         " a string a list or a dict."
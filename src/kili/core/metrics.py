@@ -0,0 +1,207 @@
+"""Metrics of the requests sent by the SDK.
+
+The requests are aggregated by key, e.g. the GraphQL operation name or the HTTP host.
+Each measure is also sent to the sinks, callables with the signature of the metric
+functions of StatsD or Prometheus clients: `sink(metric_name, value, tags)`.
+
+Examples:
+    >>> kili.graphql_client.metrics.add_sink(
+    ...     lambda name, value, tags: statsd.histogram(name, value, tags=tags)
+    ... )
+    >>> kili.graphql_client.metrics.snapshot()["countAssets"].latency_histogram
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# upper bounds of the buckets of the latency histograms, in seconds
+# the last bucket of the histograms counts the latencies above the last bound
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+MetricsSink = Callable[[str, float, dict[str, str]], None]
+
+
+class RequestMetrics(NamedTuple):
+    """Metrics of the requests of one key, e.g. one GraphQL operation or one HTTP host."""
+
+    nb_requests: int = 0
+    nb_errors: int = 0
+    nb_retries: int = 0
+    # requests failed without being sent, e.g. by an open circuit breaker
+    nb_rejected: int = 0
+    # in seconds
+    latency_total: float = 0.0
+    # number of requests per bucket of LATENCY_BUCKETS, plus the requests above the last bound
+    latency_histogram: tuple[int, ...] = (0,) * (len(LATENCY_BUCKETS) + 1)
+    # on the wire, i.e. compressed if the bodies were compressed
+    nb_bytes_sent: int = 0
+    nb_bytes_received: int = 0
+    # size of the decoded response bodies, to measure the gain of the compression
+    nb_bytes_decoded: int = 0
+    complexity: int = 0
+    # time spent waiting for the rate limiter and for the lock limiting the concurrent requests
+    rate_limiter_wait: float = 0.0
+    lock_wait: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean latency of the requests, in seconds."""
+        return self.latency_total / self.nb_requests if self.nb_requests else 0.0
+
+
+class MetricsRecorder:
+    """Thread-safe recorder of the metrics of requests, aggregated by key."""
+
+    def __init__(self, prefix: str, key_tag: str) -> None:
+        """Initialize the recorder.
+
+        Args:
+            prefix: Prefix of the names of the metrics sent to the sinks, e.g. `kili.graphql`.
+            key_tag: Name of the tag holding the key in the metrics sent to the sinks,
+                e.g. `operation`.
+        """
+        self.prefix = prefix
+        self.key_tag = key_tag
+        self._metrics: dict[str, RequestMetrics] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+        self._sinks: list[MetricsSink] = []
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        """Add a sink, called with each measure as `sink(metric_name, value, tags)`.
+
+        The sinks are called from the threads sending the requests, so they must be fast.
+        Their errors are logged and ignored.
+        """
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        """Remove a sink."""
+        self._sinks.remove(sink)
+
+    def snapshot(self) -> dict[str, RequestMetrics]:
+        """Get the metrics aggregated so far, by key."""
+        with self._lock:
+            return dict(self._metrics)
+
+    def add_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Add a gauge, not aggregated by key, e.g. the state of a circuit breaker.
+
+        Args:
+            name: Name of the gauge.
+            read: Function returning the current value of the gauge.
+        """
+        with self._lock:
+            self._gauges[name] = read
+
+    def gauges(self) -> dict[str, float]:
+        """Get the current values of the gauges."""
+        with self._lock:
+            gauges = dict(self._gauges)
+        return {name: read() for name, read in gauges.items()}
+
+    def send_gauges(self) -> None:
+        """Send the current values of the gauges to the sinks."""
+        if self._sinks and self._gauges:
+            self._send(None, self.gauges())
+
+    def reset(self) -> None:
+        """Forget the metrics aggregated so far."""
+        with self._lock:
+            self._metrics.clear()
+
+    def record_request(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        latency: float,
+        nb_bytes_sent: int = 0,
+        nb_bytes_received: int = 0,
+        nb_bytes_decoded: int = 0,
+        complexity: int = 0,
+        nb_retries: int = 0,
+        rate_limiter_wait: float = 0.0,
+        lock_wait: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        """Record a request.
+
+        Args:
+            key: Key of the request, e.g. its GraphQL operation name or its HTTP host.
+            latency: Duration of the request, in seconds.
+            nb_bytes_sent: Size of the request body on the wire.
+            nb_bytes_received: Size of the response body on the wire.
+            nb_bytes_decoded: Size of the decoded response body.
+            complexity: Complexity of the request reported by the backend.
+            nb_retries: Number of retries of the request by the transport.
+            rate_limiter_wait: Time spent waiting for the rate limiter, in seconds.
+            lock_wait: Time spent waiting for the lock limiting the concurrent requests.
+            error: Whether the request failed.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, latency)
+        with self._lock:
+            metrics = self._metrics.get(key, RequestMetrics())
+            histogram = list(metrics.latency_histogram)
+            histogram[bucket] += 1
+            self._metrics[key] = RequestMetrics(
+                nb_requests=metrics.nb_requests + 1,
+                nb_errors=metrics.nb_errors + int(error),
+                nb_retries=metrics.nb_retries + nb_retries,
+                nb_rejected=metrics.nb_rejected,
+                latency_total=metrics.latency_total + latency,
+                latency_histogram=tuple(histogram),
+                nb_bytes_sent=metrics.nb_bytes_sent + nb_bytes_sent,
+                nb_bytes_received=metrics.nb_bytes_received + nb_bytes_received,
+                nb_bytes_decoded=metrics.nb_bytes_decoded + nb_bytes_decoded,
+                complexity=metrics.complexity + complexity,
+                rate_limiter_wait=metrics.rate_limiter_wait + rate_limiter_wait,
+                lock_wait=metrics.lock_wait + lock_wait,
+            )
+
+        if self._sinks:
+            self._send(
+                key,
+                {
+                    "requests": 1,
+                    "errors": int(error),
+                    "retries": nb_retries,
+                    "latency": latency,
+                    "bytes_sent": nb_bytes_sent,
+                    "bytes_received": nb_bytes_received,
+                    "bytes_decoded": nb_bytes_decoded,
+                    "complexity": complexity,
+                    "rate_limiter_wait": rate_limiter_wait,
+                    "lock_wait": lock_wait,
+                },
+            )
+
+    def record_retry(self, key: str) -> None:
+        """Record a retry of a failed request by the caller, outside of the transport."""
+        with self._lock:
+            metrics = self._metrics.get(key, RequestMetrics())
+            self._metrics[key] = metrics._replace(nb_retries=metrics.nb_retries + 1)
+
+        if self._sinks:
+            self._send(key, {"retries": 1})
+
+    def record_rejection(self, key: str) -> None:
+        """Record a request failed without being sent."""
+        with self._lock:
+            metrics = self._metrics.get(key, RequestMetrics())
+            self._metrics[key] = metrics._replace(nb_rejected=metrics.nb_rejected + 1)
+
+        if self._sinks:
+            self._send(key, {"rejected": 1})
+
+    def _send(self, key: Optional[str], values: dict[str, float]) -> None:
+        tags = {self.key_tag: key} if key is not None else {}
+        for sink in list(self._sinks):
+            for name, value in values.items():
+                try:
+                    sink(f"{self.prefix}.{name}", value, tags)
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    logger.debug("The metrics sink %s failed: %s", sink, err)
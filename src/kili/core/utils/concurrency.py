@@ -0,0 +1,56 @@
+"""Utils to run work in background threads."""
+
+import contextvars
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def run_in_background(function: Callable[[], T], name: str) -> "Future[T]":
+    """Run a function in a daemon thread, in a copy of the current context.
+
+    The thread does not prevent the interpreter from exiting, so that short-lived
+    processes do not wait for work whose result is never needed.
+
+    Args:
+        function: Function to run, without arguments.
+        name: Name of the thread.
+
+    Returns:
+        A future holding the result of the function, or the exception it raised.
+    """
+    future: "Future[T]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(function())
+        except BaseException as err:  # pylint: disable=broad-exception-caught
+            future.set_exception(err)
+
+    threading.Thread(
+        target=contextvars.copy_context().run, args=(run,), name=name, daemon=True
+    ).start()
+    return future
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool running each task in a copy of the context of the thread submitting it.
+
+    The context variables, e.g. the current span of the tracer, are then seen by the tasks.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Submit a task, run in a copy of the current context."""
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def completed_future(result: T) -> "Future[T]":
+    """Get a future already holding its result."""
+    future: "Future[T]" = Future()
+    future.set_result(result)
+    return future
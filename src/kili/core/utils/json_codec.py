@@ -0,0 +1,200 @@
+"""JSON codec of the SDK, backed by orjson when it is installed.
+
+The functions have the signature and the output of the `json` functions of the standard library,
+and fall back to them whenever orjson cannot produce the same output.
+Install with `pip install kili[fast-json]` to use orjson.
+
+orjson writes the floats that the standard library writes with an exponent differently,
+e.g. `1e16` instead of `1e+16` and `0.00001` instead of `1e-05`, and the non-finite floats
+as `null`. The objects with such floats are encoded by the standard library, so that the output
+is the same byte for byte.
+"""
+
+import json
+import math
+import re
+from collections.abc import Iterable
+from typing import IO, Any, Optional, Union
+
+orjson_installed = True
+try:
+    import orjson
+except ImportError:
+    orjson_installed = False
+
+COMPACT_SEPARATORS = (",", ":")
+_INDENT_SEPARATORS = (",", ": ")
+
+# characters escaped by the standard library when ensure_ascii is True
+# the control characters are escaped by orjson too
+_NON_ASCII_CHARACTERS = re.compile(r"[^\x00-\x7e]")
+_LEADING_SPACES = re.compile(r"^ +", re.MULTILINE)
+# floats written by orjson with an exponent or with leading zeros, where the standard library
+# writes an exponent, e.g. `1e16` or `0.00001`
+_ORJSON_FLOAT_WITHOUT_REPR = re.compile(rb"\de-?\d|0\.0000")
+# the standard library writes the floats out of this range with an exponent
+_MIN_FLOAT_WITHOUT_EXPONENT = 1e-4
+_MAX_FLOAT_WITHOUT_EXPONENT = 1e16
+
+
+def _escape_non_ascii_character(match: "re.Match[str]") -> str:
+    code_point = ord(match.group(0))
+    if code_point < 0x10000:
+        return f"\\u{code_point:04x}"
+    code_point -= 0x10000
+    high_surrogate = 0xD800 | (code_point >> 10)
+    low_surrogate = 0xDC00 | (code_point & 0x3FF)
+    return f"\\u{high_surrogate:04x}\\u{low_surrogate:04x}"
+
+
+def _contains_float_written_differently(obj: Any) -> bool:
+    """Whether the object has floats that orjson writes unlike the standard library."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj) or (
+            obj != 0 and not _MIN_FLOAT_WITHOUT_EXPONENT <= abs(obj) < _MAX_FLOAT_WITHOUT_EXPONENT
+        )
+    if isinstance(obj, dict):
+        return any(_contains_float_written_differently(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_float_written_differently(item) for item in obj)
+    return False
+
+
+def _dumps_with_orjson(
+    obj: Any,
+    indent: Optional[int],
+    sort_keys: bool,
+    separators: Optional[tuple[str, str]],
+    ensure_ascii: bool,
+) -> Optional[str]:
+    """Encode an object with orjson, or return None if orjson cannot match the standard library."""
+    option = orjson.OPT_SORT_KEYS if sort_keys else 0
+    if indent is None:
+        if separators != COMPACT_SEPARATORS:
+            return None
+    elif isinstance(indent, int) and indent > 0 and separators in (None, _INDENT_SEPARATORS):
+        option |= orjson.OPT_INDENT_2
+    else:
+        return None
+
+    try:
+        # the datetimes and dataclasses are not serializable by the standard library
+        encoded = orjson.dumps(
+            obj, option=option | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+    except TypeError:
+        # e.g. non-string keys or integers larger than 64 bits, that the standard library supports
+        return None
+    if (
+        b"null" in encoded or _ORJSON_FLOAT_WITHOUT_REPR.search(encoded) is not None
+    ) and _contains_float_written_differently(obj):
+        # e.g. the non-finite floats are encoded as null, instead of NaN or Infinity
+        return None
+
+    result = encoded.decode("utf-8")
+    if indent is not None and indent != 2:
+        # JSON strings cannot contain line breaks, so the leading spaces are indentation only
+        result = _LEADING_SPACES.sub(
+            lambda match: " " * (len(match.group(0)) // 2 * indent), result
+        )
+    if ensure_ascii and _NON_ASCII_CHARACTERS.search(result) is not None:
+        result = _NON_ASCII_CHARACTERS.sub(_escape_non_ascii_character, result)
+    return result
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    separators: Optional[tuple[str, str]] = None,
+    ensure_ascii: bool = True,
+    allow_nan: bool = True,
+) -> str:
+    """Serialize an object to a JSON string, like `json.dumps`.
+
+    orjson only writes compact or indented JSON: pass `separators=COMPACT_SEPARATORS`
+    or an indent to benefit from it. Other separators are written by the standard library.
+
+    Args:
+        obj: Object to serialize.
+        indent: Number of spaces of an indentation level. If None, the JSON is written on one line.
+        sort_keys: Whether the keys of the objects are sorted.
+        separators: Item and key separators, as in `json.dumps`.
+        ensure_ascii: Whether the non-ASCII characters are escaped.
+        allow_nan: Whether the non-finite floats are allowed. If False, they raise a ValueError.
+    """
+    if orjson_installed:
+        result = _dumps_with_orjson(obj, indent, sort_keys, separators, ensure_ascii)
+        if result is not None:
+            return result
+    return json.dumps(
+        obj,
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=separators,
+        ensure_ascii=ensure_ascii,
+        allow_nan=allow_nan,
+    )
+
+
+def dump_array(
+    items: Iterable[Any],
+    file: IO[str],
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+) -> None:
+    """Serialize the items to a file as a JSON array, like `json.dump(list(items), file)`.
+
+    The items are serialized one at a time, so that the memory used does not depend on their
+    number, and the output is the same as the one of `dumps` on the whole list.
+
+    Args:
+        items: Items of the array.
+        file: File to write the array to, opened in text mode.
+        indent: Number of spaces of an indentation level. If None, the JSON is written on one line.
+        sort_keys: Whether the keys of the objects are sorted.
+    """
+    # the items are written indented by one level in the array
+    newline = None if indent is None else "\n" + " " * indent
+    is_empty = True
+    for item in items:
+        item_json = dumps(item, indent=indent, sort_keys=sort_keys)
+        if newline is None:
+            file.write(("[" if is_empty else ", ") + item_json)
+        else:
+            file.write(("[" if is_empty else ",") + newline + item_json.replace("\n", newline))
+        is_empty = False
+    if is_empty:
+        file.write("[]")
+    else:
+        file.write("]" if indent is None else "\n]")
+
+
+def dump_lines(items: Iterable[Any], file: IO[str], *, sort_keys: bool = False) -> None:
+    """Serialize the items to a file as JSON Lines, i.e. one compact JSON document per line.
+
+    Args:
+        items: Items to write, one per line.
+        file: File to write the lines to, opened in text mode.
+        sort_keys: Whether the keys of the objects are sorted.
+    """
+    for item in items:
+        file.write(dumps(item, sort_keys=sort_keys, separators=COMPACT_SEPARATORS) + "\n")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize a JSON document, like `json.loads`.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson_installed:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, integers larger than 64 bits or UTF-16 documents, that the standard
+            # library supports. Invalid documents raise the error of the standard library
+            pass
+    return json.loads(data)
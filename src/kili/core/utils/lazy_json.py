@@ -0,0 +1,102 @@
+"""JSON fields decoded on first access."""
+
+import json
+from collections.abc import Iterator, MutableMapping
+from typing import Any, Optional, Union
+
+from kili.core.utils import json_codec
+
+
+class LazyJsonObject(MutableMapping):
+    """Mapping proxy of a JSON object, parsed from its string on first access.
+
+    The parsed object is cached, so that the string is parsed at most once. Until it is accessed,
+    the JSON string is kept as is, so that fields that are only passed along cost nothing.
+
+    Since it is not a dict, it cannot be serialized by `json.dumps` directly:
+    use `raw` to get the JSON string, or `to_dict` to get the parsed object.
+    """
+
+    def __init__(self, raw: str, fallback: Optional[dict] = None) -> None:
+        """Initialize the proxy.
+
+        Args:
+            raw: JSON string of the object.
+            fallback: Object to use if the string is not valid JSON. If None, the error is raised.
+        """
+        self._raw = raw
+        self._fallback = fallback
+        self._value: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        """Get the parsed object, parsing it if it was not accessed yet."""
+        value = self._value
+        if value is None:
+            try:
+                value = json_codec.loads(self._raw)
+            except json.JSONDecodeError:
+                if self._fallback is None:
+                    raise
+                value = dict(self._fallback)
+            self._value = value
+        return value
+
+    @property
+    def raw(self) -> str:
+        """JSON string of the object, including the modifications made since it was parsed."""
+        if self._value is None:
+            return self._raw
+        return json_codec.dumps(self._value, separators=json_codec.COMPACT_SEPARATORS)
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether the JSON string was already parsed."""
+        return self._value is not None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.to_dict()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.to_dict()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+def is_json_object_string(raw: str) -> bool:
+    """Tell cheaply if a string looks like a whole JSON object, to be parsed lazily.
+
+    Only its first and last characters are checked, so that e.g. truncated strings
+    are parsed, and rejected, right away.
+    """
+    stripped = raw.strip()
+    return stripped.startswith("{") and stripped.endswith("}")
+
+
+def loads_json_object(
+    raw: str, lazy: bool = False, fallback: Optional[dict] = None
+) -> Union[LazyJsonObject, Any]:
+    """Parse a JSON string, lazily if it is an object and if lazy is True.
+
+    Args:
+        raw: JSON string.
+        lazy: If True, a JSON object is returned as a `LazyJsonObject`, parsed on first access.
+        fallback: Value to use if the string is not valid JSON. If None, the error is raised.
+    """
+    if lazy and isinstance(raw, str) and is_json_object_string(raw):
+        return LazyJsonObject(raw, fallback=fallback)
+    try:
+        return json_codec.loads(raw)
+    except json.JSONDecodeError:
+        if fallback is None:
+            raise
+        return dict(fallback)
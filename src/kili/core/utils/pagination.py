@@ -1,6 +1,9 @@
 """Pagination utils."""
 
-from collections.abc import Callable, Generator, Iterable
+import contextvars
+import queue
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from itertools import islice
 from time import sleep
 from typing import Any, Optional, TypeVar
@@ -106,3 +109,110 @@ def batcher(iterable: Iterable[T], batch_size: int) -> Generator[list[T], None,
     iterator = iter(iterable)
     while batch := list(islice(iterator, batch_size)):
         yield batch
+
+
+_END_OF_ITERATION = object()
+
+
+def _start_producer(iterator: Iterator, items: queue.Queue, stop_event: threading.Event) -> None:
+    """Consume an iterator in a background thread and put its items in a queue.
+
+    The items are put as (item, None) tuples, followed by (_END_OF_ITERATION, error)
+    where error is the exception raised by the iterator, if any.
+    The thread stops as soon as stop_event is set.
+    """
+
+    def put(item: Any) -> None:
+        while not stop_event.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if stop_event.is_set():
+                    return
+                put((item, None))
+        except BaseException as err:  # pylint: disable=broad-exception-caught
+            put((_END_OF_ITERATION, err))
+        else:
+            put((_END_OF_ITERATION, None))
+
+    threading.Thread(
+        target=contextvars.copy_context().run, args=(produce,), name="kili-prefetch", daemon=True
+    ).start()
+
+
+def prefetch_iterator(iterator: Iterator[T], max_prefetched: int) -> Generator[T, None, None]:
+    """Consume an iterator in a background thread, ahead of the caller.
+
+    At most max_prefetched items are fetched in advance, so that the memory stays bounded
+    when the caller is slower than the iterator.
+    Exceptions raised by the iterator are re-raised to the caller, in order.
+    When the returned generator is closed, the background thread stops after its current item.
+
+    Args:
+        iterator: the iterator to consume, e.g. a generator of pages of a paginated query
+        max_prefetched: maximum number of items fetched ahead of the caller
+    """
+    if max_prefetched < 1:
+        raise ValueError(f"max_prefetched must be a positive integer, got {max_prefetched}")
+
+    items: queue.Queue = queue.Queue(maxsize=max_prefetched)
+    stop_event = threading.Event()
+    _start_producer(iterator, items, stop_event)
+    try:
+        while True:
+            item, err = items.get()
+            if err is not None:
+                raise err
+            if item is _END_OF_ITERATION:
+                return
+            yield item
+    finally:
+        stop_event.set()
+
+
+def merge_iterators_concurrently(
+    iterators: Sequence[Iterator[T]], ordered: bool, max_prefetched: int = 0
+) -> Generator[T, None, None]:
+    """Consume several iterators concurrently, each in its own background thread.
+
+    Exceptions raised by the iterators are re-raised to the caller.
+    When the returned generator is closed, the background threads stop after their current item.
+
+    Args:
+        iterators: the iterators to consume
+        ordered: if True, the items of each iterator are returned after all the items of the
+            previous iterators, and are kept in memory until then.
+            Otherwise, the items are returned as soon as they are available.
+        max_prefetched: maximum number of items fetched ahead of the caller by each iterator.
+            If 0, the number of items fetched ahead is not bounded.
+    """
+    if max_prefetched < 0:
+        raise ValueError(f"max_prefetched must be a non-negative integer, got {max_prefetched}")
+
+    stop_event = threading.Event()
+    if ordered:
+        queues: list[queue.Queue] = [queue.Queue(maxsize=max_prefetched) for _ in iterators]
+    else:
+        queues = [queue.Queue(maxsize=max_prefetched * len(iterators))]
+    for index, iterator in enumerate(iterators):
+        _start_producer(iterator, queues[index if ordered else 0], stop_event)
+
+    try:
+        for items in queues:
+            nb_iterators_left = 1 if ordered else len(iterators)
+            while nb_iterators_left > 0:
+                item, err = items.get()
+                if err is not None:
+                    raise err
+                if item is _END_OF_ITERATION:
+                    nb_iterators_left -= 1
+                    continue
+                yield item
+    finally:
+        stop_event.set()
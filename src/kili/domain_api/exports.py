@@ -208,6 +208,64 @@ class ExportNamespace(DomainNamespace):
             export_type=export_type,
         )
 
+    def kili_jsonl(
+        self,
+        project_id: str,
+        output_path: str,
+        with_assets: Optional[bool] = False,
+        disable_tqdm: Optional[bool] = False,
+        filter: Optional[ExportAssetFilter] = None,
+        include_sent_back_labels: Optional[bool] = None,
+        label_type_in: Optional[list[LabelType]] = None,
+        export_type: Optional[ExportType] = None,
+    ):
+        """Export project labels in Kili native format, as JSON Lines.
+
+        The assets are exported with the same content as the Kili native format, one asset
+        per line of a single `data.jsonl` file, so that the file can be read line by line
+        without loading the whole project.
+
+        Args:
+            project_id: Identifier of the project.
+            output_path: Relative or full path of the archive that will contain
+                the exported data.
+            with_assets: Download the assets in the export.
+            disable_tqdm: Disable the progress bar if True.
+            filter: Optional dictionary to filter assets whose labels are exported.
+                See `ExportAssetFilter` for available filter options.
+            include_sent_back_labels: If True, the export will include the labels that
+                have been sent back.
+            label_type_in: Optional list of label type. Exported assets should have a label
+                whose type belongs to that list.
+                By default, only `DEFAULT` and `REVIEW` labels are exported.
+            export_type: Type of export. If not specified, automatically selects the optimal type:
+                - For Workflow V1 projects: uses `"latest"` (single label per asset)
+                - For Workflow V2 projects: uses `"latest_from_last_step"` (supports multiple annotators)
+
+                Available options:
+                - `"latest_from_last_step"`: exports the latest labels from the last workflow step
+                  (uses `latestLabels` field, supports multiple annotators).
+                - `"latest_from_all_steps"`: exports latest labels from all workflow steps
+                - `"latest"`: exports the latest label for each asset
+                  (deprecated, use `"latest_from_last_step"` instead).
+                - `"normal"`: exports all labels for each asset.
+
+        Returns:
+            Export information or None if export failed.
+        """
+        return self._export(
+            project_id=project_id,
+            output_path=output_path,
+            with_assets=with_assets,
+            disable_tqdm=disable_tqdm,
+            filter=filter,
+            include_sent_back_labels=include_sent_back_labels,
+            label_type_in=label_type_in,
+            normalized_coordinates=True,
+            fmt="kili_jsonl",
+            export_type=export_type,
+        )
+
     def coco(
         self,
         project_id: str,
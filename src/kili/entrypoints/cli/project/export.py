@@ -79,6 +79,7 @@ def export_labels(
 
         - Yolo V4, V5, V7, V8 for object detection tasks.
         - Kili (a.k.a raw) for all tasks.
+        - Kili JSON Lines (kili_jsonl) for all tasks, with one asset per line of data.jsonl.
         - COCO for object detection tasks (bounding box and semantic segmentation).
         - Pascal VOC for object detection tasks (bounding box).
     \b
@@ -1,6 +1,5 @@
 """Plugins queries."""
 
-import json
 from datetime import datetime
 from typing import Optional
 
@@ -12,6 +11,7 @@ from kili.core.graphql.operations.plugin.queries import (
     PluginLogsWhere,
     PluginQuery,
 )
+from kili.core.utils import json_codec
 from kili.domain.types import ListOrTuple
 from kili.entrypoints.base import BaseOperationEntrypointMixin
 from kili.services.plugins import PluginUploader
@@ -54,7 +54,7 @@ class QueriesPlugins(BaseOperationEntrypointMixin):
         pretty_result = PluginQuery(self.graphql_client, self.http_client).get_build_errors(
             where, options
         )
-        return json.dumps(pretty_result, sort_keys=True, indent=4)
+        return json_codec.dumps(pretty_result, sort_keys=True, indent=4)
 
     @typechecked
     def get_plugin_logs(
@@ -87,7 +87,7 @@ class QueriesPlugins(BaseOperationEntrypointMixin):
             first=limit, skip=skip, disable_tqdm=False
         )  # disable tqm is not implemented for this query
         pretty_result = PluginQuery(self.graphql_client, self.http_client).get_logs(where, options)
-        return json.dumps(pretty_result, sort_keys=True, indent=4)
+        return json_codec.dumps(pretty_result, sort_keys=True, indent=4)
 
     @typechecked
     def get_plugin_status(
@@ -23,6 +23,10 @@ class GraphQLError(Exception):
             super().__init__(f'GraphQL error at index {100*batch_number}: {error_msg}"')
 
 
+class CircuitOpenError(Exception):
+    """Raised when a request is not sent because the backend failed repeatedly."""
+
+
 class NotFound(Exception):
     """Used when a given object is not found in Kili."""
 
@@ -14,6 +14,7 @@ from typing import (
 from typeguard import typechecked
 
 from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
+from kili.core.constants import QUERY_PREFETCH_PAGES
 from kili.domain.asset.asset import (
     AssetExternalId,
     AssetFilters,
@@ -557,7 +558,15 @@ class AssetClientMethods(BaseClientMethods):
             download_media=download_media,
             local_media_dir=local_media_dir,
             label_output_format=label_output_format,
-            options=QueryOptions(disable_tqdm=disable_tqdm, first=first, skip=skip),
+            options=QueryOptions(
+                disable_tqdm=disable_tqdm,
+                first=first,
+                skip=skip,
+                prefetch_pages=QUERY_PREFETCH_PAGES,
+                # the labels are parsed right away in the parsed_label format
+                lazy_json_fields=getattr(self, "lazy_json_fields", False)
+                and label_output_format == "dict",
+            ),
         )
 
         if format == "pandas":
@@ -19,6 +19,7 @@ from kili_formats.format.geojson import geojson_feature_collection_to_kili_json_
 from typeguard import typechecked
 
 from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
+from kili.core.constants import QUERY_PREFETCH_PAGES
 from kili.core.helpers import (
     deprecate,
     is_empty_list_with_warning,
@@ -457,7 +458,14 @@ class LabelClientMethods(BaseClientMethods):
 
         disable_tqdm = resolve_disable_tqdm(disable_tqdm, getattr(self, "disable_tqdm", None))
         disable_tqdm = disable_tqdm_if_as_generator(as_generator, disable_tqdm)
-        options = QueryOptions(disable_tqdm, first, skip)
+        options = QueryOptions(
+            disable_tqdm,
+            first,
+            skip,
+            prefetch_pages=QUERY_PREFETCH_PAGES,
+            # the labels are parsed right away in the parsed_label format
+            lazy_json_fields=getattr(self, "lazy_json_fields", False) and output_format == "dict",
+        )
 
         asset_step_id_in = None
         if (
@@ -1299,6 +1307,8 @@ class LabelClientMethods(BaseClientMethods):
         label_type_in: Optional[list[str]] = None,
         include_sent_back_labels: Optional[bool] = None,
         export_type: ExportType = "latest",
+        workers: Optional[int] = None,
+        incremental: bool = False,
     ) -> Optional[list[dict[str, Union[list[str], str]]]]:
         # pylint: disable=line-too-long
         """Export the project labels with the requested format into the requested output path.
@@ -1361,12 +1371,26 @@ class LabelClientMethods(BaseClientMethods):
                 - `"latest_from_last_step"`: Export the latest label from each annotator for the last step.
                 - `"latest_from_all_steps"`: Export the latest label from each annotator for all steps.
                 - `"normal"`: Export all labels.
+            workers: Number of processes converting the labels to the requested format,
+                for the COCO, YOLO, Pascal VOC and Kili formats. By default, the labels are
+                converted in the current process. The exported files are the same whatever
+                the number of processes. The processes are spawned and import the main module
+                of the program, so a script exporting with several processes must call
+                `export_labels` within an `if __name__ == "__main__":` block.
+            incremental: If True, only the assets changed since the previous export to
+                `filename` are fetched and converted, the files of the other assets being copied
+                from the previous archive. The files of each asset are listed with their hashes
+                in a manifest written next to the archive, in `<filename>.manifest.json`.
+                Only supported by the Kili format with one file per asset and by the Pascal VOC
+                format, without the download of the assets.
 
         !!! Info
             The supported formats are:
 
             - Yolo V4, V5, V7, V8 for object detection tasks.
             - Kili (a.k.a raw) for all tasks.
+            - Kili JSON Lines (`kili_jsonl`) for all tasks, with one asset per line of a single
+                `data.jsonl` file, that can be read line by line.
             - COCO for object detection tasks (bounding box and semantic segmentation).
             - Pascal VOC for object detection tasks (bounding box).
 
@@ -1454,6 +1478,8 @@ class LabelClientMethods(BaseClientMethods):
                 normalized_coordinates=normalized_coordinates,
                 label_type_in=label_type_in,
                 include_sent_back_labels=include_sent_back_labels,
+                workers=workers,
+                incremental=incremental,
             )
         except NoCompatibleJobError as excp:
             warnings.warn(str(excp), stacklevel=2)
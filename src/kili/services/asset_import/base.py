@@ -6,9 +6,7 @@ import mimetypes
 import os
 import warnings
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 from itertools import repeat
-from json import dumps, loads
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -29,6 +27,8 @@ from kili.core.graphql.operations.asset.mutations import (
     GQL_APPEND_MANY_FRAMES_TO_DATASET,
 )
 from kili.core.helpers import T, format_result, get_mime_type, is_url
+from kili.core.utils import json_codec
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
 from kili.core.utils.pagination import batcher
 from kili.domain.organization import OrganizationFilters
 from kili.domain.project import InputType, ProjectId
@@ -163,7 +163,7 @@ class BaseBatchImporter:  # pylint: disable=too-many-instance-attributes
         json_metadata = asset.get("json_metadata", {})
         if not isinstance(json_metadata, str):
             try:
-                json_metadata = dumps(json_metadata, allow_nan=False)
+                json_metadata = json_codec.dumps(json_metadata, allow_nan=False)
             except (ValueError, TypeError) as e:
                 raise ValueError(
                     f"Invalid json_metadata: cannot be serialized to valid JSON ({e})"
@@ -175,7 +175,7 @@ class BaseBatchImporter:  # pylint: disable=too-many-instance-attributes
         """Stringify the metadata."""
         json_content = asset.get("json_content", "")
         if not isinstance(json_content, str):
-            json_content = dumps(json_content)
+            json_content = json_codec.dumps(json_content)
         return {**asset, "json_content": json_content}
 
     @staticmethod
@@ -222,7 +222,7 @@ class BaseBatchImporter:  # pylint: disable=too-many-instance-attributes
         should_use_native_video_array = []
         for asset in assets:
             json_metadata = asset.get("json_metadata", "{}")
-            json_metadata_ = loads(json_metadata)
+            json_metadata_ = json_codec.loads(json_metadata)
             processing_parameters = json_metadata_.get("processingParameters", {})
             should_use_native_video_array.append(
                 processing_parameters.get("shouldUseNativeVideo", True)
@@ -372,7 +372,7 @@ class ContentBatchImporter(BaseBatchImporter):
             [file_path for _, file_path, *_ in to_upload]
         )
         data_array, content_type_array = zip(*data_and_content_type_array, strict=False)
-        with ThreadPoolExecutor() as threads:
+        with ContextThreadPoolExecutor() as threads:
             url_gen = threads.map(
                 bucket.upload_data_via_rest,
                 signed_urls,
@@ -406,7 +406,7 @@ class JsonContentBatchImporter(BaseBatchImporter):
         """Stringify the json content if not a str."""
         json_content = asset.get("json_content", {})
         if not isinstance(json_content, str):
-            json_content = dumps(json_content)
+            json_content = json_codec.dumps(json_content)
         updated_asset = asset.copy()
         updated_asset["json_content"] = json_content
         return updated_asset
@@ -424,7 +424,7 @@ class JsonContentBatchImporter(BaseBatchImporter):
         ]
         signed_urls = bucket.request_signed_urls(self.kili, asset_json_content_paths)
         json_content_array = [asset.get("json_content") for asset in assets]
-        with ThreadPoolExecutor() as threads:
+        with ContextThreadPoolExecutor() as threads:
             url_gen = threads.map(
                 bucket.upload_data_via_rest,
                 signed_urls,
@@ -1,12 +1,12 @@
 """Functions to import assets into a VIDEO_LEGACY project."""
 
 import os
-from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from itertools import repeat
 from typing import Optional
 
 from kili.core.helpers import get_mime_type, is_url
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
 from kili.domain.project import InputType
 from kili.services.asset_import.base import (
     BaseAbstractAssetImporter,
@@ -115,7 +115,7 @@ class FrameBatchImporter(JsonContentBatchImporter, VideoMixin):
                 data_array.append(file.read())
             content_type = get_mime_type(frame_path)
             content_type_array.append(content_type)
-        with ThreadPoolExecutor() as threads:
+        with ContextThreadPoolExecutor() as threads:
             url_gen = threads.map(
                 bucket.upload_data_via_rest,
                 signed_urls,
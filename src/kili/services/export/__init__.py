@@ -37,6 +37,8 @@ def export_labels(  # pylint: disable=too-many-arguments, too-many-locals
     normalized_coordinates: Optional[bool],
     label_type_in: Optional[list[str]],
     include_sent_back_labels: Optional[bool],
+    workers: Optional[int] = None,
+    incremental: bool = False,
 ) -> Optional[list[dict[str, Union[list[str], str]]]]:
     """Export the selected assets into the required format, and save it into a file archive."""
     kili.kili_api_gateway.get_project(project_id, ["id"])
@@ -59,6 +61,8 @@ def export_labels(  # pylint: disable=too-many-arguments, too-many-locals
         normalized_coordinates=normalized_coordinates,
         label_type_in=label_type_in,
         include_sent_back_labels=include_sent_back_labels,
+        workers=workers,
+        incremental=incremental,
     )
 
     logger = get_logger(log_level)
@@ -69,6 +73,7 @@ def export_labels(  # pylint: disable=too-many-arguments, too-many-locals
         format_exporter_selector_mapping: dict[str, type[AbstractExporter]] = {
             "raw": KiliExporter,
             "kili": KiliExporter,
+            "kili_jsonl": KiliExporter,
             "coco": CocoExporter,
             "yolo_v4": YoloExporter,
             "yolo_v5": YoloExporter,
@@ -0,0 +1,195 @@
+"""Writers of the files of an export, into a zip archive or a directory."""
+
+import io
+import posixpath
+import shutil
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import IO
+
+# media already compressed by their format, that deflate would not make smaller
+COMPRESSED_MEDIA_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".mp4",
+        ".mov",
+        ".webm",
+        ".mkv",
+        ".avi",
+        ".mp3",
+        ".ogg",
+        ".pdf",
+        ".zip",
+        ".gz",
+    }
+)
+
+
+class ArchiveWriter(ABC):
+    """Interface of the writers of the files of an export.
+
+    The files are written entry by entry, at their path relative to the root of the export,
+    with `/` as separator. Each entry must be written once, and at most one entry can be
+    open at a time.
+    """
+
+    @abstractmethod
+    def open(self, name: str) -> IO[bytes]:
+        """Open an entry of the archive for writing, in binary mode."""
+
+    @abstractmethod
+    def write_file(self, name: str, path: Path) -> None:
+        """Copy a file of the disk into an entry of the archive."""
+
+    @abstractmethod
+    def mkdir(self, name: str) -> None:
+        """Create a folder in the archive, kept even if it stays empty."""
+
+    def open_text(self, name: str) -> IO[str]:
+        """Open an entry of the archive for writing, in text mode encoded in UTF-8."""
+        # the newlines are not translated, so that the entry is the same on every platform
+        return io.TextIOWrapper(self.open(name), encoding="utf-8", newline="\n")
+
+    def write_bytes(self, name: str, data: bytes) -> None:
+        """Write an entry of the archive."""
+        with self.open(name) as file:
+            file.write(data)
+
+    def write_text(self, name: str, text: str) -> None:
+        """Write an entry of the archive, encoded in UTF-8."""
+        self.write_bytes(name, text.encode("utf-8"))
+
+    def folder(self, name: str) -> "ArchiveWriter":
+        """Get a writer of the entries of a folder of the archive."""
+        return ArchiveFolder(self, name)
+
+    def asset_entries(self, asset: dict) -> AbstractContextManager[None]:
+        """Mark the entries written in the context as the files of an asset.
+
+        The files are only tracked by the archives of the incremental exports.
+        """
+        _ = asset
+        return nullcontext()
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish writing the archive."""
+
+    def abort(self) -> None:
+        """Stop writing the archive after an error."""
+        self.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        if type_ is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ArchiveFolder(ArchiveWriter):
+    """Writer of the entries of a folder of an archive."""
+
+    def __init__(self, archive: ArchiveWriter, name: str) -> None:
+        self.archive = archive
+        self.name = name
+
+    def open(self, name: str) -> IO[bytes]:
+        return self.archive.open(posixpath.join(self.name, name))
+
+    def write_file(self, name: str, path: Path) -> None:
+        self.archive.write_file(posixpath.join(self.name, name), path)
+
+    def mkdir(self, name: str) -> None:
+        self.archive.mkdir(posixpath.join(self.name, name))
+
+    def asset_entries(self, asset: dict) -> AbstractContextManager[None]:
+        return self.archive.asset_entries(asset)
+
+    def close(self) -> None:
+        """Do nothing, the archive of the folder is closed by its owner."""
+
+
+class ZipArchiveWriter(ArchiveWriter):
+    """Writer of the files of an export straight into a zip archive.
+
+    The entries are compressed with deflate, except the media already compressed by their
+    format, which are stored as is.
+    The archive is written next to the file at the path, which is replaced once the archive
+    is complete. If the export fails, the incomplete archive is removed and the file at the
+    path is left untouched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.partial_path = path.with_name(f"{path.name}.partial")
+        self._zip_file = zipfile.ZipFile(  # pylint: disable=consider-using-with
+            self.partial_path, "w", compression=zipfile.ZIP_DEFLATED
+        )
+        self._folders: set[str] = set()
+
+    def _get_compress_type(self, name: str) -> int:
+        if posixpath.splitext(name)[1].lower() in COMPRESSED_MEDIA_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def open(self, name: str) -> IO[bytes]:
+        zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        zip_info.compress_type = self._get_compress_type(name)
+        zip_info.external_attr = 0o644 << 16
+        # the size of the entry is not known in advance, it may exceed the zip limit of 2 GiB
+        return self._zip_file.open(zip_info, "w", force_zip64=True)
+
+    def write_file(self, name: str, path: Path) -> None:
+        self._zip_file.write(path, name, compress_type=self._get_compress_type(name))
+
+    def mkdir(self, name: str) -> None:
+        name = name.rstrip("/") + "/"
+        if name in self._folders:
+            return
+        self._folders.add(name)
+        zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        zip_info.external_attr = (0o40755 << 16) | 0x10  # directory flag of MS-DOS
+        self._zip_file.writestr(zip_info, b"")
+
+    def close(self) -> None:
+        self._zip_file.close()
+        self.partial_path.replace(self.path)
+
+    def abort(self) -> None:
+        self._zip_file.close()
+        self.partial_path.unlink(missing_ok=True)
+
+
+class DirectoryArchiveWriter(ArchiveWriter):
+    """Writer of the files of an export into a directory, e.g. to check the files of an exporter."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def open(self, name: str) -> IO[bytes]:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("wb")
+
+    def write_file(self, name: str, path: Path) -> None:
+        destination = self.root / name
+        if destination.exists() and destination.samefile(path):
+            return
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, destination)
+
+    def mkdir(self, name: str) -> None:
+        (self.root / name).mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        """Do nothing, the files are closed once written."""
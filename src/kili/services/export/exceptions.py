@@ -23,3 +23,7 @@ class NotExportableAssetError(ValueError):
 
 class GeoJsonConversionError(Exception):
     """Exception thrown when the an annotation cannot be converted to GeoJson."""
+
+
+class IncrementalExportError(Exception):
+    """Exception thrown when the previous export cannot be reused by an incremental export."""
@@ -1,23 +1,33 @@
 """Base class for all formatters and other utility classes."""
 
 import csv
-import json
+import hashlib
+import io
 import logging
-import shutil
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, Optional, Union
 
 from kili_formats.types import Job
 
+from kili.core.utils import json_codec
 from kili.domain.asset import AssetId
 from kili.domain.project import ProjectId
+from kili.services.export.archive import ArchiveWriter, ZipArchiveWriter
 from kili.services.export.exceptions import (
     NotCompatibleOptions,
 )
+from kili.services.export.incremental import (
+    IncrementalArchiveWriter,
+    IncrementalExportPlan,
+    plan_incremental_export,
+)
 from kili.services.export.repository import AbstractContentRepository
 from kili.services.export.tools import (
+    fetch_asset_versions,
     fetch_assets,
     is_geotiff_asset_with_lat_lon_coords,
 )
@@ -32,6 +42,9 @@ from kili.utils.tempfile import TemporaryDirectory
 if TYPE_CHECKING:
     from kili.client import Kili
 
+# formats keeping the latitude and longitude coordinates of the geotiff assets
+GEOSPATIAL_COMPATIBLE_FORMATS = ("raw", "kili", "kili_jsonl", "geojson")
+
 
 class ExportParams(NamedTuple):
     """Contains all parameters that change the result of the export."""
@@ -49,6 +62,10 @@ class ExportParams(NamedTuple):
     normalized_coordinates: Optional[bool]
     label_type_in: Optional[list[str]]
     include_sent_back_labels: Optional[bool]
+    # number of processes converting the labels, in the main process if None or 1
+    workers: Optional[int] = None
+    # whether only the assets changed since the previous export are converted
+    incremental: bool = False
 
 
 def reverse_rotation_vertices(normalized_vertices, rotation_angle) -> list[dict]:
@@ -73,6 +90,11 @@ def reverse_rotation_vertices(normalized_vertices, rotation_angle) -> list[dict]
 class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
     """Abstract class defining the interface for all exporters."""
 
+    # whether the files of the export are written asset by asset, in `asset_entries`
+    supports_incremental_export = False
+    # assets to convert and files to keep, during an incremental export
+    incremental_export_plan: Optional[IncrementalExportPlan] = None
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -101,6 +123,8 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
         self.normalized_coordinates = export_params.normalized_coordinates
         self.label_type_in = export_params.label_type_in or ["DEFAULT", "REVIEW"]
         self.include_sent_back_labels = export_params.include_sent_back_labels
+        self.workers = export_params.workers
+        self.incremental = export_params.incremental
 
         self.project = kili.kili_api_gateway.get_project(
             self.project_id, ["jsonInterface", "inputType", "title", "description", "id"]
@@ -128,26 +152,38 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
         )
 
     @abstractmethod
-    def process_and_save(self, assets: list[dict], output_filename: Path) -> None:
-        """Converts the asset and save them into an archive file."""
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path) -> None:
+        """Converts the asset and save them into an archive file.
+
+        The assets are fetched while they are consumed, so they must be iterated only once.
+        """
 
     def process(self, assets: list[dict]) -> list[dict[str, Union[list[str], str]]]:
         """Converts the asset."""
         raise ValueError("Output file is required for this export format.")
 
-    def make_archive(self, root_folder: Path, output_filename: Path) -> Path:
-        """Make the export archive."""
-        path_folder = root_folder / self.project_id
-        path_archive = shutil.make_archive(str(path_folder), "zip", path_folder)
+    def open_archive(self, output_filename: Path) -> ArchiveWriter:
+        """Open the export archive, written entry by entry next to its final location."""
         output_filename.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(path_archive, output_filename)
-        return output_filename
-
-    def create_readme_kili_file(self, root_folder: Path) -> None:
+        if self.incremental_export_plan is not None:
+            return IncrementalArchiveWriter(output_filename, self.incremental_export_plan)
+        return ZipArchiveWriter(output_filename)
+
+    def add_staged_files(self, archive: ArchiveWriter) -> None:
+        """Add to the archive the files written on disk, i.e. the media and the video frames."""
+        if not self.base_folder.is_dir():
+            return
+        for folder, subfolders, filenames in os.walk(self.base_folder):
+            subfolders.sort()
+            relative_folder = Path(folder).relative_to(self.base_folder)
+            if relative_folder != Path():
+                archive.mkdir(relative_folder.as_posix())
+            for filename in sorted(filenames):
+                archive.write_file((relative_folder / filename).as_posix(), Path(folder, filename))
+
+    def create_readme_kili_file(self, archive: ArchiveWriter) -> None:
         """Create a README.kili.txt file to give information about exported labels."""
-        readme_file_name = root_folder / self.project_id / "README.kili.txt"
-        readme_file_name.parent.mkdir(parents=True, exist_ok=True)
-        with readme_file_name.open("wb") as fout:
+        with archive.open("README.kili.txt") as fout:
             fout.write(b"Exported Labels from KILI\n=========================\n\n")
             fout.write(f"- Project name: {self.project['title']}\n".encode())
             fout.write(f"- Project identifier: {self.project['id']}\n".encode())
@@ -157,22 +193,22 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
             fout.write(f"- Exported labels: {self.export_type}\n".encode())
 
     @staticmethod
-    def write_video_metadata_file(video_metadata: dict, base_folder: Path) -> None:
+    def write_video_metadata_file(video_metadata: dict, folder: ArchiveWriter) -> None:
         """Write video metadata file."""
-        video_metadata_json = json.dumps(video_metadata, sort_keys=True, indent=4)
+        video_metadata_json = json_codec.dumps(video_metadata, sort_keys=True, indent=4)
         if video_metadata_json is not None:
-            with (base_folder / "video_meta.json").open("wb") as output_file:
-                output_file.write(video_metadata_json.encode("utf-8"))
+            folder.write_text("video_meta.json", video_metadata_json)
 
     @staticmethod
-    def write_remote_content_file(remote_content: list[str], images_folder: Path) -> None:
+    def write_remote_content_file(remote_content: list[str], folder: ArchiveWriter) -> None:
         """Write remote content file."""
         remote_content_header = ["external id", "url", "label file"]
         # newline="" to disable universal newlines translation (bug fix for windows)
-        with (images_folder / "remote_assets.csv").open("w", newline="", encoding="utf8") as file:
+        with io.StringIO(newline="") as file:
             writer = csv.writer(file)
             writer.writerow(remote_content_header)
             writer.writerows(remote_content)
+            folder.write_text("remote_assets.csv", file.getvalue())
 
     def export_project(
         self,
@@ -184,30 +220,95 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
         self._check_arguments_compatibility()
         self._check_project_compatibility()
         self._check_and_ensure_asset_access()
+        if self.incremental:
+            self._check_incremental_export_compatibility()
 
         self.logger.info("Fetching assets...")
 
         with TemporaryDirectory() as export_root_folder:
             self.export_root_folder = export_root_folder
-            assets = fetch_assets(
-                self.kili,
-                project_id=self.project_id,
-                asset_ids=self.assets_ids,
-                export_type=self.export_type,
-                label_type_in=self.label_type_in,
-                disable_tqdm=self.disable_tqdm,
-                download_media=self.with_assets,
-                local_media_dir=str(self.images_folder),
-                asset_filter_kwargs=self.asset_filter_kwargs,
-            )
+            asset_ids = self.assets_ids
+            if self.incremental and self.output_file is not None:
+                self.incremental_export_plan = self._plan_incremental_export(self.output_file)
+                if self.incremental_export_plan.is_up_to_date:
+                    self.logger.warning(f"{self.output_file} is up to date.")
+                    return None
+                if self.incremental_export_plan.changed_asset_ids is not None:
+                    asset_ids = [
+                        AssetId(asset_id)
+                        for asset_id in self.incremental_export_plan.changed_asset_ids
+                    ]
+
+            assets: Iterable[dict]
+            plan = self.incremental_export_plan
+            if plan is not None and plan.changed_asset_ids == []:
+                assets = []  # only assets removed since the previous export
+            else:
+                assets = fetch_assets(
+                    self.kili,
+                    project_id=self.project_id,
+                    asset_ids=asset_ids,
+                    export_type=self.export_type,
+                    label_type_in=self.label_type_in,
+                    disable_tqdm=self.disable_tqdm,
+                    download_media=self.with_assets,
+                    local_media_dir=str(self.images_folder),
+                    asset_filter_kwargs=self.asset_filter_kwargs,
+                )
 
-            self._check_geotiff_export_compatibility(assets)
+            assets = self._check_geotiff_export_compatibility(assets)
 
             if self.output_file is None:
-                return self.process(assets)
+                return self.process(list(assets))
 
             return self.process_and_save(assets, self.output_file)
 
+    def _check_incremental_export_compatibility(self) -> None:
+        """Check if the export can convert only the assets changed since the previous export."""
+        if self.output_file is None:
+            raise NotCompatibleOptions("An incremental export requires an output file.")
+        if not self.supports_incremental_export or self.single_file:
+            raise NotCompatibleOptions(
+                f"The {self.label_format} format cannot be exported incrementally"
+                f"{' into a single file' if self.single_file else ''}."
+            )
+        if self.with_assets:
+            raise NotCompatibleOptions(
+                "An incremental export cannot download the assets. Please disable the download"
+                " of assets by setting `with_assets=False`."
+            )
+
+    def _plan_incremental_export(self, output_file: Path) -> IncrementalExportPlan:
+        """Find the assets changed since the previous export, from their version."""
+        asset_versions = fetch_asset_versions(
+            self.kili,
+            project_id=self.project_id,
+            asset_ids=self.assets_ids,
+            export_type=self.export_type,
+            label_type_in=self.label_type_in,
+            disable_tqdm=self.disable_tqdm,
+            asset_filter_kwargs=self.asset_filter_kwargs,
+        )
+        json_interface = json_codec.dumps(self.project["jsonInterface"], sort_keys=True)
+        options = {
+            "labelFormat": self.label_format,
+            "exportType": self.export_type,
+            "splitOption": self.split_option,
+            "normalizedCoordinates": self.normalized_coordinates,
+            "labelTypeIn": list(self.label_type_in),
+            "includeSentBackLabels": self.include_sent_back_labels,
+            "jsonInterface": hashlib.sha256(json_interface.encode("utf-8")).hexdigest(),
+        }
+        plan = plan_incremental_export(output_file, options, asset_versions)
+        if plan.changed_asset_ids is None:
+            self.logger.info("No previous export to update, exporting all the assets.")
+        else:
+            self.logger.info(
+                f"{len(plan.changed_asset_ids)} assets changed and {plan.nb_removed_assets}"
+                " assets removed since the previous export."
+            )
+        return plan
+
     def _check_and_ensure_asset_access(self) -> None:
         """Check asset access.
 
@@ -226,7 +327,7 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
         project = self.kili.kili_api_gateway.get_project(self.project_id, ["dataConnections.id"])
         return bool(project["dataConnections"])
 
-    def _check_geotiff_export_compatibility(self, assets: list[dict]) -> None:
+    def _check_geotiff_export_compatibility(self, assets: Iterable[dict]) -> Iterator[dict]:
         # pylint: disable=line-too-long
         """Check if one of the assets is a geotiff asset, and if the export params are compatible.
 
@@ -234,17 +335,21 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
 
         - we can only allow the export for Kili or geojson formats, since geotiff normalizedVertices are lat/lon coordinates
         - we cannot allow normalized_coordinates != None, for the same reason
+
+        The assets are checked while they are consumed, so the export stops at the first
+        incompatible asset.
         """
         if (
-            self.label_format not in ("raw", "kili", "geojson")
-            or self.normalized_coordinates is not None
+            self.label_format in GEOSPATIAL_COMPATIBLE_FORMATS
+            and self.normalized_coordinates is None
         ):
-            has_geotiff_asset = any(
-                is_geotiff_asset_with_lat_lon_coords(asset, self.kili.http_client)
-                for asset in assets
-            )
+            yield from assets
+            return
 
-            if self.label_format not in ("raw", "kili", "geojson") and has_geotiff_asset:
+        for asset in assets:
+            has_geotiff_asset = is_geotiff_asset_with_lat_lon_coords(asset, self.kili.http_client)
+
+            if self.label_format not in GEOSPATIAL_COMPATIBLE_FORMATS and has_geotiff_asset:
                 raise NotCompatibleOptions(
                     "Cannot export geotiff assets with geospatial coordinates in"
                     f" {self.label_format} format. Please use 'kili', 'raw' or 'geojson' formats"
@@ -258,6 +363,8 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
                     " Please use `normalized_coordinates=None` instead."
                 )
 
+            yield asset
+
     @property
     def base_folder(self) -> Path:
         """Export base folder."""
@@ -293,11 +400,19 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
         label["jsonResponse"] = json_response
         return label
 
-    def preprocess_assets(self, assets: list[dict]) -> list[dict]:
+    def preprocess_assets(self, assets: Iterable[dict]) -> list[dict]:
         """Format labels in the requested format, and filter out autosave labels."""
-        include_sent_back_labels = self.include_sent_back_labels
-        assets_in_format = []
+        return list(
+            AbstractExporter.iter_preprocessed_assets(assets, self.include_sent_back_labels)
+        )
+
+    @staticmethod
+    def iter_preprocessed_assets(
+        assets: Iterable[dict], include_sent_back_labels: Optional[bool]
+    ) -> Iterator[dict]:
+        """Format labels in the requested format, and filter out autosave labels, lazily."""
         for asset in assets:
+            assets_in_format = []
             if "labels" in asset:
                 labels_of_asset = []
                 for label in asset["labels"]:
@@ -341,4 +456,4 @@ class AbstractExporter(ABC):  # pylint: disable=too-many-instance-attributes
                         ]
                         assets_in_format.append(asset)
 
-        return AbstractExporter._filter_out_autosave_labels(assets_in_format)
+            yield from AbstractExporter._filter_out_autosave_labels(assets_in_format)
@@ -1,6 +1,9 @@
 """Common code for the coco exporter."""
 
 import json
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -8,12 +11,19 @@ from kili_formats import convert_from_kili_to_coco_format
 from kili_formats.types import Job, JobTool
 
 from kili.domain.ontology import JobMLTask
+from kili.services.export.archive import ArchiveWriter
 from kili.services.export.exceptions import (
     NoCompatibleJobError,
     NotCompatibleInputType,
     NotCompatibleOptions,
 )
 from kili.services.export.format.base import AbstractExporter
+from kili.services.export.format.coco.streaming import (
+    CocoAssetConversion,
+    CocoLabelsWriter,
+    convert_asset,
+)
+from kili.services.export.process_pool import map_assets
 from kili.services.export.types import CocoAnnotationModifier
 
 DATA_SUBDIR = "data"
@@ -48,31 +58,34 @@ class CocoExporter(AbstractExporter):
         """Export images folder."""
         return self.base_folder / DATA_SUBDIR
 
-    def process_and_save(self, assets: list[dict], output_filename: Path):
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path):
         """Extract formatted annotations from labels."""
-        clean_assets = self.preprocess_assets(assets)
+        clean_assets = self.iter_preprocessed_assets(assets, self.include_sent_back_labels)
         # Expand assets with latestLabels into multiple assets
-        expanded_assets = self._expand_assets_with_multiple_labels(clean_assets)
-        try:
-            self._save_assets_export(
-                expanded_assets,
-                self.export_root_folder,
-                annotation_modifier=self.annotation_modifier,
-            )
-        except ImportError as e:
-            raise ImportError("Install with `pip install kili[coco]` to use this feature.") from e
-        self.create_readme_kili_file(self.export_root_folder)
-        self.make_archive(self.export_root_folder, output_filename)
+        expanded_assets = self._iter_expanded_assets(clean_assets)
+        with self.open_archive(output_filename) as archive:
+            try:
+                self._save_assets_export(
+                    expanded_assets,
+                    archive,
+                    annotation_modifier=self.annotation_modifier,
+                )
+            except ImportError as e:
+                raise ImportError(
+                    "Install with `pip install kili[coco]` to use this feature."
+                ) from e
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
-    def _expand_assets_with_multiple_labels(self, assets: list[dict]) -> list[dict]:
-        """Expand assets with latestLabels into multiple asset entries with latestLabel.
+    @staticmethod
+    def _iter_expanded_assets(assets: Iterable[dict]) -> Iterator[dict]:
+        """Expand assets with latestLabels into multiple asset entries with latestLabel, lazily.
 
         When an asset has multiple labels (latestLabels), create separate asset entries
-        for each label with a unique externalId suffix (_label0, _label1, etc.).
+        for each label with a unique externalId suffix (_label1, _label2, etc.).
         """
-        expanded_assets = []
         for asset in assets:
             # Collect all labels to process (handle both latestLabel and latestLabels)
             labels_to_process = []
@@ -99,17 +112,21 @@ class CocoExporter(AbstractExporter):
                 if "latestLabels" in asset_copy:
                     del asset_copy["latestLabels"]
 
-                expanded_assets.append(asset_copy)
-
-        return expanded_assets
+                yield asset_copy
 
     def _save_assets_export(
         self,
-        assets: list[dict],
-        output_directory: Path,
+        assets: Iterable[dict],
+        archive: ArchiveWriter,
         annotation_modifier: Optional[CocoAnnotationModifier],
     ):
         """Save the assets to a file and return the link to that file."""
+        if self.project["inputType"] == "IMAGE":
+            self._stream_assets_export(assets, archive, annotation_modifier)
+            return
+
+        # the COCO ids of the video frames depend on the number of assets
+        assets = list(assets)
         if self.split_option == "split":
             for job_name, job in self.project["jsonInterface"]["jobs"].items():
                 if self._is_job_compatible(job):
@@ -121,12 +138,7 @@ class CocoExporter(AbstractExporter):
                         annotation_modifier=annotation_modifier,
                         merged=False,
                     )
-                    label_file_name = (
-                        Path(output_directory) / self.project["id"] / job_name / "labels.json"
-                    )
-                    label_file_name.parent.mkdir(parents=True, exist_ok=True)
-                    with label_file_name.open("w") as outfile:
-                        json.dump(labels_json, outfile)
+                    archive.write_text(f"{job_name}/labels.json", json.dumps(labels_json))
                 else:
                     self.logger.warning(f"Job {job_name} is not compatible with the COCO format.")
         else:  # merged
@@ -142,10 +154,62 @@ class CocoExporter(AbstractExporter):
                 annotation_modifier=annotation_modifier,
                 merged=True,
             )
-            label_file_name = Path(output_directory) / self.project["id"] / "labels.json"
-            label_file_name.parent.mkdir(parents=True, exist_ok=True)
-            with label_file_name.open("w") as outfile:
-                json.dump(labels_json, outfile)
+            archive.write_text("labels.json", json.dumps(labels_json))
+
+    def _stream_assets_export(
+        self,
+        assets: Iterable[dict],
+        archive: ArchiveWriter,
+        annotation_modifier: Optional[CocoAnnotationModifier],
+    ) -> None:
+        """Write the labels files of an image project in a single pass over the assets."""
+        with ExitStack() as stack:
+            writers: list[CocoLabelsWriter] = []
+            if self.split_option == "split":
+                for job_name, job in self.project["jsonInterface"]["jobs"].items():
+                    if not self._is_job_compatible(job):
+                        self.logger.warning(
+                            f"Job {job_name} is not compatible with the COCO format."
+                        )
+                        continue
+                    writers.append(
+                        stack.enter_context(
+                            CocoLabelsWriter(
+                                archive,
+                                f"{job_name}/labels.json",
+                                jobs={job_name: job},
+                                title=self.project["title"],
+                                annotation_modifier=annotation_modifier,
+                                merged=False,
+                            )
+                        )
+                    )
+            else:  # merged
+                writers.append(
+                    stack.enter_context(
+                        CocoLabelsWriter(
+                            archive,
+                            "labels.json",
+                            jobs={
+                                k: job
+                                for k, job in self.project["jsonInterface"]["jobs"].items()
+                                if self._is_job_compatible(job)
+                            },
+                            title=self.project["title"],
+                            annotation_modifier=annotation_modifier,
+                            merged=True,
+                        )
+                    )
+                )
+            convert = partial(
+                _convert_asset,
+                jobs_mappings=[
+                    (list(writer.jobs), writer.cat_kili_id_to_coco_id) for writer in writers
+                ],
+            )
+            for (_, asset), conversions in map_assets(convert, enumerate(assets), self.workers):
+                for writer, conversion in zip(writers, conversions, strict=True):
+                    writer.add_converted_asset(asset, conversion)
 
     def _is_job_compatible(self, job: Job) -> bool:
         if "tools" not in job:
@@ -153,3 +217,15 @@ class CocoExporter(AbstractExporter):
         return (JobTool.SEMANTIC in job["tools"] or JobTool.RECTANGLE in job["tools"]) and job[
             "mlTask"
         ] == JobMLTask.OBJECT_DETECTION
+
+
+def _convert_asset(
+    indexed_asset: tuple[int, dict],
+    jobs_mappings: list[tuple[list[str], dict[str, dict[str, int]]]],
+) -> list[CocoAssetConversion]:
+    """Convert an asset for each labels file, given its jobs and its categories mapping."""
+    image_id, asset = indexed_asset
+    return [
+        convert_asset(asset, image_id, job_names, cat_kili_id_to_coco_id)
+        for job_names, cat_kili_id_to_coco_id in jobs_mappings
+    ]
@@ -0,0 +1,197 @@
+"""Writer of the COCO labels file of image projects, asset by asset."""
+
+import io
+import json
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, NamedTuple, Optional
+
+# private functions of kili-formats, whose annotation ids are their index in the annotations
+# of their job, counted from 1: this relies on the exact pin `kili-formats == 1.4.0`, so their
+# behavior must be checked again when the pin is bumped
+from kili_formats.format.coco import (
+    _get_coco_categories_with_mapping,
+    _get_coco_image_annotations,
+    coco_installed,
+)
+from kili_formats.media.image import get_image_dimensions
+from kili_formats.types import Job
+
+from kili.services.export.archive import ArchiveWriter
+from kili.services.export.format.coco.types import CocoAnnotation, CocoImage
+from kili.services.export.types import CocoAnnotationModifier
+
+DATA_SUBDIR = "data"
+
+
+class CocoLabelsWriter:
+    """Write a COCO labels file asset by asset, without holding the whole file in memory.
+
+    The images and the annotations are spooled to temporary files as they are added, and
+    written to the archive when the writer is closed, so that several labels files can be
+    written at once. The file is the same as the one of `convert_from_kili_to_coco_format`,
+    written with `json.dump`.
+    """
+
+    def __init__(
+        self,
+        archive: ArchiveWriter,
+        name: str,
+        jobs: dict[str, Job],
+        title: str,
+        annotation_modifier: Optional[CocoAnnotationModifier],
+        merged: bool,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            archive: Archive of the export.
+            name: Name of the labels file in the archive.
+            jobs: Jobs to convert, all of them if merged, else a single one.
+            title: Title of the project.
+            annotation_modifier: Function modifying the annotations, if any.
+            merged: Whether the categories of the jobs are merged into a single file.
+        """
+        if not coco_installed:
+            raise ImportError("Install with `pip install kili-formats[coco]` to use this feature.")
+        self.archive = archive
+        self.name = name
+        self.jobs = jobs
+        self.annotation_modifier = annotation_modifier
+        self.cat_kili_id_to_coco_id, categories = _get_coco_categories_with_mapping(jobs, merged)
+        self.nb_images = 0
+        self.annotation_offset = 0
+        self._nb_annotations = 0
+
+        infos_coco = {
+            "year": time.strftime("%Y"),
+            "version": "1.0",
+            "description": f"{title} - Exported from Kili Python Client",
+            "contributor": "Kili Technology",
+            "url": "https://kili-technology.com",
+            "date_created": datetime.now().isoformat(),
+        }
+        self._header = (
+            f'{{"info": {json.dumps(infos_coco)}, "licenses": [],'
+            f' "categories": {json.dumps(categories)}, "images": ['
+        )
+        self._images_file: IO[str] = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._annotations_file: IO[str] = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def add_asset(self, asset: dict) -> None:
+        """Convert the latest label of an image asset, and write its image and annotations."""
+        self.add_converted_asset(
+            asset,
+            convert_asset(asset, self.nb_images, list(self.jobs), self.cat_kili_id_to_coco_id),
+        )
+
+    def add_converted_asset(self, asset: dict, conversion: "CocoAssetConversion") -> None:
+        """Write the image and annotations of an image asset, converted by `convert_asset`."""
+        json_response = asset["latestLabel"]["jsonResponse"]
+        self._images_file.write(
+            ("" if self.nb_images == 0 else ", ") + json.dumps(conversion.image)
+        )
+        self.nb_images += 1
+        for job_name, coco_annotations in conversion.annotations_by_job.items():
+            kili_annotations = json_response[job_name]["annotations"]
+            for coco_annotation in coco_annotations:
+                # the ids of kili-formats 1.4.0 index the annotations of the job from 1
+                kili_annotation = kili_annotations[coco_annotation["id"] - 1]
+                coco_annotation["id"] += self.annotation_offset
+                annotation_json = (
+                    self.annotation_modifier(
+                        dict(coco_annotation), dict(conversion.image), kili_annotation
+                    )
+                    if self.annotation_modifier
+                    else coco_annotation
+                )
+                self._annotations_file.write(
+                    ("" if self._nb_annotations == 0 else ", ") + json.dumps(annotation_json)
+                )
+                self._nb_annotations += 1
+            # the ids of the annotations are counted with the empty annotations
+            self.annotation_offset += len(kili_annotations)
+
+    def close(self) -> None:
+        """Write the labels file to the archive."""
+        try:
+            with (
+                self.archive.open(self.name) as file,
+                io.TextIOWrapper(file, encoding="utf-8") as text_file,
+            ):
+                text_file.write(self._header)
+                self._images_file.seek(0)
+                shutil.copyfileobj(self._images_file, text_file)
+                text_file.write('], "annotations": [')
+                self._annotations_file.seek(0)
+                shutil.copyfileobj(self._annotations_file, text_file)
+                text_file.write("]}")
+        finally:
+            self._images_file.close()
+            self._annotations_file.close()
+
+    def discard(self) -> None:
+        """Discard the labels file, without writing it."""
+        self._images_file.close()
+        self._annotations_file.close()
+
+    def __enter__(self) -> "CocoLabelsWriter":
+        return self
+
+    def __exit__(self, type_, value, traceback) -> None:
+        if type_ is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class CocoAssetConversion(NamedTuple):
+    """COCO image of an asset, and COCO annotations of its latest label for each job."""
+
+    image: CocoImage
+    # the id of an annotation is its index in the annotations of its job, counted from 1
+    annotations_by_job: dict[str, list[CocoAnnotation]]
+
+
+def convert_asset(
+    asset: dict,
+    image_id: int,
+    job_names: list[str],
+    cat_kili_id_to_coco_id: dict[str, dict[str, int]],
+) -> CocoAssetConversion:
+    """Convert the latest label of an image asset, without the annotation modifier.
+
+    It does not depend on the previous assets, so that the assets can be converted in parallel.
+    """
+    width, height = get_image_dimensions(asset)
+    if Path(asset["content"]).is_file():
+        filename = str(DATA_SUBDIR + "/" + Path(asset["content"]).name)
+    else:
+        filename = str(DATA_SUBDIR + "/" + asset["externalId"])
+    coco_image = CocoImage(
+        id=image_id,
+        license=0,
+        file_name=filename,
+        height=height,
+        width=width,
+        date_captured=None,
+    )
+    json_response = asset["latestLabel"]["jsonResponse"]
+    rotation = json_response["ROTATION_JOB"]["rotation"] if "ROTATION_JOB" in json_response else 0
+
+    annotations_by_job = {}
+    for job_name in job_names:
+        if job_name not in json_response:
+            continue
+        annotations_by_job[job_name], _ = _get_coco_image_annotations(
+            json_response[job_name]["annotations"],
+            cat_kili_id_to_coco_id[job_name],
+            0,
+            coco_image,
+            annotation_modifier=None,
+            rotation=rotation,
+        )
+    return CocoAssetConversion(image=coco_image, annotations_by_job=annotations_by_job)
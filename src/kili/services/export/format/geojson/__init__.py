@@ -1,12 +1,14 @@
 """Common code for the GeoJson exporter."""
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from kili_formats.format.geojson import convert_from_kili_to_geojson_format
 from kili_formats.types import Job, JobTool
 
 from kili.domain.ontology import JobMLTask
+from kili.services.export.archive import ArchiveWriter
 from kili.services.export.exceptions import NotCompatibleInputType, NotCompatibleOptions
 from kili.services.export.format.base import AbstractExporter
 from kili.services.export.tools import is_geotiff_asset_with_lat_lon_coords
@@ -63,39 +65,43 @@ class GeoJsonExporter(AbstractExporter):
             for tool in job["tools"]  # pyright: ignore[reportGeneralTypeIssues]
         )
 
-    def process_and_save(self, assets: list[dict], output_filename: Path) -> None:
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path) -> None:
         self.logger.info("Exporting to GeoJson format")
 
-        labels_folder = self.base_folder / "labels"
-        labels_folder.mkdir(parents=True, exist_ok=True)
         project_type = self.project.get("inputType")
-        geotiff_assets = [
-            asset
-            for asset in assets
-            if project_type == "GEOSPATIAL"
-            or is_geotiff_asset_with_lat_lon_coords(asset, self.kili.http_client)
-        ]
-        if len(geotiff_assets) < len(assets):
-            self.logger.warning(
-                f"Among {len(assets)} assets, only {len(geotiff_assets)} are geotiff assets and"
-                " will be exported."
-            )
 
         # Get json_interface for GIS-friendly property names
         json_interface = self.project.get("jsonInterface")
 
-        for asset in tqdm(geotiff_assets, disable=self.disable_tqdm):
-            _process_asset(asset, labels_folder, json_interface, flatten_properties=True)
-
-        self.create_readme_kili_file(self.export_root_folder)
-        self.make_archive(self.export_root_folder, output_filename)
+        nb_assets = 0
+        nb_geotiff_assets = 0
+        with self.open_archive(output_filename) as archive:
+            archive.mkdir("labels")
+            labels_folder = archive.folder("labels")
+
+            for asset in tqdm(assets, disable=self.disable_tqdm):
+                nb_assets += 1
+                if project_type == "GEOSPATIAL" or is_geotiff_asset_with_lat_lon_coords(
+                    asset, self.kili.http_client
+                ):
+                    nb_geotiff_assets += 1
+                    _process_asset(asset, labels_folder, json_interface, flatten_properties=True)
+
+            if nb_geotiff_assets < nb_assets:
+                self.logger.warning(
+                    f"Among {nb_assets} assets, only {nb_geotiff_assets} are geotiff assets and"
+                    " will be exported."
+                )
+
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
 
 def _process_asset(
     asset: dict,
-    labels_folder: Path,
+    labels_folder: ArchiveWriter,
     json_interface: dict | None = None,
     flatten_properties: bool = False,
 ) -> None:
@@ -119,7 +125,6 @@ def _process_asset(
         geojson_feature_collection = convert_from_kili_to_geojson_format(
             latest_label["jsonResponse"], json_interface, flatten_properties
         )
-        filepath = labels_folder / f"{asset['externalId']}{label_suffix}.geojson"
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as file:
-            json.dump(geojson_feature_collection, file)
+        labels_folder.write_text(
+            f"{asset['externalId']}{label_suffix}.geojson", json.dumps(geojson_feature_collection)
+        )
@@ -1,13 +1,17 @@
 """Common code for the Kili exporter."""
 
-import json
+from collections.abc import Iterable, Iterator
+from functools import partial
 from pathlib import Path
 
 from kili_formats import clean_json_response, convert_to_pixel_coords
 from kili_formats.media.video import cut_video
 from kili_formats.types import Job, ProjectDict
 
+from kili.core.utils import json_codec
+from kili.services.export.exceptions import NotCompatibleOptions
 from kili.services.export.format.base import AbstractExporter
+from kili.services.export.process_pool import map_assets
 
 
 class KiliExporter(AbstractExporter):
@@ -17,18 +21,29 @@ class KiliExporter(AbstractExporter):
 
     ASSETS_DIR_NAME = "assets"
 
+    supports_incremental_export = True
+
     def _check_arguments_compatibility(self) -> None:
         """Check if the export label format is compatible with the export options."""
 
     def _check_project_compatibility(self) -> None:
         """Check if the export label format is compatible with the project."""
 
+    def _check_incremental_export_compatibility(self) -> None:
+        """Check if the export can convert only the assets changed since the previous export."""
+        if self.label_format == "kili_jsonl":
+            raise NotCompatibleOptions(
+                "The kili_jsonl format cannot be exported incrementally, its assets are written"
+                " into a single file."
+            )
+        super()._check_incremental_export_compatibility()
+
     def _is_job_compatible(self, job: Job) -> bool:
         """Check if the export label format is compatible with the job."""
         _ = job
         return True  # kili format is compatible with all jobs
 
-    def _save_assets_export(self, assets: list[dict], output_filename: Path) -> None:
+    def _save_assets_export(self, assets: Iterable[dict], output_filename: Path) -> None:
         """Save the assets to a file and return the link to that file."""
         self.logger.info("Exporting to kili format...")
 
@@ -38,29 +53,28 @@ class KiliExporter(AbstractExporter):
 
             assets = self._clean_filepaths(assets)
 
-        if self.single_file:
-            project_json = json.dumps(assets, sort_keys=True, indent=4)
-            self.base_folder.mkdir(parents=True, exist_ok=True)
-            with (self.base_folder / "data.json").open("wb") as output_file:
-                output_file.write(project_json.encode("utf-8"))
-        else:
-            labels_folder = self.base_folder / "labels"
-            labels_folder.mkdir(parents=True, exist_ok=True)
-            for asset in assets:
-                external_id = asset["externalId"].replace(" ", "_")
-                asset_json = json.dumps(asset, sort_keys=True, indent=4)
-                file_path = labels_folder / f"{external_id}.json"
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                with file_path.open("wb") as output_file:
-                    output_file.write(asset_json.encode("utf-8"))
-
-        self.create_readme_kili_file(self.export_root_folder)
-
-        self.make_archive(self.export_root_folder, output_filename)
+        with self.open_archive(output_filename) as archive:
+            if self.label_format == "kili_jsonl":
+                with archive.open_text("data.jsonl") as file:
+                    json_codec.dump_lines(assets, file, sort_keys=True)
+            elif self.single_file:
+                with archive.open_text("data.json") as file:
+                    json_codec.dump_array(assets, file, indent=4, sort_keys=True)
+            else:
+                archive.mkdir("labels")
+                labels_folder = archive.folder("labels")
+                for asset in assets:
+                    external_id = asset["externalId"].replace(" ", "_")
+                    asset_json = json_codec.dumps(asset, sort_keys=True, indent=4)
+                    with archive.asset_entries(asset):
+                        labels_folder.write_text(f"{external_id}.json", asset_json)
+
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
-    def _clean_filepaths(self, assets: list[dict]) -> list[dict]:
+    def _clean_filepaths(self, assets: Iterable[dict]) -> Iterator[dict]:
         """Remove TemporaryDirectory() prefix from filepaths in "jsonContent" and "content" fields."""
         for asset in assets:
             if Path(asset["content"]).is_file():
@@ -77,9 +91,9 @@ class KiliExporter(AbstractExporter):
                 ]
 
                 asset["jsonContent"] = json_content_list
-        return assets
+            yield asset
 
-    def _cut_video_assets(self, assets: list[dict]) -> list[dict]:
+    def _cut_video_assets(self, assets: Iterable[dict]) -> Iterator[dict]:
         """Cut video assets into frames."""
         for asset in assets:
             if asset["jsonContent"] == "" and Path(asset["content"]).is_file():
@@ -88,6 +102,7 @@ class KiliExporter(AbstractExporter):
                 )
                 nbr_frames = len((label_for_frames or {}).get("jsonResponse", {}))
                 if nbr_frames == 0:
+                    yield asset
                     continue
                 leading_zeros = len(str(nbr_frames))
                 try:
@@ -101,21 +116,20 @@ class KiliExporter(AbstractExporter):
                     raise ImportError(
                         "Install with `pip install kili[video]` to use this feature."
                     ) from e
-        return assets
+            yield asset
 
-    def process_and_save(self, assets: list[dict], output_filename: Path) -> None:
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path) -> None:
         """Extract formatted annotations from labels and save the json in the buckets."""
-        clean_assets = self.preprocess_assets(assets)
+        clean_assets = self.iter_preprocessed_assets(assets, self.include_sent_back_labels)
         if self.project["inputType"] in ["IMAGE", "PDF", "VIDEO"]:
-            for i, asset in enumerate(clean_assets):
-                clean_assets[i] = convert_to_pixel_coords(asset, self.project)
-                clean_json_response(asset)
-                if asset is not None:
-                    clean_assets[i] = asset
-                else:
-                    self.logger.warning(
-                        "Asset could not be cleaned and was skipped", extra={"asset_index": i}
-                    )
+            clean_assets = (
+                converted_asset
+                for _, converted_asset in map_assets(
+                    partial(_convert_to_pixel_coords, project=self.project),
+                    clean_assets,
+                    self.workers,
+                )
+            )
         return self._save_assets_export(
             clean_assets,
             output_filename,
@@ -125,3 +139,10 @@ class KiliExporter(AbstractExporter):
     def images_folder(self) -> Path:
         """Export images folder."""
         return self.base_folder / self.ASSETS_DIR_NAME
+
+
+def _convert_to_pixel_coords(asset: dict, project: ProjectDict) -> dict:
+    """Convert the vertices of the labels of an asset to pixel coordinates, and clean them."""
+    convert_to_pixel_coords(asset, project)
+    clean_json_response(asset)
+    return asset
@@ -1,6 +1,7 @@
 """Common code for the PASCAL VOC exporter."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from functools import partial
 from pathlib import Path
 
 from kili_formats import convert_from_kili_to_voc_format
@@ -15,12 +16,15 @@ from kili.services.export.exceptions import (
     NotCompatibleOptions,
 )
 from kili.services.export.format.base import AbstractExporter
+from kili.services.export.process_pool import map_assets
 from kili.utils.tqdm import tqdm
 
 
 class VocExporter(AbstractExporter):
     """Common code for VOC exporter."""
 
+    supports_incremental_export = True
+
     def _check_arguments_compatibility(self) -> None:
         """Check if the export label format is compatible with the export options."""
         if self.single_file:
@@ -57,18 +61,28 @@ class VocExporter(AbstractExporter):
             return False
         return JobTool.RECTANGLE in job["tools"] and job["mlTask"] == JobMLTask.OBJECT_DETECTION
 
-    def process_and_save(self, assets: list[dict], output_filename: Path) -> None:
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path) -> None:
         """Save the assets and annotations to a zip file in the Pascal VOC format."""
         self.logger.info("Exporting VOC format")
 
-        labels_folder = self.base_folder / "labels"
-        labels_folder.mkdir(parents=True, exist_ok=True)
+        with self.open_archive(output_filename) as archive:
+            archive.mkdir("labels")
+            labels_folder = archive.folder("labels")
 
-        for asset in tqdm(assets, disable=self.disable_tqdm):
-            _process_asset(asset, labels_folder, self.project["inputType"], self.compatible_jobs)
+            convert_asset = partial(
+                _convert_asset,
+                project_input_type=self.project["inputType"],
+                valid_jobs=self.compatible_jobs,
+            )
+            for asset, labels_files in map_assets(
+                convert_asset, tqdm(assets, disable=self.disable_tqdm), self.workers
+            ):
+                with archive.asset_entries(asset):
+                    for filename, annotations in labels_files:
+                        labels_folder.write_text(filename, annotations)
 
-        self.create_readme_kili_file(self.export_root_folder)
-        self.make_archive(self.export_root_folder, output_filename)
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
@@ -77,14 +91,13 @@ class VocExporter(AbstractExporter):
 def _process_video_asset(
     asset: dict,
     latest_label: dict,
-    labels_folder: Path,
     label_suffix: str,
     valid_jobs: Sequence[str],
-) -> None:
-    """Process a video asset and save annotations."""
+) -> list[tuple[str, str]]:
+    """Process a video asset, and return the names and contents of its annotations files."""
     nbr_frames = len(latest_label.get("jsonResponse", {}))
     if nbr_frames < 1:
-        return
+        return []
     leading_zeros = len(str(nbr_frames))
 
     width = height = 0
@@ -106,28 +119,26 @@ def _process_video_asset(
     else:
         raise FileNotFoundError(f"Could not find frames or video for asset {asset}")
 
+    labels_files = []
     for frame_id, json_response in latest_label["jsonResponse"].items():
         frame_name = (
-            f'{asset["externalId"]}_{str(int(frame_id)+1).zfill(leading_zeros)}{label_suffix}'
+            f"{asset['externalId']}_{str(int(frame_id) + 1).zfill(leading_zeros)}{label_suffix}"
         )
         parameters = {"filename": f"{frame_name}{frame_ext}"}
         annotations = convert_from_kili_to_voc_format(
             json_response, width, height, parameters, valid_jobs
         )
-        filepath = labels_folder / f"{frame_name}.xml"
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "wb") as fout:
-            fout.write(f"{annotations}\n".encode())
+        labels_files.append((f"{frame_name}.xml", f"{annotations}\n"))
+    return labels_files
 
 
 def _process_image_asset(
     asset: dict,
     latest_label: dict,
-    labels_folder: Path,
     label_suffix: str,
     valid_jobs: Sequence[str],
-) -> None:
-    """Process an image asset and save annotations."""
+) -> list[tuple[str, str]]:
+    """Process an image asset, and return the names and contents of its annotations files."""
     json_response = latest_label["jsonResponse"]
     width, height = get_image_dimensions(asset)
     filename = (
@@ -137,17 +148,14 @@ def _process_image_asset(
     annotations = convert_from_kili_to_voc_format(
         json_response, width, height, parameters, valid_jobs
     )
-    xml_filename = f'{asset["externalId"]}{label_suffix}.xml'
-    filepath = labels_folder / xml_filename
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "wb") as fout:
-        fout.write(f"{annotations}\n".encode())
+    xml_filename = f"{asset['externalId']}{label_suffix}.xml"
+    return [(xml_filename, f"{annotations}\n")]
 
 
-def _process_asset(
-    asset: dict, labels_folder: Path, project_input_type: str, valid_jobs: Sequence[str]
-) -> None:
-    """Process an asset."""
+def _convert_asset(
+    asset: dict, project_input_type: str, valid_jobs: Sequence[str]
+) -> list[tuple[str, str]]:
+    """Convert the labels of an asset, and return the names and contents of their files."""
     # Collect all labels to process (handle both latestLabel and latestLabels)
     labels_to_process = []
     if "latestLabel" in asset and asset["latestLabel"]:
@@ -157,15 +165,14 @@ def _process_asset(
             if label is not None:
                 labels_to_process.append(label)
 
-    if not labels_to_process:
-        return
-
+    labels_files = []
     # Process each label
     for label_idx, latest_label in enumerate(labels_to_process, start=1):
         # Add label suffix if we have multiple labels
         label_suffix = f"_label{label_idx}" if len(labels_to_process) > 1 else ""
 
         if project_input_type == "VIDEO":
-            _process_video_asset(asset, latest_label, labels_folder, label_suffix, valid_jobs)
+            labels_files += _process_video_asset(asset, latest_label, label_suffix, valid_jobs)
         elif project_input_type == "IMAGE":
-            _process_image_asset(asset, latest_label, labels_folder, label_suffix, valid_jobs)
+            labels_files += _process_image_asset(asset, latest_label, label_suffix, valid_jobs)
+    return labels_files
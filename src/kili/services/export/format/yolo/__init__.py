@@ -1,19 +1,24 @@
 """Common code for the yolo exporter."""
 
 import logging
+from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 from kili_formats import convert_from_kili_to_yolo_format
 from kili_formats.media.video import cut_video
 from kili_formats.types import Job, JobCategory, JobTool
 
 from kili.domain.ontology import JobMLTask
+from kili.services.export.archive import ArchiveWriter
 from kili.services.export.exceptions import (
     NoCompatibleJobError,
     NotCompatibleInputType,
     NotCompatibleOptions,
 )
 from kili.services.export.format.base import AbstractExporter
+from kili.services.export.process_pool import map_assets
 from kili.services.export.repository import AbstractContentRepository, DownloadError
 from kili.services.export.types import LabelFormat, SplitOption
 from kili.utils.tqdm import tqdm
@@ -21,6 +26,14 @@ from kili.utils.tqdm import tqdm
 IMAGE_EXTENSIONS = {".jpeg", ".jpg", ".png", ".bmp", ".gif", ".webp", ".ico"}
 
 
+class _LabelsFolder(NamedTuple):
+    """Folder of the archive receiving the labels of some categories."""
+
+    categories_id: dict[str, JobCategory]
+    labels_folder: ArchiveWriter
+    base_folder: ArchiveWriter
+
+
 class YoloExporter(AbstractExporter):
     """Common code for Yolo exporters."""
 
@@ -80,99 +93,113 @@ class YoloExporter(AbstractExporter):
             for tool in job["tools"]  # pyright: ignore[reportGeneralTypeIssues]
         )
 
-    def process_and_save(self, assets: list[dict], output_filename: Path) -> None:
+    def process_and_save(self, assets: Iterable[dict], output_filename: Path) -> None:
         """Yolo specific process and save."""
         if self.split_option == "merged":
             return self._process_and_save_merge(assets, output_filename)
         return self._process_and_save_split(assets, output_filename)
 
-    def _process_and_save_split(self, assets: list[dict], output_filename: Path) -> None:
+    def _process_and_save_split(self, assets: Iterable[dict], output_filename: Path) -> None:
         self.logger.info("Exporting to yolo format split...")
 
-        self._write_jobs_labels_into_split_folders(
-            assets,
-            self.categories_by_job,
-            self.export_root_folder,
-            self.images_folder,
-        )
-        self.create_readme_kili_file(self.export_root_folder)
-        self.make_archive(self.export_root_folder, output_filename)
+        with self.open_archive(output_filename) as archive:
+            self._write_jobs_labels_into_split_folders(assets, self.categories_by_job, archive)
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
-    def _process_and_save_merge(self, assets: list[dict], output_filename: Path) -> None:
+    def _process_and_save_merge(self, assets: Iterable[dict], output_filename: Path) -> None:
         self.logger.info("Exporting to yolo format merged...")
 
-        labels_folder = self.base_folder / "labels"
-        labels_folder.mkdir(parents=True, exist_ok=True)
-        self._write_labels_into_single_folder(
-            assets,
-            self.merged_categories_id,
-            labels_folder,
-            self.images_folder,
-            self.base_folder,
-        )
-        self.create_readme_kili_file(self.export_root_folder)
-        self.make_archive(self.export_root_folder, output_filename)
+        with self.open_archive(output_filename) as archive:
+            archive.mkdir("labels")
+            self._write_labels_into_folders(
+                assets,
+                [_LabelsFolder(self.merged_categories_id, archive.folder("labels"), archive)],
+                archive,
+            )
+            self.create_readme_kili_file(archive)
+            self.add_staged_files(archive)
 
         self.logger.warning(output_filename)
 
-    def _write_labels_into_single_folder(
+    def _write_labels_into_folders(
         self,
-        assets: list[dict],
-        categories_id: dict[str, JobCategory],
-        labels_folder: Path,
-        images_folder: Path,
-        base_folder: Path,
-    ):  # pylint: disable=too-many-arguments
-        """Write all the labels into a single folder."""
-        _write_class_file(base_folder, categories_id, self.label_format, self.split_option)
-
-        remote_content = []
-        video_metadata = {}
-
-        for asset in tqdm(assets, disable=self.disable_tqdm):
-            asset_remote_content, video_filenames = _process_asset(
-                asset,
-                images_folder,
-                labels_folder,
-                categories_id,
-                self.content_repository,
-                self.with_assets,
-                self.project["inputType"],
+        assets: Iterable[dict],
+        folders: list[_LabelsFolder],
+        archive: ArchiveWriter,
+    ) -> None:
+        """Write the labels into each of the folders, in a single pass over the assets.
+
+        The media, downloaded or cut into frames, are written on disk in the images folder.
+        """
+        for folder in folders:
+            _write_class_file(
+                folder.base_folder, folder.categories_id, self.label_format, self.split_option
             )
-            if video_filenames:
-                video_metadata[asset["externalId"]] = video_filenames
-            remote_content.extend(asset_remote_content)
 
-        if video_metadata:
-            self.write_video_metadata_file(video_metadata, base_folder)
+        remote_content_by_folder: list[list] = [[] for _ in folders]
+        video_metadata_by_folder: list[dict] = [{} for _ in folders]
 
-        if len(remote_content) > 0:
-            self.images_folder.mkdir(parents=True, exist_ok=True)
-            self.write_remote_content_file(remote_content, images_folder)
+        convert_asset = partial(
+            _convert_asset, categories_by_folder=[folder.categories_id for folder in folders]
+        )
+        for asset, frame_labels_by_folder in map_assets(
+            convert_asset, tqdm(assets, disable=self.disable_tqdm), self.workers
+        ):
+            for folder, remote_content, video_metadata, frame_labels in zip(
+                folders,
+                remote_content_by_folder,
+                video_metadata_by_folder,
+                frame_labels_by_folder,
+                strict=True,
+            ):
+                asset_remote_content, video_filenames = _process_asset(
+                    asset,
+                    self.images_folder,
+                    folder.labels_folder,
+                    folder.categories_id,
+                    self.content_repository,
+                    self.with_assets,
+                    self.project["inputType"],
+                    frame_labels,
+                )
+                if video_filenames:
+                    video_metadata[asset["externalId"]] = video_filenames
+                remote_content.extend(asset_remote_content)
+
+        for folder, video_metadata in zip(folders, video_metadata_by_folder, strict=True):
+            if video_metadata:
+                self.write_video_metadata_file(video_metadata, folder.base_folder)
+
+        # the folders share the images folder, the file of the last folder with remote content
+        # is the one kept
+        remote_content = next(
+            (content for content in reversed(remote_content_by_folder) if content), None
+        )
+        if remote_content:
+            images_folder = self.images_folder.relative_to(self.base_folder).as_posix()
+            self.write_remote_content_file(remote_content, archive.folder(images_folder))
 
     def _write_jobs_labels_into_split_folders(
         self,
-        assets: list[dict],
+        assets: Iterable[dict],
         categories_by_job: dict[str, dict[str, JobCategory]],
-        root_folder: Path,
-        images_folder: Path,
+        archive: ArchiveWriter,
     ) -> None:
         """Write assets into split folders."""
+        folders = []
         for job_id, category_ids in categories_by_job.items():
-            base_folder = root_folder / self.project_id / job_id
-            labels_folder = base_folder / "labels"
-            labels_folder.mkdir(parents=True, exist_ok=True)
-
-            self._write_labels_into_single_folder(
-                assets,
-                category_ids,
-                labels_folder,
-                images_folder,
-                base_folder,
+            archive.mkdir(f"{job_id}/labels")
+            folders.append(
+                _LabelsFolder(
+                    category_ids, archive.folder(f"{job_id}/labels"), archive.folder(job_id)
+                )
             )
 
+        self._write_labels_into_folders(assets, folders, archive)
+
     def _get_merged_categories(self, json_interface: dict) -> dict[str, JobCategory]:
         """Return a dictionary of JobCategory instances by category full name."""
         cat_number = 0
@@ -269,13 +296,17 @@ def _process_frame(
     content_frames: list[str],
     job_ids: set[str],
     category_ids: dict[str, JobCategory],
-    labels_folder: Path,
+    labels_folder: ArchiveWriter,
     images_folder: Path,
     content_repository: AbstractContentRepository,
     with_assets: bool,
     all_video_filenames: list[str],
+    frame_labels: Optional[list[tuple]] = None,
 ) -> list[tuple[str, str, str]]:
-    """Process a single frame and return asset remote content."""
+    """Process a single frame and return asset remote content.
+
+    The labels of the frame are converted, unless they are given in `frame_labels`.
+    """
     asset_remote_content = []
 
     if label_frames.is_frame_group:
@@ -285,7 +316,8 @@ def _process_frame(
     else:
         filename = asset["externalId"] + label_suffix
 
-    frame_labels = _get_frame_labels(frame, job_ids, category_ids)
+    if frame_labels is None:
+        frame_labels = _get_frame_labels(frame, job_ids, category_ids)
     _write_labels_to_file(labels_folder, filename, frame_labels)
 
     # no need to write asset urls since they are already downloaded
@@ -313,23 +345,20 @@ def _process_frame(
 def _process_asset(
     asset: dict,
     images_folder: Path,
-    labels_folder: Path,
+    labels_folder: ArchiveWriter,
     category_ids: dict[str, JobCategory],
     content_repository: AbstractContentRepository,
     with_assets: bool,
     project_input_type: str,
+    frame_labels: Optional[dict[tuple[int, int], list[tuple]]] = None,
 ) -> tuple[list[tuple[str, str, str]], list[str]]:
     # pylint: disable=too-many-locals, too-many-arguments
-    """Process an asset for all job_ids of category_ids."""
-    # Collect all labels to process (handle both latestLabel and latestLabels)
-    labels_to_process = []
-    if "latestLabel" in asset and asset["latestLabel"]:
-        labels_to_process.append(asset["latestLabel"])
-    if "latestLabels" in asset and asset["latestLabels"]:
-        for label in asset["latestLabels"]:
-            if label is not None:
-                labels_to_process.append(label)
+    """Process an asset for all job_ids of category_ids.
 
+    The labels of the frames are converted, unless they are given in `frame_labels`,
+    as returned by `_convert_asset`.
+    """
+    labels_to_process = _get_labels_to_process(asset)
     if not labels_to_process:
         return [], []
 
@@ -384,14 +413,48 @@ def _process_asset(
                 content_repository,
                 with_assets,
                 all_video_filenames,
+                frame_labels[(label_idx, idx)] if frame_labels is not None else None,
             )
             asset_remote_content.extend(frame_remote_content)
 
     return asset_remote_content, all_video_filenames
 
 
+def _get_labels_to_process(asset: dict) -> list[dict]:
+    """Collect all labels to process (handle both latestLabel and latestLabels)."""
+    labels_to_process = []
+    if "latestLabel" in asset and asset["latestLabel"]:
+        labels_to_process.append(asset["latestLabel"])
+    if "latestLabels" in asset and asset["latestLabels"]:
+        for label in asset["latestLabels"]:
+            if label is not None:
+                labels_to_process.append(label)
+    return labels_to_process
+
+
+def _convert_asset(
+    asset: dict, categories_by_folder: list[dict[str, JobCategory]]
+) -> list[dict[tuple[int, int], list[tuple]]]:
+    """Convert the labels of the frames of an asset, for the categories of each folder.
+
+    Returns:
+        For each folder, the labels of the frames by label index and frame index.
+    """
+    labels_to_process = _get_labels_to_process(asset)
+    frame_labels_by_folder = []
+    for category_ids in categories_by_folder:
+        job_ids = {job_category.job_id for job_category in category_ids.values()}
+        frame_labels = {}
+        for label_idx, latest_label in enumerate(labels_to_process, start=1):
+            label_frames = _LabelFrames.from_asset(asset, job_ids, latest_label)
+            for idx, frame in label_frames.frames.items():
+                frame_labels[(label_idx, idx)] = _get_frame_labels(frame, job_ids, category_ids)
+        frame_labels_by_folder.append(frame_labels)
+    return frame_labels_by_folder
+
+
 def _write_class_file(
-    folder: Path,
+    folder: ArchiveWriter,
     category_ids: dict[str, JobCategory],
     label_format: LabelFormat,
     layout: SplitOption,
@@ -402,20 +465,20 @@ def _write_class_file(
     since a same category name can be used in several jobs.
     """
     if label_format == "yolo_v4":
-        with (folder / "classes.txt").open("wb") as fout:
+        with folder.open("classes.txt") as fout:
             for job_category in category_ids.values():
                 prefix = f"{job_category.job_id}/" if layout == "merged" else ""
                 fout.write(f"{job_category.id} {prefix}{job_category.category_name}\n".encode())
 
     elif label_format == "yolo_v5":
-        with (folder / "data.yaml").open("wb") as fout:
+        with folder.open("data.yaml") as fout:
             fout.write(b"names:\n")
             for ind, job_category in enumerate(category_ids.values()):
                 prefix = f"{job_category.job_id}/" if layout == "merged" else ""
                 fout.write(f"  {ind}: {prefix}{job_category.category_name}\n".encode())
 
     elif label_format in ("yolo_v7", "yolo_v8"):
-        with (folder / "data.yaml").open("wb") as fout:
+        with folder.open("data.yaml") as fout:
             categories = ""
             for job_category in category_ids.values():
                 prefix = f"{job_category.job_id}/" if layout == "merged" else ""
@@ -431,7 +494,8 @@ def _get_frame_labels(
     frame: dict, job_ids: set[str], category_ids: dict[str, JobCategory]
 ) -> list[tuple]:
     annotations = []
-    for job_id in job_ids:
+    # sorted so that the labels files do not depend on the hash seed of the process
+    for job_id in sorted(job_ids):
         job_annotations = convert_from_kili_to_yolo_format(
             job_id, frame["latestLabel"], category_ids
         )
@@ -454,10 +518,10 @@ def _write_content_frame_to_file(
             fout.write(block)
 
 
-def _write_labels_to_file(labels_folder: Path, filename: str, annotations: list[tuple]) -> None:
-    file_path = labels_folder / f"{_remove_image_extension(filename)}.txt"
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("wb") as fout:
+def _write_labels_to_file(
+    labels_folder: ArchiveWriter, filename: str, annotations: list[tuple]
+) -> None:
+    with labels_folder.open(f"{_remove_image_extension(filename)}.txt") as fout:
         for category_idx, *points in annotations:
             points_str = " ".join([str(point) for point in points])
             fout.write(f"{category_idx} {points_str}\n".encode())
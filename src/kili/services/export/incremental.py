@@ -0,0 +1,242 @@
+"""Incremental exports, converting only the assets changed since the previous export.
+
+The files written for each asset are listed in a manifest saved next to the archive, with
+the version of the asset and the hash of each file. The next export fetches and converts
+only the assets whose version changed, and copies the files of the other assets from the
+previous archive, checking their hashes.
+"""
+
+import hashlib
+import io
+import zipfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, NamedTuple, Optional, cast
+
+from kili.core.utils import json_codec
+from kili.services.export.archive import ArchiveWriter, ZipArchiveWriter
+from kili.services.export.exceptions import IncrementalExportError
+
+MANIFEST_VERSION = 1
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def get_manifest_path(output_file: Path) -> Path:
+    """Get the path of the manifest of an export archive."""
+    return output_file.with_name(f"{output_file.name}.manifest.json")
+
+
+class ExportManifest(NamedTuple):
+    """Manifest of an export, listing the version and the files of each exported asset."""
+
+    # options of the export changing its files, the export is full if they change
+    options: dict
+    # update date, label ids, and hash of each file by name, by asset id
+    assets: dict[str, dict]
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ExportManifest"]:
+        """Load a manifest, if it exists and was written by this version of the manifest."""
+        if not path.is_file():
+            return None
+        manifest = json_codec.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(options=manifest["options"], assets=manifest["assets"])
+
+    def save(self, path: Path) -> None:
+        """Save the manifest, replacing the previous one at once."""
+        partial_path = path.with_name(f"{path.name}.partial")
+        partial_path.write_text(
+            json_codec.dumps(
+                {"version": MANIFEST_VERSION, "options": self.options, "assets": self.assets},
+                sort_keys=True,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        partial_path.replace(path)
+
+
+class IncrementalExportPlan(NamedTuple):
+    """Assets to convert during an incremental export, and files to keep from the previous one."""
+
+    # None if every asset is converted, because there is no previous export to reuse
+    changed_asset_ids: Optional[list[str]]
+    nb_removed_assets: int
+    # manifest of the export, completed with the files of the changed assets while written
+    manifest: ExportManifest
+    # hash of each file of the unchanged assets, by name
+    kept_files: dict[str, str]
+
+    @property
+    def is_up_to_date(self) -> bool:
+        """Whether the previous export has the current version of every asset."""
+        return self.changed_asset_ids == [] and self.nb_removed_assets == 0
+
+
+def plan_incremental_export(
+    output_file: Path, options: dict, asset_versions: dict[str, dict]
+) -> IncrementalExportPlan:
+    """Compare the current version of the assets with the manifest of the previous export.
+
+    Args:
+        output_file: Path of the archive of the export.
+        options: Options of the export changing its files.
+        asset_versions: Update date and label ids of the assets to export, by asset id.
+    """
+    previous_manifest = (
+        ExportManifest.load(get_manifest_path(output_file)) if output_file.is_file() else None
+    )
+    if previous_manifest is None or previous_manifest.options != options:
+        return IncrementalExportPlan(
+            changed_asset_ids=None,
+            nb_removed_assets=0,
+            manifest=ExportManifest(
+                options=options,
+                assets={
+                    asset_id: {**version, "files": {}}
+                    for asset_id, version in asset_versions.items()
+                },
+            ),
+            kept_files={},
+        )
+
+    changed_asset_ids = []
+    assets = {}
+    kept_files = {}
+    for asset_id, version in asset_versions.items():
+        previous_asset = previous_manifest.assets.get(asset_id)
+        if previous_asset is not None and all(
+            previous_asset.get(key) == value for key, value in version.items()
+        ):
+            assets[asset_id] = previous_asset
+            kept_files.update(previous_asset["files"])
+        else:
+            changed_asset_ids.append(asset_id)
+            assets[asset_id] = {**version, "files": {}}
+    return IncrementalExportPlan(
+        changed_asset_ids=changed_asset_ids,
+        nb_removed_assets=len(previous_manifest.assets.keys() - asset_versions.keys()),
+        manifest=ExportManifest(options=options, assets=assets),
+        kept_files=kept_files,
+    )
+
+
+def _copy_file(source: IO[bytes], target: Optional[IO[bytes]]) -> str:
+    """Copy a file if a target is given, and return the SHA-256 hash of its content."""
+    file_hash = hashlib.sha256()
+    while chunk := source.read(COPY_BUFFER_SIZE):
+        file_hash.update(chunk)
+        if target is not None:
+            target.write(chunk)
+    return file_hash.hexdigest()
+
+
+class _HashingFile(io.RawIOBase):
+    """Writable file computing the SHA-256 hash of the data written to another file."""
+
+    def __init__(self, file: IO[bytes], on_close: Callable[[str], None]) -> None:
+        super().__init__()
+        self._file = file
+        self._on_close = on_close
+        self._hash = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+            self._on_close(self._hash.hexdigest())
+        super().close()
+
+
+class IncrementalArchiveWriter(ArchiveWriter):
+    """Writer of the archive of an incremental export, and of its manifest.
+
+    The archive is written next to the previous one, which is replaced once complete.
+    The files written within `asset_entries` are listed in the manifest with their hash,
+    and the files of the unchanged assets are copied from the previous archive when the
+    writer is closed.
+    """
+
+    def __init__(self, path: Path, plan: IncrementalExportPlan) -> None:
+        self.path = path
+        self.plan = plan
+        self._archive = ZipArchiveWriter(path)
+        self._asset_id: Optional[str] = None
+        self._written_files: set[str] = set()
+
+    def _add_file_to_manifest(self, name: str, digest: str) -> None:
+        self._written_files.add(name)
+        if self._asset_id is not None:
+            asset = self.plan.manifest.assets.setdefault(
+                self._asset_id, {"updatedAt": None, "labelIds": None, "files": {}}
+            )
+            asset["files"][name] = digest
+
+    def open(self, name: str) -> IO[bytes]:
+        return cast(
+            "IO[bytes]",
+            _HashingFile(
+                self._archive.open(name),
+                lambda digest: self._add_file_to_manifest(name, digest),
+            ),
+        )
+
+    def write_file(self, name: str, path: Path) -> None:
+        with path.open("rb") as file:
+            digest = _copy_file(file, None)
+        self._archive.write_file(name, path)
+        self._add_file_to_manifest(name, digest)
+
+    def mkdir(self, name: str) -> None:
+        self._archive.mkdir(name)
+
+    @contextmanager
+    def asset_entries(self, asset: dict) -> Iterator[None]:
+        self._asset_id = asset["id"]
+        try:
+            yield
+        finally:
+            self._asset_id = None
+
+    def _copy_kept_files(self) -> None:
+        if not self.plan.kept_files:
+            return
+        with zipfile.ZipFile(self.path) as previous_archive:
+            for name, digest in self.plan.kept_files.items():
+                if name in self._written_files:
+                    continue
+                try:
+                    source = previous_archive.open(name)
+                except KeyError as error:
+                    raise IncrementalExportError(
+                        f"The file {name} is missing from {self.path} since the previous export."
+                        " Remove its manifest to export the whole project again."
+                    ) from error
+                with source, self._archive.open(name) as target:
+                    copied_digest = _copy_file(source, target)
+                if copied_digest != digest:
+                    raise IncrementalExportError(
+                        f"The file {name} of {self.path} was modified since the previous export."
+                        " Remove its manifest to export the whole project again."
+                    )
+
+    def close(self) -> None:
+        try:
+            self._copy_kept_files()
+        except BaseException:
+            self._archive.abort()
+            raise
+        self._archive.close()
+        self.plan.manifest.save(get_manifest_path(self.path))
+
+    def abort(self) -> None:
+        self._archive.abort()
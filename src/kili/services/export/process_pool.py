@@ -0,0 +1,71 @@
+"""Conversion of the assets of an export in a pool of processes."""
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, TypeVar
+
+from kili.core.utils.pagination import batcher
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# number of assets sent at once to a process
+CONVERSION_CHUNK_SIZE = 50
+# number of chunks converted or waiting to be converted, per process
+NB_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def map_assets(
+    function: Callable[[T], R],
+    assets: Iterable[T],
+    workers: Optional[int],
+    chunk_size: int = CONVERSION_CHUNK_SIZE,
+) -> Iterator[tuple[T, R]]:
+    """Apply a conversion function to the assets, in a pool of processes if `workers` > 1.
+
+    The assets are sent to the processes by chunks, and only a few chunks per process are
+    converted at once, so that the memory used does not depend on the number of assets.
+    The processes are spawned rather than forked, since the client may run threads (of
+    prefetched pages, transports or rate limiters) whose locks a fork would copy held.
+    The function and the assets must be picklable when `workers` > 1, and the spawned
+    processes import the main module, so a script must call it within an
+    `if __name__ == "__main__":` block.
+
+    Yields:
+        The assets and their conversions, in the order of the assets, whatever the
+            number of workers.
+    """
+    if workers is None or workers <= 1:
+        for asset in assets:
+            yield asset, function(asset)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pending: deque[tuple[list[T], Future[list[R]]]] = deque()
+        try:
+            for chunk in batcher(assets, chunk_size):
+                pending.append((chunk, executor.submit(_map_chunk, function, chunk)))
+                if len(pending) >= NB_CHUNKS_IN_FLIGHT_PER_WORKER * workers:
+                    converted_chunk, future = pending.popleft()
+                    yield from zip(converted_chunk, future.result(), strict=True)
+            while pending:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result(), strict=True)
+        except BrokenProcessPool as error:
+            raise BrokenProcessPool(
+                "A process converting the assets terminated abruptly. The processes are spawned"
+                " and import the main module of the program: call the export within an"
+                ' `if __name__ == "__main__":` block of the script, or export without workers.'
+            ) from error
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _map_chunk(function: Callable[[T], R], chunk: list[T]) -> list[R]:
+    return [function(asset) for asset in chunk]
@@ -1,11 +1,12 @@
 """Set of common functions used by different export formats."""
 
 import warnings
+from collections.abc import Callable, Iterable, Iterator
 from typing import Optional
 
 from kili.adapters.http_client import HttpClient
 from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
-from kili.core.constants import QUERY_BATCH_SIZE
+from kili.core.constants import QUERY_BATCH_SIZE, QUERY_PREFETCH_PAGES
 from kili.core.helpers import (
     get_response_json,
     log_raise_for_status,
@@ -103,7 +104,7 @@ def attach_name_to_assets_labels_author(assets: list[dict], export_type: ExportT
 THRESHOLD_WARN_MANY_ASSETS = 1000
 
 
-# pylint: disable=too-many-arguments, too-many-locals, too-many-branches, missing-type-doc
+# pylint: disable=too-many-arguments, missing-type-doc
 def fetch_assets(
     kili,
     project_id: str,
@@ -114,13 +115,17 @@ def fetch_assets(
     download_media: bool,
     local_media_dir: Optional[str],
     asset_filter_kwargs: Optional[dict[str, object]],
-) -> list[dict]:
+) -> Iterator[dict]:
     """Fetches assets.
 
     Fetches assets where ID are in asset_ids if the list has more than one element,
     else all the assets of the project. If download media is passed, the media are
     downloaded into the `$HOME/.cache` folder.
 
+    The assets are fetched page by page while they are consumed, so that the memory used
+    does not depend on the number of assets of the project.
+    The arguments are checked right away.
+
     Args:
         kili: Kili instance
         project_id: project id
@@ -133,7 +138,7 @@ def fetch_assets(
         asset_filter_kwargs: Optional dictionary of arguments to filter the assets to export.
 
     Returns:
-        List of fetched assets.
+        Iterator over the fetched assets.
     """
     if export_type == "latest":
         warnings.warn(
@@ -143,48 +148,7 @@ def fetch_assets(
             stacklevel=2,
         )
     fields = get_fields_to_fetch(export_type)
-    asset_filter_kwargs = asset_filter_kwargs or {}
-    asset_where_params = {
-        "project_id": project_id,
-        "label_type_in": label_type_in,
-        "consensus_mark_gte": asset_filter_kwargs.pop("consensus_mark_gte", None),
-        "consensus_mark_lte": asset_filter_kwargs.pop("consensus_mark_lte", None),
-        "external_id_strictly_in": asset_filter_kwargs.pop("external_id_strictly_in", None)
-        or asset_filter_kwargs.pop("external_id_contains", None),
-        "external_id_in": asset_filter_kwargs.pop("external_id_in", None),
-        "honeypot_mark_gte": asset_filter_kwargs.pop("honeypot_mark_gte", None),
-        "honeypot_mark_lte": asset_filter_kwargs.pop("honeypot_mark_lte", None),
-        "label_author_in": asset_filter_kwargs.pop("label_author_in", None),
-        "label_labeler_in": asset_filter_kwargs.pop("label_labeler_in", None),
-        "label_labeler_not_in": asset_filter_kwargs.pop("label_labeler_not_in", None),
-        "label_reviewer_in": asset_filter_kwargs.pop("label_reviewer_in", None),
-        "label_reviewer_not_in": asset_filter_kwargs.pop("label_reviewer_not_in", None),
-        "assignee_in": asset_filter_kwargs.pop("assignee_in", None),
-        "assignee_not_in": asset_filter_kwargs.pop("assignee_not_in", None),
-        "skipped": asset_filter_kwargs.pop("skipped", None),
-        "status_in": asset_filter_kwargs.pop("status_in", None),
-        "label_category_search": asset_filter_kwargs.pop("label_category_search", None),
-        "created_at_gte": asset_filter_kwargs.pop("created_at_gte", None),
-        "created_at_lte": asset_filter_kwargs.pop("created_at_lte", None),
-        "issue_type": asset_filter_kwargs.pop("issue_type", None),
-        "issue_status": asset_filter_kwargs.pop("issue_status", None),
-        "inference_mark_gte": asset_filter_kwargs.pop("inference_mark_gte", None),
-        "inference_mark_lte": asset_filter_kwargs.pop("inference_mark_lte", None),
-        "metadata_where": asset_filter_kwargs.pop("metadata_where", None),
-        "step_id_in": asset_filter_kwargs.pop("step_id_in", None),
-        "step_status_in": asset_filter_kwargs.pop("step_status_in", None),
-    }
-
-    if asset_filter_kwargs:
-        raise NameError(f"Unknown asset filter arguments: {list(asset_filter_kwargs.keys())}")
-
-    if asset_where_params.get("label_category_search"):
-        validate_category_search_query(asset_where_params["label_category_search"])  # type: ignore
-
-    if asset_ids is not None and len(asset_ids) > 0:
-        asset_where_params["asset_id_in"] = asset_ids
-
-    filters = AssetFilters(**asset_where_params)
+    filters = get_asset_filters(project_id, asset_ids, label_type_in, asset_filter_kwargs)
 
     if download_media:
         count = kili.kili_api_gateway.count_assets(filters)
@@ -195,7 +159,7 @@ def fetch_assets(
                 stacklevel=3,
             )
 
-    options = QueryOptions(disable_tqdm=disable_tqdm)
+    options = QueryOptions(disable_tqdm=disable_tqdm, prefetch_pages=QUERY_PREFETCH_PAGES)
     download_media_function, fields = get_download_assets_function(
         kili.kili_api_gateway, download_media, fields, ProjectId(project_id), local_media_dir
     )
@@ -279,22 +243,141 @@ def fetch_assets(
                 for asset in assets_gen
             )
 
-    with warnings.catch_warnings():
-        if export_type == "latest":
+    if export_type == "latest":
+        assets_gen = _ignore_deprecated_field_warnings(assets_gen)
+
+    return _iter_assets_by_batch(assets_gen, export_type, download_media_function)
+
+
+def get_asset_filters(
+    project_id: str,
+    asset_ids: Optional[list[AssetId]],
+    label_type_in: Optional[list[str]],
+    asset_filter_kwargs: Optional[dict[str, object]],
+) -> AssetFilters:
+    """Build the filters of the assets to export, checking the asset filter arguments."""
+    # copied, as the filters are popped from it
+    asset_filter_kwargs = dict(asset_filter_kwargs or {})
+    asset_where_params = {
+        "project_id": project_id,
+        "label_type_in": label_type_in,
+        "consensus_mark_gte": asset_filter_kwargs.pop("consensus_mark_gte", None),
+        "consensus_mark_lte": asset_filter_kwargs.pop("consensus_mark_lte", None),
+        "external_id_strictly_in": asset_filter_kwargs.pop("external_id_strictly_in", None)
+        or asset_filter_kwargs.pop("external_id_contains", None),
+        "external_id_in": asset_filter_kwargs.pop("external_id_in", None),
+        "honeypot_mark_gte": asset_filter_kwargs.pop("honeypot_mark_gte", None),
+        "honeypot_mark_lte": asset_filter_kwargs.pop("honeypot_mark_lte", None),
+        "label_author_in": asset_filter_kwargs.pop("label_author_in", None),
+        "label_labeler_in": asset_filter_kwargs.pop("label_labeler_in", None),
+        "label_labeler_not_in": asset_filter_kwargs.pop("label_labeler_not_in", None),
+        "label_reviewer_in": asset_filter_kwargs.pop("label_reviewer_in", None),
+        "label_reviewer_not_in": asset_filter_kwargs.pop("label_reviewer_not_in", None),
+        "assignee_in": asset_filter_kwargs.pop("assignee_in", None),
+        "assignee_not_in": asset_filter_kwargs.pop("assignee_not_in", None),
+        "skipped": asset_filter_kwargs.pop("skipped", None),
+        "status_in": asset_filter_kwargs.pop("status_in", None),
+        "label_category_search": asset_filter_kwargs.pop("label_category_search", None),
+        "created_at_gte": asset_filter_kwargs.pop("created_at_gte", None),
+        "created_at_lte": asset_filter_kwargs.pop("created_at_lte", None),
+        "issue_type": asset_filter_kwargs.pop("issue_type", None),
+        "issue_status": asset_filter_kwargs.pop("issue_status", None),
+        "inference_mark_gte": asset_filter_kwargs.pop("inference_mark_gte", None),
+        "inference_mark_lte": asset_filter_kwargs.pop("inference_mark_lte", None),
+        "metadata_where": asset_filter_kwargs.pop("metadata_where", None),
+        "step_id_in": asset_filter_kwargs.pop("step_id_in", None),
+        "step_status_in": asset_filter_kwargs.pop("step_status_in", None),
+    }
+
+    if asset_filter_kwargs:
+        raise NameError(f"Unknown asset filter arguments: {list(asset_filter_kwargs.keys())}")
+
+    if asset_where_params.get("label_category_search"):
+        validate_category_search_query(asset_where_params["label_category_search"])  # type: ignore
+
+    if asset_ids is not None and len(asset_ids) > 0:
+        asset_where_params["asset_id_in"] = asset_ids
+
+    return AssetFilters(**asset_where_params)
+
+
+def fetch_asset_versions(
+    kili,
+    project_id: str,
+    asset_ids: Optional[list[AssetId]],
+    export_type: ExportType,
+    label_type_in: Optional[list[str]],
+    disable_tqdm: Optional[bool],
+    asset_filter_kwargs: Optional[dict[str, object]],
+) -> dict[str, dict]:
+    """Fetch the version of the assets to export, i.e. their update date and their label ids.
+
+    Only a few fields are fetched, so that the assets changed since a previous export can be
+    found without fetching the labels.
+
+    Returns:
+        The update date and the sorted label ids of each asset, by asset id.
+    """
+    if export_type == "latest":
+        labels_field = "latestLabel"
+    elif export_type == "latest_from_last_step":
+        labels_field = "latestLabels"
+    else:
+        labels_field = "labels"
+    filters = get_asset_filters(project_id, asset_ids, label_type_in, asset_filter_kwargs)
+    assets = kili.kili_api_gateway.list_assets(
+        filters,
+        ["id", "updatedAt", f"{labels_field}.id"],
+        QueryOptions(disable_tqdm=disable_tqdm, prefetch_pages=QUERY_PREFETCH_PAGES),
+    )
+    if export_type == "latest":
+        assets = _ignore_deprecated_field_warnings(assets)
+
+    versions = {}
+    for asset in assets:
+        labels = asset.get(labels_field) or []
+        if isinstance(labels, dict):
+            labels = [labels]
+        versions[asset["id"]] = {
+            "updatedAt": asset.get("updatedAt"),
+            "labelIds": sorted(label["id"] for label in labels if label),
+        }
+    return versions
+
+
+def _ignore_deprecated_field_warnings(assets: Iterable[dict]) -> Iterator[dict]:
+    """Fetch the assets without the warnings about the deprecated fields of the query.
+
+    The warnings are filtered only while fetching, not while the assets are consumed.
+    """
+    iterator = iter(assets)
+    while True:
+        with warnings.catch_warnings():
             warnings.filterwarnings(
                 "ignore",
                 category=UserWarning,
                 message=r"\[Kili SDK\] Deprecated GraphQL field",
             )
-        if download_media_function is not None:
-            assets: list[dict] = []
-            # TODO: modify download_media function so it can take a generator of assets
-            for assets_batch in batcher(assets_gen, QUERY_BATCH_SIZE):
-                assets.extend(download_media_function(assets_batch))
-        else:
-            assets = list(assets_gen)
-    attach_name_to_assets_labels_author(assets, export_type)
-    return assets
+            asset = next(iterator, None)
+        if asset is None:
+            return
+        yield asset
+
+
+def _iter_assets_by_batch(
+    assets: Iterable[dict],
+    export_type: ExportType,
+    download_media_function: Optional[Callable[[list[dict]], list[dict]]],
+) -> Iterator[dict]:
+    """Download the media and name the label authors of the assets, batch by batch."""
+    for fetched_assets in batcher(assets, QUERY_BATCH_SIZE):
+        assets_batch = (
+            download_media_function(fetched_assets)
+            if download_media_function is not None
+            else fetched_assets
+        )
+        attach_name_to_assets_labels_author(assets_batch, export_type)
+        yield from assets_batch
 
 
 def get_fields_to_fetch(export_type: ExportType):
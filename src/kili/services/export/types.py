@@ -8,6 +8,7 @@ SplitOption = Literal["split", "merged"]
 LabelFormat = Literal[
     "raw",
     "kili",
+    "kili_jsonl",
     "yolo_v4",
     "yolo_v5",
     "yolo_v7",
@@ -1,22 +1,25 @@
 """Helpers for the asset queries."""
 
+import json
 import warnings
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
 from itertools import repeat
 from mimetypes import guess_extension
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+import requests
 from tenacity import retry
 from tenacity.stop import stop_after_attempt
 from tenacity.wait import wait_random
 
 from kili.adapters.http_client import HttpClient
-from kili.core.helpers import get_response_json, log_raise_for_status
+from kili.adapters.json_blob_cache import get_json_from_url
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
 from kili.domain.asset import AssetExternalId
 from kili.domain.project import ProjectId
 from kili.domain.types import ListOrTuple
+from kili.log.logging import logger
 from kili.use_cases.asset.exceptions import (
     DownloadNotAllowedError,
     MissingPropertyError,
@@ -106,7 +109,7 @@ class MediaDownloader:
 
         self.local_dir_path.mkdir(parents=True, exist_ok=True)
 
-        with ThreadPoolExecutor() as threads:
+        with ContextThreadPoolExecutor() as threads:
             assets_gen = threads.map(self.download_single_asset, assets)
 
         assets = list(assets_gen)
@@ -124,13 +127,21 @@ class MediaDownloader:
 
         return assets
 
+    def _download_json(self, url: str) -> dict:
+        """Download a JSON document, through the JSON blob cache of the http client if any."""
+        try:
+            return get_json_from_url(self.http_client, url, timeout=20)
+        except requests.exceptions.HTTPError as err:
+            logger.exception("An error occurred while processing the response: %s", err)
+            raise
+        except json.JSONDecodeError:
+            logger.exception("An error occurred while decoding the json response")
+            return {}
+
     def download_single_asset(self, asset: dict) -> dict[str, Any]:
         """Download single asset on disk and modify asset attributes."""
         if "ocrMetadata" in asset and str(asset["ocrMetadata"]).startswith("http"):
-            response = self.http_client.get(asset["ocrMetadata"], timeout=20)
-            log_raise_for_status(response)
-            json_content = get_response_json(response)
-            asset["ocrMetadata"] = json_content
+            asset["ocrMetadata"] = self._download_json(asset["ocrMetadata"])
 
         if "jsonContent" in asset and str(asset["jsonContent"]).startswith("http"):
             # richtext
@@ -141,16 +152,14 @@ class MediaDownloader:
 
             # video frames
             elif self.project_input_type == "VIDEO":
-                response = self.http_client.get(asset["jsonContent"], timeout=20)
-                log_raise_for_status(response)
-                json_content = get_response_json(response)
+                json_content = self._download_json(asset["jsonContent"])
                 urls = tuple(json_content.values())
                 nbr_char_zfill = len(str(len(urls)))
                 img_names = (
                     f'{asset["externalId"]}_{f"{i+1}".zfill(nbr_char_zfill)}.jpg'
                     for i, _ in enumerate(urls)
                 )
-                with ThreadPoolExecutor() as threads:
+                with ContextThreadPoolExecutor() as threads:
                     paths_gen = threads.map(
                         download_file,
                         urls,
@@ -164,9 +173,7 @@ class MediaDownloader:
             # big images
             elif self.project_input_type == "IMAGE":
                 # the "jsonContent" contains some information but not the image
-                response = self.http_client.get(asset["jsonContent"], timeout=20)
-                log_raise_for_status(response)
-                json_content = get_response_json(response)
+                json_content = self._download_json(asset["jsonContent"])
                 asset["jsonContent"] = json_content
 
             elif self.project_input_type == "GEOSPATIAL":
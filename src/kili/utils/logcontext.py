@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 
 from kili import __version__
 from kili.core.graphql.clientnames import GraphQLClientName
+from kili.utils.tracing import tracer
 
 
 class Singleton(type):
@@ -50,7 +51,11 @@ def for_all_methods(decorator: Callable, exclude: list[str]):
 
 
 def log_call(func: Callable):
-    """Decorator to add call info to the client logging context."""
+    """Decorator to add call info to the client logging context.
+
+    The call is also recorded as a span of the tracer, if it is started, covering
+    the iteration of the generator returned by the method, if any.
+    """
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -60,6 +65,11 @@ def log_call(func: Callable):
             datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         )
         context["kili-client-call-uuid"] = str(uuid.uuid4())
-        return func(*args, **kwargs)
+        return tracer.call(
+            func.__name__,
+            "sdk",
+            functools.partial(func, *args, **kwargs),
+            call_uuid=context["kili-client-call-uuid"],
+        )
 
     return wrapper
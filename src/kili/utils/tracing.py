@@ -0,0 +1,268 @@
+"""Trace of the requests sent by the methods of the SDK.
+
+When the tracer is started, each call to a method of the Kili client opens a span,
+and the GraphQL and HTTP requests sent during the call are recorded as its child spans,
+including the requests sent from the worker threads of the method, which run in a copy
+of its context. The span of a method returning a generator covers its iteration.
+The trace can be exported as a Chrome trace, to be opened in `chrome://tracing` or
+https://ui.perfetto.dev, or as a JSON file.
+
+Examples:
+    >>> from kili.utils.tracing import tracer
+    >>> tracer.start()
+    >>> kili.export_labels(project_id, filename="export.zip", fmt="kili")
+    >>> tracer.stop()
+    >>> tracer.export_chrome_trace("export_labels.trace.json")
+"""
+
+import contextlib
+import contextvars
+import inspect
+import itertools
+import os
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, TypeVar, Union, cast
+
+from kili.core.utils import json_codec
+
+T = TypeVar("T")
+
+
+class Span(NamedTuple):
+    """Timed operation of the SDK, e.g. a method call or a request."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    # kind of operation: `sdk` for the methods of the client, `graphql` or `http` for requests
+    category: str
+    # in seconds since the epoch
+    start: float
+    # in seconds
+    duration: float
+    thread_name: str
+    attributes: dict[str, Any]
+
+
+class _OpenSpan(NamedTuple):
+    """Span opened and not closed yet."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start: float
+    started_at: float
+    attributes: dict[str, Any]
+
+
+class Tracer:
+    """Thread-safe recorder of the spans of the SDK, disabled until started."""
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.enabled = False
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._current_span_id: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+            "kili_current_span_id", default=None
+        )
+
+    def start(self) -> None:
+        """Start recording the spans."""
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording the spans. The spans recorded so far are kept."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Forget the spans recorded so far."""
+        with self._lock:
+            self._spans.clear()
+
+    def spans(self) -> list[Span]:
+        """Get the spans recorded so far, in their closing order."""
+        with self._lock:
+            return list(self._spans)
+
+    def _open(self, name: str, category: str, attributes: dict[str, Any]) -> _OpenSpan:
+        return _OpenSpan(
+            span_id=next(self._ids),
+            parent_id=self._current_span_id.get(),
+            name=name,
+            category=category,
+            start=time.time(),
+            started_at=time.perf_counter(),
+            attributes=attributes,
+        )
+
+    def _close(self, span: _OpenSpan, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            span.attributes["error"] = type(error).__name__
+        self._add(
+            Span(
+                span_id=span.span_id,
+                parent_id=span.parent_id,
+                name=span.name,
+                category=span.category,
+                start=span.start,
+                duration=time.perf_counter() - span.started_at,
+                thread_name=threading.current_thread().name,
+                attributes=span.attributes,
+            )
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """Record the block as a span, parent of the spans recorded within it.
+
+        Yields the attributes of the span, that can be completed within the block.
+        """
+        if not self.enabled:
+            yield attributes
+            return
+
+        span = self._open(name, category, attributes)
+        token = self._current_span_id.set(span.span_id)
+        try:
+            yield attributes
+        except BaseException as err:
+            self._close(span, err)
+            raise
+        else:
+            self._close(span)
+        finally:
+            self._current_span_id.reset(token)
+
+    def call(self, name: str, category: str, function: Callable[[], T], **attributes: Any) -> T:
+        """Call a function within a span, parent of the spans recorded during the call.
+
+        If the function returns a generator, the span lasts until the generator is exhausted
+        or closed, and is also the parent of the spans recorded while it runs.
+        """
+        if not self.enabled:
+            return function()
+
+        span = self._open(name, category, attributes)
+        token = self._current_span_id.set(span.span_id)
+        try:
+            result = function()
+        except BaseException as err:
+            self._close(span, err)
+            raise
+        finally:
+            self._current_span_id.reset(token)
+        if inspect.isgenerator(result):
+            return cast(T, self._iterate_within_span(result, span))
+        self._close(span)
+        return result
+
+    def _iterate_within_span(
+        self, generator: Generator[T, None, Any], span: _OpenSpan
+    ) -> Generator[T, None, None]:
+        error = None
+        try:
+            while True:
+                # set for each item only, so that the span does not leak to the caller
+                token = self._current_span_id.set(span.span_id)
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    self._current_span_id.reset(token)
+                yield item
+        except GeneratorExit:
+            raise
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            generator.close()
+            self._close(span, error)
+
+    def record_span(self, name: str, category: str, duration: float, **attributes: Any) -> None:
+        """Record a span that just ended, e.g. a request timed by its sender.
+
+        Args:
+            name: Name of the span.
+            category: Kind of operation, e.g. `graphql` or `http`.
+            duration: Duration of the span, in seconds, ending now.
+            attributes: Attributes of the span, e.g. the sizes of the request and response.
+        """
+        if not self.enabled:
+            return
+        self._add(
+            Span(
+                span_id=next(self._ids),
+                parent_id=self._current_span_id.get(),
+                name=name,
+                category=category,
+                start=time.time() - duration,
+                duration=duration,
+                thread_name=threading.current_thread().name,
+                attributes=attributes,
+            )
+        )
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def export_json(self, path: Union[str, Path]) -> None:
+        """Write the spans recorded so far to a JSON file, as a list of objects."""
+        Path(path).write_text(
+            json_codec.dumps(
+                [span._asdict() for span in self.spans()],
+                separators=json_codec.COMPACT_SEPARATORS,
+            ),
+            encoding="utf-8",
+        )
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> None:
+        """Write the spans recorded so far to a file in the Chrome trace event format.
+
+        Each thread of the SDK is shown on its own track, so that the serial stages
+        of a method call and the requests sent in parallel can be told apart.
+        """
+        pid = os.getpid()
+        thread_ids: dict[str, int] = {}
+        events = []
+        for span in sorted(self.spans(), key=lambda span: span.start):
+            tid = thread_ids.setdefault(span.thread_name, len(thread_ids) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **span.attributes,
+                    },
+                }
+            )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for name, tid in thread_ids.items()
+        )
+        Path(path).write_text(
+            json_codec.dumps(
+                {"traceEvents": events, "displayTimeUnit": "ms"},
+                separators=json_codec.COMPACT_SEPARATORS,
+            ),
+            encoding="utf-8",
+        )
+
+
+# tracer of the process, shared between the clients
+tracer = Tracer()
@@ -15,7 +15,9 @@ def http_client(mocker: MockerFixture) -> HttpClient:
 
 @pytest.fixture()
 def graphql_client(mocker: MockerFixture) -> GraphQLClient:
-    return mocker.MagicMock(spec=GraphQLClient)
+    graphql_client = mocker.MagicMock(spec=GraphQLClient)
+    graphql_client.last_response_info = None
+    return graphql_client
 
 
 @pytest.fixture()
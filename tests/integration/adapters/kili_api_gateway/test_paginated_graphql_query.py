@@ -7,12 +7,13 @@ from unittest.mock import MagicMock, call
 import pytest
 
 from kili.adapters.http_client import HttpClient
+from kili.adapters.kili_api_gateway.helpers.page_size import AdaptivePageSize
 from kili.adapters.kili_api_gateway.helpers.queries import (
     PaginatedGraphQLQuery,
     QueryOptions,
 )
 from kili.core.constants import QUERY_BATCH_SIZE
-from kili.core.graphql.graphql_client import GraphQLClient
+from kili.core.graphql.graphql_client import GraphQLClient, GraphQLResponseInfo
 
 QUERY = "query"
 COUNT_QUERY = "count_query"
@@ -174,3 +175,70 @@ def test_given_a_query_without_a_count_query_I_do_not_have_a_progress_bar(graphq
     # then
     captured = capsys.readouterr()
     assert captured.err == ""
+
+
+def test_given_a_query_with_prefetched_pages_it_returns_the_elements_in_order(graphql_client):
+    # given
+    options = QueryOptions(disable_tqdm=True, prefetch_pages=2)
+
+    # when
+    gen = PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+        QUERY, WHERE, options, "", COUNT_QUERY
+    )
+    elements = list(gen)
+
+    # then
+    assert elements == [{"id": f"id-{i}"} for i in range(NUMBER_OBJECT_IN_DB)]
+    assert graphql_client.execute.call_count == 4
+
+
+def test_given_an_adaptive_page_size_when_responses_are_fast_then_pages_grow(graphql_client):
+    # given
+    graphql_client.last_response_info = GraphQLResponseInfo(complexity=1, nb_bytes=1000)
+    options = QueryOptions(
+        disable_tqdm=True, batch_size=10, adaptive_page_size=AdaptivePageSize(max_page_size=100)
+    )
+
+    # when
+    gen = PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+        QUERY, WHERE, options, "", COUNT_QUERY
+    )
+    elements = list(gen)
+
+    # then
+    assert elements == [{"id": f"id-{i}"} for i in range(NUMBER_OBJECT_IN_DB)]
+    page_sizes = [
+        call.args[1]["first"]
+        for call in graphql_client.execute.call_args_list
+        if call.args[0] == QUERY
+    ]
+    assert page_sizes == [10, 20, 40, 80, 100]
+
+
+def test_given_an_adaptive_page_size_when_requests_take_the_target_latency_then_pages_keep_their_size(
+    graphql_client,
+):
+    # given
+    # the latency of the request, without the waits for the rate limiter and the locks
+    graphql_client.last_response_info = GraphQLResponseInfo(
+        complexity=1, nb_bytes=1000, latency=2.0
+    )
+    options = QueryOptions(
+        disable_tqdm=True, batch_size=10, adaptive_page_size=AdaptivePageSize(target_latency=2.0)
+    )
+
+    # when
+    elements = list(
+        PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+            QUERY, WHERE, options, "", COUNT_QUERY
+        )
+    )
+
+    # then
+    assert elements == [{"id": f"id-{i}"} for i in range(NUMBER_OBJECT_IN_DB)]
+    page_sizes = {
+        call.args[1]["first"]
+        for call in graphql_client.execute.call_args_list
+        if call.args[0] == QUERY
+    }
+    assert page_sizes == {10}
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from kili.adapters.kili_api_gateway.helpers.queries import (
+    KeysetPagination,
+    PaginatedGraphQLQuery,
+    QueryOptions,
+)
+from kili.core.graphql.graphql_client import GraphQLClient
+
+QUERY = "query"
+COUNT_QUERY = "count_query"
+WHERE = {"project": {"id": "project_id"}}
+KEYSET = KeysetPagination(sort_field="createdAt", where_lower_bound="createdAtGte")
+# 250 elements, created by groups of 7 at the same date, sorted by creation date
+ELEMENTS_IN_DB = [
+    {"id": f"id-{i}", "createdAt": f"2024-01-01T00:00:{i // 7:03d}Z"} for i in range(250)
+]
+
+
+@pytest.fixture()
+def graphql_client() -> GraphQLClient:
+    mocked_graphql_client = MagicMock(spec=GraphQLClient)
+
+    def mocked_client_execute(query, payload):
+        lower_bound = payload["where"].get("createdAtGte", "")
+        elements = [element for element in ELEMENTS_IN_DB if element["createdAt"] >= lower_bound]
+        if query == COUNT_QUERY:
+            return {"data": len(elements)}
+        return {"data": elements[payload["skip"] : payload["skip"] + payload["first"]]}
+
+    mocked_graphql_client.execute.side_effect = mocked_client_execute
+    return mocked_graphql_client
+
+
+def test_given_keyset_pagination_when_iterating_then_it_returns_all_elements_once(
+    graphql_client: GraphQLClient,
+):
+    # Given
+    options = QueryOptions(disable_tqdm=True)
+
+    # When
+    gen = PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+        QUERY, WHERE, options, "", COUNT_QUERY, keyset=KEYSET
+    )
+
+    # Then
+    assert list(gen) == ELEMENTS_IN_DB
+    page_payloads = [
+        call.args[1] for call in graphql_client.execute.call_args_list if call.args[0] == QUERY
+    ]
+    assert page_payloads[0] == {"where": WHERE, "skip": 0, "first": 100}
+    # the next pages start at the date of the last element, skipping the elements already seen
+    assert page_payloads[1] == {
+        "where": {**WHERE, "createdAtGte": ELEMENTS_IN_DB[99]["createdAt"]},
+        "skip": 2,  # elements 98 and 99 share the same date
+        "first": 100,
+    }
+    assert all(payload["skip"] < 7 for payload in page_payloads)
+
+
+def test_given_more_elements_with_the_same_sort_value_than_page_size_then_it_skips_them(
+    graphql_client: GraphQLClient,
+):
+    # Given
+    options = QueryOptions(disable_tqdm=True, batch_size=3)
+
+    # When
+    gen = PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+        QUERY, WHERE, options, "", COUNT_QUERY, keyset=KEYSET
+    )
+
+    # Then
+    assert list(gen) == ELEMENTS_IN_DB
+
+
+def test_given_skip_option_when_iterating_then_it_falls_back_to_skip_first_pagination(
+    graphql_client: GraphQLClient,
+):
+    # Given
+    options = QueryOptions(disable_tqdm=True, skip=10, first=120)
+
+    # When
+    gen = PaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(
+        QUERY, WHERE, options, "", COUNT_QUERY, keyset=KEYSET
+    )
+
+    # Then
+    assert list(gen) == ELEMENTS_IN_DB[10:130]
+    assert all(
+        "createdAtGte" not in call.args[1]["where"]
+        for call in graphql_client.execute.call_args_list
+    )
@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from kili.adapters.kili_api_gateway.asset.operations_mixin import AssetOperationMixin
+from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
+from kili.adapters.kili_api_gateway.label.operations_mixin import LabelOperationMixin
+from kili.core.graphql.graphql_client import GraphQLClient
+from kili.domain.asset import AssetFilters
+from kili.domain.label import LabelFilters
+from kili.domain.project import ProjectId
+
+# 250 elements, created by groups of 7 at the same date, sorted by creation date
+ELEMENTS_IN_DB = [
+    {"id": f"id-{i}", "externalId": f"external-{i}", "createdAt": f"2024-01-01T00:00:{i // 7:03d}Z"}
+    for i in range(250)
+]
+
+
+@pytest.fixture()
+def graphql_client() -> GraphQLClient:
+    mocked_graphql_client = MagicMock(spec=GraphQLClient)
+    mocked_graphql_client.max_concurrent_requests = 4
+
+    def mocked_client_execute(query, payload):
+        lower_bound = payload["where"].get("createdAtGte") or ""
+        upper_bound = payload["where"].get("createdAtLte") or "9999"
+        elements = [
+            element
+            for element in ELEMENTS_IN_DB
+            if lower_bound <= element["createdAt"] <= upper_bound
+        ]
+        if "query count" in query:
+            return {"data": len(elements)}
+        requested_fields = [field for field in ("id", "externalId", "createdAt") if field in query]
+        return {
+            "data": [
+                {field: element[field] for field in requested_fields}
+                for element in elements[payload["skip"] : payload["skip"] + payload["first"]]
+            ]
+        }
+
+    mocked_graphql_client.execute.side_effect = mocked_client_execute
+    return mocked_graphql_client
+
+
+def test_given_parallelism_when_listing_assets_in_order_then_it_returns_all_assets_once(
+    graphql_client: GraphQLClient, http_client
+):
+    # Given
+    asset_operations = AssetOperationMixin()
+    asset_operations.graphql_client = graphql_client
+    asset_operations.http_client = http_client
+    options = QueryOptions(disable_tqdm=True, batch_size=20, parallelism=4)
+
+    # When
+    assets = list(
+        asset_operations.list_assets(
+            AssetFilters(project_id=ProjectId("project_id")), ("id", "externalId"), options
+        )
+    )
+
+    # Then
+    assert assets == [
+        {"id": element["id"], "externalId": element["externalId"]} for element in ELEMENTS_IN_DB
+    ]
+    # the 3 bounds between the 4 shards are read from the assets at offsets 62, 125 and 187
+    bound_payloads = [
+        call.args[1]
+        for call in graphql_client.execute.call_args_list
+        if "query count" not in call.args[0] and call.args[1]["first"] == 1
+    ]
+    assert [payload["skip"] for payload in bound_payloads] == [62, 125, 187]
+
+
+def test_given_parallelism_when_listing_labels_unordered_then_it_returns_all_labels_once(
+    graphql_client: GraphQLClient, http_client
+):
+    # Given
+    label_operations = LabelOperationMixin()
+    label_operations.graphql_client = graphql_client
+    label_operations.http_client = http_client
+    options = QueryOptions(disable_tqdm=True, batch_size=20, parallelism=3, ordered=False)
+
+    # When
+    labels = list(
+        label_operations.list_labels(
+            LabelFilters(project_id=ProjectId("project_id")), ("id", "createdAt"), options
+        )
+    )
+
+    # Then
+    assert sorted(labels, key=lambda label: int(label["id"].split("-")[1])) == [
+        {"id": element["id"], "createdAt": element["createdAt"]} for element in ELEMENTS_IN_DB
+    ]
+
+
+def test_given_parallelism_and_a_first_option_when_listing_assets_then_it_is_not_sharded(
+    graphql_client: GraphQLClient, http_client
+):
+    # Given
+    asset_operations = AssetOperationMixin()
+    asset_operations.graphql_client = graphql_client
+    asset_operations.http_client = http_client
+    options = QueryOptions(disable_tqdm=True, first=30, batch_size=20, parallelism=4)
+
+    # When
+    assets = list(
+        asset_operations.list_assets(
+            AssetFilters(project_id=ProjectId("project_id")), ("id",), options
+        )
+    )
+
+    # Then
+    assert assets == [{"id": element["id"]} for element in ELEMENTS_IN_DB[:30]]
+
+
+def test_given_a_client_serializing_its_requests_when_listing_assets_by_shards_then_it_warns(
+    graphql_client: GraphQLClient, http_client
+):
+    # Given
+    graphql_client.max_concurrent_requests = 1
+    asset_operations = AssetOperationMixin()
+    asset_operations.graphql_client = graphql_client
+    asset_operations.http_client = http_client
+    options = QueryOptions(disable_tqdm=True, batch_size=20, parallelism=4)
+
+    # When
+    with pytest.warns(UserWarning, match="max_concurrent_requests"):
+        assets = list(
+            asset_operations.list_assets(
+                AssetFilters(project_id=ProjectId("project_id")), ("id",), options
+            )
+        )
+
+    # Then
+    assert assets == [{"id": element["id"]} for element in ELEMENTS_IN_DB]
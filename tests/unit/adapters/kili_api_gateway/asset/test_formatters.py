@@ -261,7 +261,7 @@ class TestDownloadJsonResponsesParallel:
 
 
 class TestLoadAssetJsonFields:
-    """Test load_asset_json_fields integration with download_json_responses_parallel."""
+    """Test load_asset_json_fields integration with the download of the json blobs."""
 
     def test_load_asset_with_latest_label_json_response_url(self):
         """Test loading asset with latestLabel.jsonResponseUrl."""
@@ -279,11 +279,9 @@ class TestLoadAssetJsonFields:
         fields = ["id", "latestLabel.jsonResponse", "latestLabel.jsonResponseUrl"]
 
         with patch(
-            "kili.adapters.kili_api_gateway.asset.formatters._download_json_response",
-            new_callable=AsyncMock,
+            "kili.adapters.kili_api_gateway.helpers.json_blobs.get_json_from_url",
+            return_value={"annotation": "data"},
         ) as mock_download:
-            mock_download.return_value = {"annotation": "data"}
-
             result = load_asset_json_fields(asset, fields, http_client)
 
             # Verify URL was used instead of parsing string
@@ -314,7 +312,7 @@ class TestLoadAssetJsonFields:
         fields = ["id", "labels.jsonResponse", "labels.jsonResponseUrl"]
 
         # Create mock side effect for different URLs
-        async def mock_download(url, client):
+        def mock_download(client, url, timeout):
             if "label1" in url:
                 return {"data": "label1"}
             elif "label2" in url:
@@ -322,7 +320,7 @@ class TestLoadAssetJsonFields:
             return {}
 
         with patch(
-            "kili.adapters.kili_api_gateway.asset.formatters._download_json_response",
+            "kili.adapters.kili_api_gateway.helpers.json_blobs.get_json_from_url",
             side_effect=mock_download,
         ):
             result = load_asset_json_fields(asset, fields, http_client)
@@ -376,7 +374,7 @@ class TestLoadAssetJsonFields:
         ]
 
         # Create mock side effect for different URLs
-        async def mock_download(url, client):
+        def mock_download(client, url, timeout):
             if "label1" in url:
                 return {"data": "label1"}
             elif "label2" in url:
@@ -386,7 +384,7 @@ class TestLoadAssetJsonFields:
             return {}
 
         with patch(
-            "kili.adapters.kili_api_gateway.asset.formatters._download_json_response",
+            "kili.adapters.kili_api_gateway.helpers.json_blobs.get_json_from_url",
             side_effect=mock_download,
         ):
             result = load_asset_json_fields(asset, fields, http_client)
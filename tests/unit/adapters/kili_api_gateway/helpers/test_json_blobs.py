@@ -0,0 +1,86 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from kili.adapters.kili_api_gateway.asset.formatters import load_assets_json_fields
+from kili.adapters.kili_api_gateway.helpers.json_blobs import JsonBlob, resolve_json_blobs
+from kili.adapters.kili_api_gateway.label.formatters import load_labels_json_fields
+
+
+def mocked_http_client(json_by_url: dict) -> Mock:
+    def get(url: str, **_):
+        response = Mock()
+        response.json.return_value = json_by_url[url]
+        return response
+
+    http_client = Mock()
+    http_client.get.side_effect = get
+    return http_client
+
+
+def test_given_assets_of_several_pages_when_loading_json_fields_then_all_blobs_are_set():
+    http_client = mocked_http_client(
+        {
+            f"https://storage/{kind}{i}.json": {"id": f"{kind}{i}"}
+            for kind in ("label", "ocr")
+            for i in range(30)
+        }
+    )
+    assets = [
+        {
+            "id": f"asset{i}",
+            "jsonMetadata": "{}",
+            "ocrMetadata": f"https://storage/ocr{i}.json",
+            "latestLabel": {"jsonResponseUrl": f"https://storage/label{i}.json"},
+        }
+        for i in range(30)
+    ]
+    fields = ["id", "jsonMetadata", "ocrMetadata", "latestLabel.jsonResponse"]
+
+    loaded_assets = list(load_assets_json_fields(iter(assets), fields, http_client))
+
+    assert [asset["id"] for asset in loaded_assets] == [f"asset{i}" for i in range(30)]
+    for i, asset in enumerate(loaded_assets):
+        assert asset["jsonMetadata"] == {}
+        assert asset["ocrMetadata"] == {"id": f"ocr{i}"}
+        assert asset["latestLabel"] == {"jsonResponse": {"id": f"label{i}"}}
+    assert http_client.get.call_count == 60
+
+
+def test_given_labels_when_loading_json_fields_then_blobs_download_concurrently():
+    nb_labels = 5
+    barrier = threading.Barrier(nb_labels, timeout=5)
+
+    def get(url: str, **_):
+        # fails if the downloads are not concurrent
+        barrier.wait()
+        response = Mock()
+        response.json.return_value = {"url": url}
+        return response
+
+    http_client = Mock()
+    http_client.get.side_effect = get
+    labels = [{"jsonResponseUrl": f"https://storage/{i}.json"} for i in range(nb_labels)]
+
+    loaded_labels = list(load_labels_json_fields(labels, ["jsonResponse"], http_client))
+
+    assert loaded_labels == [
+        {"jsonResponse": {"url": f"https://storage/{i}.json"}} for i in range(nb_labels)
+    ]
+
+
+def test_given_a_failed_download_when_resolving_blobs_then_the_fallback_is_used_or_it_raises():
+    http_client = Mock()
+    http_client.get.side_effect = requests.ConnectionError("connection lost")
+    label = {"jsonResponseUrl": "https://storage/label.json"}
+
+    with_fallback = JsonBlob(label, "jsonResponse", label["jsonResponseUrl"], fallback={})
+    assert list(resolve_json_blobs([label], lambda _: [with_fallback], http_client)) == [
+        {"jsonResponseUrl": "https://storage/label.json", "jsonResponse": {}}
+    ]
+
+    without_fallback = JsonBlob(label, "jsonResponse", label["jsonResponseUrl"])
+    with pytest.raises(requests.ConnectionError):
+        list(resolve_json_blobs([label], lambda _: [without_fallback], http_client))
@@ -0,0 +1,57 @@
+import pytest
+
+from kili.adapters.kili_api_gateway.helpers.page_size import (
+    AdaptivePageSize,
+    PageSizeController,
+)
+
+
+def test_given_fast_and_small_responses_when_observing_them_then_the_page_size_grows():
+    controller = PageSizeController(AdaptivePageSize(max_page_size=500), initial_page_size=100)
+
+    decision = controller.observe(
+        page_size=100, nb_elements=100, nb_bytes=1000, latency=0.1, complexity=10
+    )
+
+    assert decision is not None
+    assert decision.next_page_size == 200
+    assert controller.page_size == 200
+
+
+def test_given_slow_responses_when_observing_them_then_the_page_size_shrinks():
+    controller = PageSizeController(AdaptivePageSize(target_latency=2.0), initial_page_size=100)
+
+    decision = controller.observe(
+        page_size=100, nb_elements=100, nb_bytes=1000, latency=3.0, complexity=10
+    )
+
+    assert decision is not None
+    assert decision.limiting_factor == "latency"
+    assert decision.next_page_size == 66
+
+
+def test_given_heavy_responses_when_observing_them_then_the_page_size_is_bounded():
+    decisions = []
+    controller = PageSizeController(
+        AdaptivePageSize(min_page_size=5, target_bytes=1000, on_decision=decisions.append),
+        initial_page_size=10,
+    )
+
+    controller.observe(page_size=10, nb_elements=10, nb_bytes=100_000, latency=0.1, complexity=0)
+
+    assert controller.page_size == 5
+    assert decisions == controller.decisions
+    assert decisions[0].limiting_factor == "bytes"
+
+
+def test_given_responses_close_to_their_targets_when_observing_them_then_the_page_size_is_kept():
+    controller = PageSizeController(AdaptivePageSize(target_latency=2.0), initial_page_size=50)
+
+    controller.observe(page_size=50, nb_elements=50, nb_bytes=1000, latency=1.8, complexity=0)
+
+    assert controller.page_size == 50
+
+
+def test_given_invalid_bounds_when_creating_the_controller_then_it_raises():
+    with pytest.raises(ValueError):
+        PageSizeController(AdaptivePageSize(min_page_size=10, max_page_size=5), 10)
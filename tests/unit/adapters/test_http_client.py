@@ -0,0 +1,109 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from kili.adapters.http_client import HttpClient, get_default_pool_maxsize
+
+
+class StorageHandler(BaseHTTPRequestHandler):
+    """Serves a JSON document, answering 503 to the first requests of `nb_unavailable`."""
+
+    protocol_version = "HTTP/1.1"
+    nb_unavailable = 0
+    nb_requests = 0
+    last_path = ""
+
+    def do_GET(self):
+        StorageHandler.nb_requests += 1
+        StorageHandler.last_path = self.path
+        if StorageHandler.nb_requests <= StorageHandler.nb_unavailable:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"job": "A"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def storage_url() -> Iterator[str]:
+    StorageHandler.nb_unavailable = StorageHandler.nb_requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StorageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/label.json"
+    server.shutdown()
+
+
+def test_given_no_pool_size_when_creating_the_client_then_it_is_sized_for_the_sdk_threads():
+    http_client = HttpClient(kili_endpoint="https://kili", api_key="", verify=True)
+
+    adapter = http_client._http_client.get_adapter("https://storage")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == http_client.pool_maxsize == get_default_pool_maxsize()
+    assert http_client._http_client_with_auth.get_adapter("https://kili") is adapter
+    assert get_default_pool_maxsize() >= 10
+
+
+def test_given_retries_when_the_storage_is_unavailable_then_the_request_is_retried(storage_url):
+    StorageHandler.nb_unavailable = 2
+    http_client = HttpClient(kili_endpoint="https://kili", api_key="", verify=True, max_retries=3)
+
+    response = http_client.get(storage_url, timeout=10)
+
+    assert response.status_code == 200
+    assert StorageHandler.nb_requests == 3
+
+
+def test_given_http2_when_sending_requests_then_they_are_sent_with_httpx(storage_url):
+    pytest.importorskip("h2")
+    http_client = HttpClient(kili_endpoint="https://kili", api_key="", verify=True, http2=True)
+
+    responses = [http_client.get(storage_url, timeout=10) for _ in range(2)]
+    streamed_response = http_client.get(storage_url, timeout=10, stream=True)
+
+    assert all(response.json() == {"job": "A"} for response in responses)
+    assert b"".join(streamed_response.iter_content(chunk_size=4)) == b'{"job": "A"}'
+    assert responses[0].headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_given_a_proxy_in_the_environment_when_sending_requests_then_they_go_through_it(
+    storage_url, monkeypatch, http2
+):
+    if http2:
+        pytest.importorskip("h2")
+    for variable in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(variable, raising=False)
+    # the storage server answers the requests forwarded to it as a proxy
+    monkeypatch.setenv("HTTP_PROXY", storage_url.rsplit("/", 1)[0])
+    http_client = HttpClient(kili_endpoint="https://kili", api_key="", verify=True, http2=http2)
+
+    response = http_client.get("http://storage.invalid/label.json", timeout=10)
+
+    assert response.json() == {"job": "A"}
+    assert StorageHandler.last_path == "http://storage.invalid/label.json"
+
+
+def test_given_requests_to_the_storage_when_sending_them_then_the_metrics_are_kept_per_host(
+    storage_url,
+):
+    StorageHandler.nb_unavailable = 1
+    http_client = HttpClient(kili_endpoint="https://kili", api_key="", verify=True)
+
+    http_client.get(storage_url, timeout=10)
+    http_client.get(storage_url, timeout=10)
+
+    metrics = http_client.metrics.snapshot()[storage_url.split("/")[2]]
+    assert metrics.nb_requests == 2
+    assert metrics.nb_errors == 1
+    assert metrics.nb_bytes_received == len(b'{"job": "A"}')
@@ -0,0 +1,108 @@
+import json
+import re
+from unittest.mock import Mock
+
+from kili.adapters.json_blob_cache import JsonBlobCache, get_json_from_url
+
+
+def mocked_storage(documents: dict) -> Mock:
+    """Mocked http client serving documents with an ETag, answering 304 if it did not change."""
+
+    def get(url: str, headers=None, **_):
+        path = re.sub(r"[?&]signature=\w+$", "", url)
+        etag = f'"{hash(json.dumps(documents[path]))}"'
+        response = Mock()
+        response.headers = {"ETag": etag}
+        if headers and headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            return response
+        response.status_code = 200
+        response.content = json.dumps(documents[path]).encode()
+        response.json.return_value = documents[path]
+        return response
+
+    http_client = Mock()
+    http_client.get.side_effect = get
+    http_client.json_blob_cache = None
+    return http_client
+
+
+def test_given_an_unchanged_document_when_getting_it_again_then_it_is_read_from_the_cache(
+    tmp_path,
+):
+    documents = {"https://storage/label.json": {"job": "A"}}
+    http_client = mocked_storage(documents)
+    http_client.json_blob_cache = JsonBlobCache(tmp_path)
+
+    # the signature of the url changes between the calls
+    first = get_json_from_url(http_client, "https://storage/label.json?signature=1")
+    second = get_json_from_url(http_client, "https://storage/label.json?signature=2")
+
+    assert first == second == {"job": "A"}
+    assert http_client.get.call_args.kwargs["headers"]["If-None-Match"] is not None
+
+
+def test_given_documents_identified_by_a_query_parameter_when_getting_them_then_they_are_not_mixed_up(
+    tmp_path,
+):
+    documents = {
+        "https://api/files?id=label_1": {"job": "A"},
+        "https://api/files?id=label_2": {"job": "B"},
+    }
+    http_client = mocked_storage(documents)
+    cache = JsonBlobCache(tmp_path)
+
+    assert cache.get_json(http_client, "https://api/files?id=label_1&signature=1") == {"job": "A"}
+    assert cache.get_json(http_client, "https://api/files?id=label_2&signature=1") == {"job": "B"}
+    assert cache.get_json(http_client, "https://api/files?id=label_1&signature=2") == {"job": "A"}
+    assert "If-None-Match" in http_client.get.call_args.kwargs["headers"]
+
+
+def test_given_signed_urls_when_getting_their_key_then_only_the_signature_is_dropped():
+    assert (
+        JsonBlobCache._get_key(  # pylint: disable=protected-access
+            "https://storage.googleapis.com/bucket/label.json?generation=2"
+            "&X-Goog-Algorithm=GOOG4-RSA-SHA256&X-Goog-Signature=abc"
+        )
+        == "storage.googleapis.com/bucket/label.json?generation=2"
+    )
+    assert (
+        JsonBlobCache._get_key(  # pylint: disable=protected-access
+            "https://account.blob.core.windows.net/container/label.json?sv=2021&se=2024&sp=r&sig=abc"
+        )
+        == "account.blob.core.windows.net/container/label.json"
+    )
+
+
+def test_given_a_changed_document_when_getting_it_again_then_it_is_downloaded(tmp_path):
+    documents = {"https://storage/label.json": {"job": "A"}}
+    http_client = mocked_storage(documents)
+    cache = JsonBlobCache(tmp_path)
+
+    assert cache.get_json(http_client, "https://storage/label.json") == {"job": "A"}
+    documents["https://storage/label.json"] = {"job": "B"}
+    assert cache.get_json(http_client, "https://storage/label.json") == {"job": "B"}
+
+    # the content of the first version is not referenced anymore
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+
+def test_given_a_full_cache_when_storing_a_document_then_the_least_recently_used_is_evicted(
+    tmp_path,
+):
+    documents = {f"https://storage/{i}.json": {"id": i, "data": "x" * 100} for i in range(3)}
+    http_client = mocked_storage(documents)
+    cache = JsonBlobCache(tmp_path, max_size=250)
+
+    for i in range(3):
+        cache.get_json(http_client, f"https://storage/{i}.json")
+
+    cached_documents = [json.loads(path.read_text()) for path in tmp_path.glob("*/*.json")]
+    assert sorted(document["id"] for document in cached_documents) == [1, 2]
+
+
+def test_given_no_cache_when_getting_a_document_then_it_is_downloaded():
+    http_client = mocked_storage({"https://storage/label.json": {"job": "A"}})
+
+    assert get_json_from_url(http_client, "https://storage/label.json") == {"job": "A"}
+    http_client.get.assert_called_once_with("https://storage/label.json", timeout=30)
@@ -0,0 +1,65 @@
+import pytest
+import pytest_mock
+
+from kili.core.graphql.circuit_breaker import CircuitBreaker, CircuitState
+from kili.exceptions import CircuitOpenError
+
+
+@pytest.fixture()
+def now(mocker: pytest_mock.MockerFixture) -> list[float]:
+    """Fake clock, advanced by the tests."""
+    now = [0.0]
+    mocker.patch("kili.core.graphql.circuit_breaker.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def test_given_consecutive_failures_when_reaching_the_threshold_then_the_circuit_opens(now):
+    circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+
+    for _ in range(2):
+        circuit_breaker.before_request()
+        circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    for _ in range(3):
+        circuit_breaker.before_request()
+        circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError, match="failed 3 times in a row"):
+        circuit_breaker.before_request()
+    assert circuit_breaker.nb_rejected_requests == 1
+
+
+@pytest.mark.parametrize(
+    ("probe_succeeds", "expected_state"),
+    [(True, CircuitState.CLOSED), (False, CircuitState.OPEN)],
+)
+def test_given_an_open_circuit_when_the_recovery_timeout_is_over_then_a_probe_is_sent(
+    now, probe_succeeds, expected_state
+):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    circuit_breaker.record_failure()
+
+    now[0] = 30
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    circuit_breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request()  # only one probe at a time
+    if probe_succeeds:
+        circuit_breaker.record_success()
+    else:
+        circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == expected_state
+
+
+def test_given_a_released_probe_when_the_circuit_is_still_half_open_then_another_probe_is_sent(now):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    circuit_breaker.record_failure()
+
+    now[0] = 30
+    assert circuit_breaker.before_request() is True
+    circuit_breaker.release_probe()
+
+    assert circuit_breaker.before_request() is True
+    assert circuit_breaker.nb_rejected_requests == 0
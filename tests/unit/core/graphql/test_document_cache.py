@@ -0,0 +1,65 @@
+from gql import gql
+from graphql import build_schema
+
+from kili.core.graphql.document_cache import GraphQLDocumentCache
+
+SCHEMA = build_schema(
+    """
+    type Asset { id: ID! externalId: String }
+    type Query { assets(first: Int!): [Asset!]! }
+    """
+)
+
+
+def test_given_cached_query_when_getting_document_then_it_is_a_hit():
+    cache = GraphQLDocumentCache(maxsize=2)
+    query = "query { assets(first: 10) { id } }"
+
+    assert cache.get_document(query) is None
+    document = gql(query)
+    cache.add_document(query, document)
+
+    assert cache.get_document(query) is document
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_given_full_cache_when_adding_document_then_least_recently_used_is_evicted():
+    cache = GraphQLDocumentCache(maxsize=2)
+    queries = [f"query {{ assets(first: {i}) {{ id }} }}" for i in range(3)]
+    cache.add_document(queries[0], gql(queries[0]))
+    cache.add_document(queries[1], gql(queries[1]))
+    cache.get_document(queries[0])  # queries[1] becomes the least recently used
+
+    cache.add_document(queries[2], gql(queries[2]))
+
+    assert cache.get_document(queries[0]) is not None
+    assert cache.get_document(queries[1]) is None
+    assert cache.info().currsize == 2
+
+
+def test_given_cached_document_when_validating_twice_then_validation_is_reused():
+    cache = GraphQLDocumentCache()
+    query = "query { assets(first: 10) { id unknownField } }"
+    document = gql(query)
+    cache.add_document(query, document)
+
+    first_errors = cache.validate(SCHEMA, document)
+    second_errors = cache.validate(SCHEMA, document)
+
+    assert len(first_errors) == 1
+    assert second_errors is first_errors
+    info = cache.info()
+    assert (info.validation_hits, info.validation_misses) == (1, 1)
+
+
+def test_given_new_schema_when_validating_cached_document_then_it_is_validated_again():
+    cache = GraphQLDocumentCache()
+    query = "query { assets(first: 10) { id } }"
+    document = gql(query)
+    cache.add_document(query, document)
+    cache.validate(SCHEMA, document)
+
+    cache.validate(build_schema("type Query { assets(first: Int!): [Int!]! }"), document)
+
+    assert cache.info().validation_misses == 2
@@ -0,0 +1,95 @@
+import pytest
+import pytest_mock
+from pyrate_limiter import LimiterDelayException
+
+from kili.core.graphql.rate_limiter import ComplexityRateLimiter, SharedCallRateLimiter
+
+
+@pytest.fixture()
+def clock(mocker: pytest_mock.MockerFixture):
+    """Fake clock, that advances when the rate limiter sleeps."""
+    now = [0.0]
+    mocker.patch("kili.core.graphql.rate_limiter.time.monotonic", side_effect=lambda: now[0])
+    mocker.patch("kili.core.graphql.rate_limiter.time.time", side_effect=lambda: now[0])
+
+    def sleep(delay: float) -> None:
+        now[0] += delay
+
+    return mocker.patch("kili.core.graphql.rate_limiter.time.sleep", side_effect=sleep)
+
+
+def test_given_a_budget_when_requests_stay_below_it_then_they_are_not_delayed(clock):
+    limiter = ComplexityRateLimiter(max_complexity=100, period=60, max_calls=None)
+
+    for _ in range(10):
+        limiter.try_acquire("countAssets")
+        limiter.report("countAssets", 10)
+
+    clock.assert_not_called()
+
+
+def test_given_an_exhausted_budget_when_acquiring_then_it_waits_for_the_refill(clock):
+    limiter = ComplexityRateLimiter(max_complexity=100, period=60, max_calls=None)
+    limiter.try_acquire("assets")
+    limiter.report("assets", 100)
+
+    limiter.try_acquire("assets")
+
+    # the estimate of the operation is 100, so the bucket must be fully refilled
+    clock.assert_called_once_with(pytest.approx(60))
+
+
+def test_given_reported_complexities_when_estimating_then_it_learns_the_operation_cost():
+    limiter = ComplexityRateLimiter(max_complexity=1000, max_calls=None, smoothing=0.5)
+
+    limiter.report("assets", 100)
+    limiter.report("assets", 200)
+
+    assert limiter.estimate("assets") == 150
+    assert limiter.estimate("countAssets") == limiter.default_complexity
+
+
+def test_given_a_non_positive_budget_when_creating_the_limiter_then_it_raises():
+    with pytest.raises(ValueError):
+        ComplexityRateLimiter(max_complexity=0)
+
+
+def test_given_limiters_sharing_a_database_when_acquiring_then_they_share_the_budget(
+    clock, tmp_path
+):
+    # two limiters of the same endpoint and API key, as in two worker processes
+    limiter_1 = SharedCallRateLimiter(
+        "https://kili/graphql", "key", max_calls=2, period=60, cache_dir=tmp_path
+    )
+    limiter_2 = SharedCallRateLimiter(
+        "https://kili/graphql", "key", max_calls=2, period=60, cache_dir=tmp_path
+    )
+    # limiters of another API key and of another endpoint
+    other_limiters = [
+        SharedCallRateLimiter(
+            "https://kili/graphql", "other_key", max_calls=2, period=60, cache_dir=tmp_path
+        ),
+        SharedCallRateLimiter(
+            "https://other/graphql", "key", max_calls=2, period=60, cache_dir=tmp_path
+        ),
+    ]
+
+    limiter_1.try_acquire("assets")
+    limiter_2.try_acquire("assets")
+    for other_limiter in other_limiters:
+        other_limiter.try_acquire("assets")
+    clock.assert_not_called()
+
+    limiter_1.try_acquire("assets")
+    clock.assert_called_once_with(pytest.approx(60))
+
+
+def test_given_a_full_shared_budget_when_the_delay_is_too_long_then_it_raises(clock, tmp_path):
+    limiter = SharedCallRateLimiter(
+        "https://kili/graphql", "key", max_calls=1, period=60, max_delay=10, cache_dir=tmp_path
+    )
+    limiter.try_acquire("assets")
+
+    with pytest.raises(LimiterDelayException):
+        limiter.try_acquire("assets")
+    clock.assert_not_called()
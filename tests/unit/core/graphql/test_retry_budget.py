@@ -0,0 +1,71 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import pytest_mock
+import requests
+from gql import gql
+
+from kili.core.graphql.retry_budget import RetryBudget
+from kili.core.graphql.transport import KiliRequestsHTTPTransport
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    """Answers 503 to every request."""
+
+    nb_requests = 0
+
+    def do_POST(self):
+        UnavailableHandler.nb_requests += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def unavailable_server() -> Iterator[str]:
+    UnavailableHandler.nb_requests = 0
+    server = HTTPServer(("127.0.0.1", 0), UnavailableHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_given_a_ratio_when_requests_are_sent_then_retries_are_allowed_in_proportion(
+    mocker: pytest_mock.MockerFixture,
+):
+    now = [0.0]
+    mocker.patch("kili.core.graphql.retry_budget.time.monotonic", side_effect=lambda: now[0])
+    retry_budget = RetryBudget(ratio=0.5, min_retries=1, window=60)
+
+    for _ in range(4):
+        retry_budget.record_request()
+
+    assert [retry_budget.try_acquire_retry() for _ in range(3)] == [True, True, False]
+    assert retry_budget.state().nb_denied_retries == 1
+
+    now[0] = 60
+    assert retry_budget.state().nb_available_retries == 1
+
+
+def test_given_a_spent_budget_when_the_backend_is_unavailable_then_the_transport_gives_up(
+    unavailable_server,
+):
+    transport = KiliRequestsHTTPTransport(
+        url=unavailable_server,
+        retries=10,
+        retry_status_forcelist=(503,),
+        retry_budget=RetryBudget(ratio=0, min_retries=2),
+    )
+    transport.connect()
+
+    with pytest.raises(requests.exceptions.RetryError):
+        transport.execute(gql("query { countAssets }"))
+    transport.close()
+
+    assert UnavailableHandler.nb_requests == 3
@@ -0,0 +1,42 @@
+from graphql import build_schema, print_schema
+
+from kili.core.graphql.schema_cache import (
+    get_compiled_schema_path,
+    load_compiled_schema,
+    save_compiled_schema,
+)
+
+SCHEMA_STR = '''
+"""An asset"""
+type Asset { id: ID! externalId: String @deprecated(reason: "use id") }
+input AssetWhere { id: ID, externalIdIn: [String!] }
+type Query { assets(where: AssetWhere!, first: Int = 10): [Asset!]! }
+'''
+
+
+def test_given_a_compiled_schema_when_loading_it_then_it_is_the_schema_of_the_sdl(tmp_path):
+    compiled_schema_path = get_compiled_schema_path(tmp_path / "kili_2.0.0.graphql")
+    save_compiled_schema(compiled_schema_path, SCHEMA_STR, build_schema(SCHEMA_STR))
+
+    schema = load_compiled_schema(compiled_schema_path, SCHEMA_STR)
+
+    assert compiled_schema_path.name == "kili_2.0.0.schema.json"
+    assert schema is not None
+    assert print_schema(schema) == print_schema(build_schema(SCHEMA_STR))
+
+
+def test_given_a_compiled_schema_of_another_sdl_when_loading_it_then_it_is_ignored(tmp_path):
+    compiled_schema_path = get_compiled_schema_path(tmp_path / "kili_2.0.0.graphql")
+    save_compiled_schema(compiled_schema_path, SCHEMA_STR, build_schema(SCHEMA_STR))
+
+    other_schema_str = SCHEMA_STR.replace("externalId", "externalIdentifier")
+
+    assert load_compiled_schema(compiled_schema_path, other_schema_str) is None
+
+
+def test_given_a_corrupted_compiled_schema_when_loading_it_then_it_is_ignored(tmp_path):
+    compiled_schema_path = get_compiled_schema_path(tmp_path / "kili_2.0.0.graphql")
+    compiled_schema_path.write_text('{"header": ', encoding="utf-8")
+
+    assert load_compiled_schema(compiled_schema_path, SCHEMA_STR) is None
+    assert load_compiled_schema(tmp_path / "missing.schema.json", SCHEMA_STR) is None
@@ -0,0 +1,69 @@
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from gql import gql
+
+from kili.core.graphql.transport import KiliRequestsHTTPTransport
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Answers with a gzipped response, recording the request bodies it received."""
+
+    received: list[tuple[dict, bytes]] = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.received.append((dict(self.headers), body))
+        response = gzip.compress(json.dumps({"data": {"assets": [{"id": "a" * 1000}]}}).encode())
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def graphql_server() -> Iterator[str]:
+    GraphQLHandler.received = []
+    server = HTTPServer(("127.0.0.1", 0), GraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("compression_threshold", "is_compressed"), [(None, False), (1000, False), (100, True)]
+)
+def test_given_a_compression_threshold_when_executing_then_large_bodies_are_gzipped(
+    graphql_server, compression_threshold, is_compressed
+):
+    transport = KiliRequestsHTTPTransport(
+        url=graphql_server, compression_threshold=compression_threshold
+    )
+    transport.connect()
+
+    result = transport.execute(
+        gql("query($where: AssetWhere!) { assets(where: $where) { id } }"),
+        variable_values={"where": {"externalIdIn": ["external_id"] * 10}},
+    )
+    transport.close()
+
+    headers, body = GraphQLHandler.received[0]
+    assert (headers.get("Content-Encoding") == "gzip") is is_compressed
+    payload = json.loads(gzip.decompress(body) if is_compressed else body)
+    assert payload["variables"] == {"where": {"externalIdIn": ["external_id"] * 10}}
+    assert result.data == {"assets": [{"id": "a" * 1000}]}
+
+    exchange = transport.last_exchange
+    assert exchange is not None
+    assert exchange.nb_bytes_sent == len(body)
+    assert exchange.nb_bytes_received < 100 < exchange.nb_bytes_decoded
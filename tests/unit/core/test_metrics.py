@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+from kili.core.metrics import LATENCY_BUCKETS, MetricsRecorder, RequestMetrics
+
+
+def test_given_requests_when_recording_them_then_they_are_aggregated_per_key():
+    recorder = MetricsRecorder(prefix="kili.http", key_tag="host")
+
+    recorder.record_request("storage", latency=0.01, nb_bytes_sent=10, nb_bytes_received=100)
+    recorder.record_request("storage", latency=100.0, error=True)
+    recorder.record_retry("storage")
+    recorder.record_request("kili", latency=0.3, rate_limiter_wait=0.2, lock_wait=0.1)
+
+    snapshot = recorder.snapshot()
+    assert snapshot["storage"].nb_requests == 2
+    assert snapshot["storage"].nb_errors == 1
+    assert snapshot["storage"].nb_retries == 1
+    assert snapshot["storage"].nb_bytes_received == 100
+    assert snapshot["storage"].latency_histogram[0] == 1
+    assert snapshot["storage"].latency_histogram[len(LATENCY_BUCKETS)] == 1
+    assert snapshot["storage"].latency_mean == 50.005
+    assert snapshot["kili"].latency_histogram[LATENCY_BUCKETS.index(0.5)] == 1
+    assert snapshot["kili"].rate_limiter_wait == 0.2
+
+    recorder.reset()
+    assert recorder.snapshot() == {}
+    assert RequestMetrics().latency_mean == 0.0
+
+
+def test_given_a_failing_sink_when_recording_a_request_then_the_other_sinks_are_called():
+    recorder = MetricsRecorder(prefix="kili.graphql", key_tag="operation")
+    failing_sink = MagicMock(side_effect=RuntimeError("statsd is down"))
+    sink = MagicMock()
+    recorder.add_sink(failing_sink)
+    recorder.add_sink(sink)
+
+    recorder.record_request("countAssets", latency=0.1, complexity=3)
+    recorder.remove_sink(sink)
+    recorder.record_retry("countAssets")
+
+    sink.assert_any_call("kili.graphql.requests", 1, {"operation": "countAssets"})
+    sink.assert_any_call("kili.graphql.complexity", 3, {"operation": "countAssets"})
+    assert ("kili.graphql.retries", 1, {"operation": "countAssets"}) in [
+        call.args for call in failing_sink.call_args_list
+    ]
+    assert recorder.snapshot()["countAssets"].nb_retries == 1
+
+
+def test_given_a_gauge_when_sending_it_then_the_sinks_get_its_current_value():
+    recorder = MetricsRecorder(prefix="kili.graphql", key_tag="operation")
+    sink = MagicMock()
+    recorder.add_sink(sink)
+    value = [0]
+    recorder.add_gauge("circuit_breaker.state", lambda: value[0])
+
+    value[0] = 2
+    recorder.send_gauges()
+
+    assert recorder.gauges() == {"circuit_breaker.state": 2}
+    sink.assert_called_once_with("kili.graphql.circuit_breaker.state", 2, {})
@@ -0,0 +1,108 @@
+import io
+import json
+import math
+
+import pytest
+
+from kili.core.utils import json_codec
+
+DOCUMENTS = [
+    {"b": [1, 2.5, None, True], "a": {"x": [], "y": {}}},
+    {"é": "ü 😀 \x7f  ", "text": 'a\nb"\\', "big": 2**70},
+    [{"id": i, "score": i / 3} for i in range(5)],
+    {1: "non-string key"},
+    {"nan": math.nan, "infinities": [math.inf, -math.inf], "null": None},
+    {"small": [1e-05, -2.5e-07, 9.999999999999999e-05, 0.0001], "large": [1e16, 1.5e300]},
+]
+FORMATS = [
+    {"indent": 4, "sort_keys": True},
+    {"indent": 2, "ensure_ascii": False},
+    {"indent": 3},
+    {"separators": json_codec.COMPACT_SEPARATORS},
+    {"separators": json_codec.COMPACT_SEPARATORS, "sort_keys": True, "ensure_ascii": False},
+    {},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_installed(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(json_codec, "orjson_installed", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("format_kwargs", FORMATS)
+def test_given_a_document_when_dumping_it_then_the_output_is_the_one_of_the_stdlib(
+    orjson_installed, document, format_kwargs
+):
+    assert json_codec.dumps(document, **format_kwargs) == json.dumps(document, **format_kwargs)
+
+
+def test_given_floats_of_any_magnitude_when_dumping_them_then_they_are_written_like_the_stdlib(
+    orjson_installed,
+):
+    floats = [
+        sign * mantissa * 10.0**exponent
+        for sign in (1, -1)
+        for mantissa in (1.0, 1.5, 9.999999999999999)
+        for exponent in range(-20, 21)
+    ]
+
+    assert json_codec.dumps(floats, separators=json_codec.COMPACT_SEPARATORS) == json.dumps(
+        floats, separators=json_codec.COMPACT_SEPARATORS
+    )
+    for value in floats:
+        assert json_codec.dumps(value, indent=2) == json.dumps(value, indent=2)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS[:3])
+def test_given_a_json_string_when_loading_it_then_it_is_decoded_like_the_stdlib(
+    orjson_installed, document
+):
+    encoded = json.dumps(document)
+
+    assert json_codec.loads(encoded) == json.loads(encoded)
+    assert json_codec.loads(encoded.encode("utf-8")) == json.loads(encoded)
+
+
+def test_given_non_finite_floats_when_dumping_them_without_allow_nan_then_it_raises(
+    orjson_installed,
+):
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        json_codec.dumps(
+            {"value": math.nan}, separators=json_codec.COMPACT_SEPARATORS, allow_nan=False
+        )
+
+
+def test_given_an_invalid_document_when_loading_it_then_it_raises_a_json_decode_error(
+    orjson_installed,
+):
+    assert math.isnan(json_codec.loads("NaN"))
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads('{"a": ')
+
+
+@pytest.mark.parametrize("items", [[], DOCUMENTS[:3], [[], {}]])
+@pytest.mark.parametrize("indent", [None, 0, 4])
+def test_given_items_when_dumping_them_as_an_array_then_the_output_is_the_one_of_the_stdlib(
+    orjson_installed, items, indent
+):
+    file = io.StringIO()
+
+    json_codec.dump_array(iter(items), file, indent=indent, sort_keys=True)
+
+    assert file.getvalue() == json.dumps(items, indent=indent, sort_keys=True)
+
+
+def test_given_items_when_dumping_them_as_json_lines_then_each_line_is_an_item(orjson_installed):
+    file = io.StringIO()
+
+    json_codec.dump_lines(iter(DOCUMENTS[:3]), file, sort_keys=True)
+
+    lines = file.getvalue().split("\n")
+    assert lines[-1] == ""
+    assert [json.loads(line) for line in lines[:-1]] == [
+        json.loads(json.dumps(document)) for document in DOCUMENTS[:3]
+    ]
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from kili.adapters.kili_api_gateway.label.formatters import get_label_json_blobs
+from kili.core.helpers import format_json
+from kili.core.utils import json_codec
+from kili.core.utils.lazy_json import LazyJsonObject, loads_json_object
+
+
+def test_given_a_lazy_json_object_when_accessing_it_then_it_is_parsed_once(mocker):
+    loads = mocker.spy(json_codec, "loads")
+    json_response = LazyJsonObject('{"JOB_0": {"categories": [{"name": "A"}]}}')
+
+    assert not json_response.is_parsed
+    assert json_response["JOB_0"]["categories"][0]["name"] == "A"
+    assert "JOB_0" in json_response
+    assert json_response == {"JOB_0": {"categories": [{"name": "A"}]}}
+    assert json_response.is_parsed
+    assert loads.call_count == 1
+
+
+def test_given_a_lazy_json_object_not_accessed_when_getting_raw_then_it_is_not_parsed():
+    raw = '{"JOB_0": {"text": "answer"}}'
+    json_response = LazyJsonObject(raw)
+
+    assert json_response.raw == raw
+    assert not json_response.is_parsed
+
+    json_response["JOB_1"] = {}
+    assert json.loads(json_response.raw) == {"JOB_0": {"text": "answer"}, "JOB_1": {}}
+
+
+def test_given_invalid_json_when_accessing_it_then_the_fallback_is_used_or_it_raises():
+    assert dict(LazyJsonObject("{invalid", fallback={})) == {}
+    with pytest.raises(json.JSONDecodeError):
+        dict(LazyJsonObject("{invalid"))
+
+
+def test_given_a_label_when_parsing_its_json_fields_lazily_then_objects_are_lazy():
+    label = {"id": "label", "jsonResponse": '{"JOB_0": {}}'}
+
+    get_label_json_blobs(label, ["id", "jsonResponse"], lazy=True)
+
+    assert isinstance(label["jsonResponse"], LazyJsonObject)
+    assert loads_json_object("[1, 2]", lazy=True) == [1, 2]
+    assert loads_json_object("", lazy=True, fallback={}) == {}
+
+
+def test_given_a_truncated_json_field_when_formatting_it_lazily_then_it_raises_right_away(mocker):
+    result = {"jsonMetadata": '{"key": "val', "jsonResponse": '{"JOB_0": {}}'}
+
+    with pytest.raises(ValueError, match="should be valid jsons"):
+        format_json(result, mocker.MagicMock(), lazy=True)
+
+    result = format_json({"jsonResponse": ' {"JOB_0": {}} '}, mocker.MagicMock(), lazy=True)
+    assert isinstance(result["jsonResponse"], LazyJsonObject)
@@ -1,8 +1,15 @@
 """Unit tests for core utils pagination module."""
 
+import time
+
 import pytest
 
-from kili.core.utils.pagination import batch_object_builder, batcher
+from kili.core.utils.pagination import (
+    batch_object_builder,
+    batcher,
+    merge_iterators_concurrently,
+    prefetch_iterator,
+)
 
 
 @pytest.mark.parametrize(
@@ -118,3 +125,59 @@ def test_batch_object_builder(name, test_case):
     actual = batch_object_builder(test_case["properties_to_batch"], test_case["batch_size"])
     expected = test_case["expected_result"]
     assert all(a == b for a, b in zip(actual, expected, strict=False))
+
+
+def test_given_an_iterator_when_prefetching_it_then_items_are_returned_in_order():
+    assert list(prefetch_iterator(iter(range(50)), max_prefetched=3)) == list(range(50))
+
+
+def test_given_an_iterator_raising_an_error_when_prefetching_it_then_the_error_is_reraised():
+    def failing_iterator():
+        yield 1
+        raise ValueError("page query failed")
+
+    prefetched = prefetch_iterator(failing_iterator(), max_prefetched=2)
+
+    assert next(prefetched) == 1
+    with pytest.raises(ValueError, match="page query failed"):
+        next(prefetched)
+
+
+def test_given_a_prefetched_iterator_when_it_is_closed_then_the_background_thread_stops():
+    consumed = []
+
+    def counting_iterator():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    prefetched = prefetch_iterator(counting_iterator(), max_prefetched=2)
+    assert next(prefetched) == 0
+    prefetched.close()
+    time.sleep(0.5)
+
+    # the producer is blocked on the bounded queue, so it fetched only a few items ahead
+    assert len(consumed) <= 5
+
+
+def test_given_a_non_positive_number_of_items_when_prefetching_then_it_raises():
+    with pytest.raises(ValueError):
+        list(prefetch_iterator(iter([]), max_prefetched=0))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_given_several_iterators_when_merging_them_then_all_items_are_returned(ordered):
+    iterators = [iter(range(start, start + 100)) for start in range(0, 500, 100)]
+
+    merged = list(merge_iterators_concurrently(iterators, ordered=ordered, max_prefetched=3))
+
+    assert (merged if ordered else sorted(merged)) == list(range(500))
+
+
+def test_given_an_iterator_raising_an_error_when_merging_it_then_the_error_is_reraised():
+    def failing_iterator():
+        yield 1
+        raise ValueError("shard query failed")
+
+    with pytest.raises(ValueError, match="shard query failed"):
+        list(merge_iterators_concurrently([iter(range(10)), failing_iterator()], ordered=True))
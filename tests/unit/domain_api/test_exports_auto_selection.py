@@ -122,6 +122,7 @@ class TestAllExportFormats:
         "export_method,format_name",
         [
             ("kili", "kili"),
+            ("kili_jsonl", "kili_jsonl"),
             ("coco", "coco"),
             ("yolo_v4", "yolo_v4"),
             ("yolo_v5", "yolo_v5"),
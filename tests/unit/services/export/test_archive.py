@@ -0,0 +1,71 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from kili.services.export.archive import DirectoryArchiveWriter, ZipArchiveWriter
+from kili.services.export.format.kili import KiliExporter
+
+
+def test_zip_archive_writer_stores_the_compressed_media(tmp_path: Path):
+    image_path = tmp_path / "image.jpg"
+    image_path.write_bytes(b"\xff\xd8" * 1000)
+
+    with ZipArchiveWriter(tmp_path / "export.zip") as archive:
+        archive.mkdir("labels")
+        archive.folder("labels").write_text("a/b.png.json", "{}" * 1000)
+        archive.write_file("images/image.jpg", image_path)
+
+    with zipfile.ZipFile(tmp_path / "export.zip") as z_f:
+        assert z_f.namelist() == ["labels/", "labels/a/b.png.json", "images/image.jpg"]
+        assert z_f.getinfo("labels/a/b.png.json").compress_type == zipfile.ZIP_DEFLATED
+        assert z_f.getinfo("images/image.jpg").compress_type == zipfile.ZIP_STORED
+        assert z_f.read("labels/a/b.png.json") == b"{}" * 1000
+        assert z_f.read("images/image.jpg") == image_path.read_bytes()
+
+
+def test_zip_archive_writer_keeps_the_previous_archive_if_the_export_fails(tmp_path: Path):
+    with ZipArchiveWriter(tmp_path / "export.zip") as archive:
+        archive.write_text("README.kili.txt", "previous")
+    previous_archive = (tmp_path / "export.zip").read_bytes()
+
+    with pytest.raises(ValueError, match="failed"):
+        with ZipArchiveWriter(tmp_path / "export.zip") as archive:
+            archive.write_text("README.kili.txt", "")
+            raise ValueError("failed")
+
+    assert (tmp_path / "export.zip").read_bytes() == previous_archive
+    assert not (tmp_path / "export.zip.partial").exists()
+
+
+def test_directory_archive_writer_writes_the_files_unzipped(tmp_path: Path):
+    image_path = tmp_path / "image.jpg"
+    image_path.write_bytes(b"\xff\xd8")
+
+    archive = DirectoryArchiveWriter(tmp_path / "export")
+    archive.mkdir("labels")
+    archive.folder("labels").write_text("a/b.png.json", "{}")
+    archive.write_file("images/image.jpg", image_path)
+
+    assert (tmp_path / "export" / "labels" / "a" / "b.png.json").read_text() == "{}"
+    assert (tmp_path / "export" / "images" / "image.jpg").read_bytes() == b"\xff\xd8"
+
+
+def test_add_staged_files_adds_the_media_written_on_disk(tmp_path: Path):
+    exporter = KiliExporter.__new__(KiliExporter)
+    exporter.export_root_folder = tmp_path / "staging"
+    exporter.project_id = "fake_proj_id"  # type: ignore
+    (exporter.images_folder / "frames").mkdir(parents=True)
+    (exporter.images_folder / "image.png").write_bytes(b"png")
+    (exporter.images_folder / "frames" / "video_1.jpg").write_bytes(b"jpg")
+
+    with ZipArchiveWriter(tmp_path / "export.zip") as archive:
+        exporter.add_staged_files(archive)
+
+    with zipfile.ZipFile(tmp_path / "export.zip") as z_f:
+        assert z_f.namelist() == [
+            "assets/",
+            "assets/image.png",
+            "assets/frames/",
+            "assets/frames/video_1.jpg",
+        ]
@@ -1,16 +1,20 @@
+import copy
 import json
 from datetime import datetime
 from pathlib import Path
 from zipfile import ZipFile
 
+import pytest
 import pytest_mock
 from kili_formats import convert_from_kili_to_coco_format
 from kili_formats.types import JobTool
 from PIL import Image
 
 from kili.presentation.client.label import LabelClientMethods
+from kili.services.export.archive import DirectoryArchiveWriter
 from kili.services.export.format.base import AbstractExporter
 from kili.services.export.format.coco import CocoExporter
+from kili.services.export.format.coco.streaming import CocoLabelsWriter
 from kili.services.export.format.coco.types import CocoFormat
 from kili.utils.tempfile import TemporaryDirectory
 
@@ -214,9 +218,7 @@ def test_expand_assets_with_multiple_labels():
         },
     ]
 
-    # Call the method directly - create a simple instance just for this method
-    exporter = CocoExporter.__new__(CocoExporter)
-    expanded = exporter._expand_assets_with_multiple_labels(assets)
+    expanded = list(CocoExporter._iter_expanded_assets(assets))
 
     # Should have 3 assets total: 2 from asset1 (with latestLabels), 1 from asset2 (with latestLabel)
     assert len(expanded) == 3
@@ -246,3 +248,70 @@ def test_expand_assets_with_multiple_labels():
         expanded[2]["latestLabel"]["jsonResponse"]["JOB"]["annotations"][0]["categories"][0]["name"]
         == "C"
     )
+
+
+@pytest.mark.parametrize("merged", [True, False])
+@pytest.mark.parametrize(
+    "annotation_modifier",
+    [
+        None,
+        lambda annotation, image, kili_annotation: {**annotation, "mid": kili_annotation["mid"]},
+    ],
+)
+def test_coco_labels_writer_writes_the_labels_of_convert_from_kili_to_coco_format(
+    mocker: pytest_mock.MockerFixture, tmp_path: Path, annotation_modifier, merged: bool
+):
+    jobs = {
+        job_name: {
+            "content": {"categories": {category: {"name": category, "children": []}}},
+            "instruction": "",
+            "mlTask": "OBJECT_DETECTION",
+            "required": 0,
+            "tools": ["semantic"],
+            "isChild": False,
+            "isNew": False,
+        }
+        for job_name, category in (
+            ("OBJECT_DETECTION_JOB", "OBJECT_A"),
+            ("OBJECT_DETECTION_JOB_0", "OBJECT_B"),
+        )
+    }
+    if not merged:
+        jobs = {"OBJECT_DETECTION_JOB": jobs["OBJECT_DETECTION_JOB"]}
+    assets = json.load(
+        Path("./tests/unit/services/export/fakes/image_project_assets_for_coco.json").open()
+    )
+    # a rotated image, an image without annotations, and an image without labeled job
+    rotated_asset = copy.deepcopy(assets[0])
+    rotated_asset["latestLabel"]["jsonResponse"]["ROTATION_JOB"] = {"rotation": 90}
+    empty_asset = copy.deepcopy(assets[1])
+    empty_asset["latestLabel"]["jsonResponse"]["OBJECT_DETECTION_JOB"]["annotations"] = []
+    unlabeled_asset = copy.deepcopy(assets[2])
+    unlabeled_asset["latestLabel"]["jsonResponse"] = {}
+    assets = [assets[0], rotated_asset, empty_asset, assets[1], unlabeled_asset, assets[2]]
+    mocked_datetime = mocker.MagicMock()
+    mocked_datetime.now.return_value = datetime(2024, 1, 1)
+    mocker.patch("kili_formats.format.coco.datetime", mocked_datetime)
+    mocker.patch("kili.services.export.format.coco.streaming.datetime", mocked_datetime)
+
+    labels_json = convert_from_kili_to_coco_format(
+        jobs=jobs,  # pyright: ignore[reportGeneralTypeIssues]
+        assets=assets,
+        title="Image project",
+        project_input_type="IMAGE",
+        annotation_modifier=annotation_modifier,
+        merged=merged,
+    )
+    with CocoLabelsWriter(
+        DirectoryArchiveWriter(tmp_path),
+        "labels.json",
+        jobs=jobs,  # pyright: ignore[reportGeneralTypeIssues]
+        title="Image project",
+        annotation_modifier=annotation_modifier,
+        merged=merged,
+    ) as writer:
+        for asset in assets:
+            writer.add_asset(asset)
+
+    assert len(labels_json["annotations"]) == (15 if merged else 8)
+    assert (tmp_path / "labels.json").read_bytes() == json.dumps(labels_json).encode()
@@ -11,6 +11,7 @@ import pytest_mock
 
 from kili.adapters.kili_api_gateway.helpers.queries import QueryOptions
 from kili.adapters.kili_api_gateway.kili_api_gateway import KiliAPIGateway
+from kili.core.constants import QUERY_PREFETCH_PAGES
 from kili.domain.asset import AssetExternalId, AssetFilters
 from kili.domain.project import ProjectId
 from kili.presentation.client.label import LabelClientMethods
@@ -868,7 +869,9 @@ def test_export_with_asset_filter_kwargs(mocker):
         "latestLabel.labelType",
         "latestLabel.modelName",
     ]
-    expected_options = QueryOptions(disable_tqdm=None, first=None, skip=0)
+    expected_options = QueryOptions(
+        disable_tqdm=None, first=None, skip=0, prefetch_pages=QUERY_PREFETCH_PAGES
+    )
     kili.kili_api_gateway.list_assets.assert_called_once_with(
         expected_where, expected_fields, expected_options
     )
@@ -6,6 +6,7 @@ from zipfile import ZipFile
 import pytest_mock
 
 from kili.presentation.client.label import LabelClientMethods
+from kili.services.export.archive import DirectoryArchiveWriter
 from kili.services.export.format.geojson import GeoJsonExporter, _process_asset
 
 
@@ -96,7 +97,7 @@ def test_process_asset_with_external_id_containing_slash(tmp_path: Path):
         "externalId": "a/b.png",
     }
     label_path = Path(tmp_path) / "labels"
-    _process_asset(asset, label_path)
+    _process_asset(asset, DirectoryArchiveWriter(label_path))
 
     assert Path(label_path / "a/b.png.geojson").is_file()
 
@@ -159,7 +160,7 @@ def test_process_asset_with_latest_labels(tmp_path: Path):
         "externalId": "multi_label",
     }
     label_path = Path(tmp_path) / "labels"
-    _process_asset(asset, label_path)
+    _process_asset(asset, DirectoryArchiveWriter(label_path))
 
     # Should create two GeoJSON files with label suffixes
     assert Path(label_path / "multi_label_label1.geojson").is_file()
@@ -0,0 +1,207 @@
+import json
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+import pytest_mock
+
+from kili.presentation.client.label import LabelClientMethods
+from kili.services.export.exceptions import IncrementalExportError, NotCompatibleOptions
+from kili.services.export.format.base import AbstractExporter
+
+
+def _asset(asset_id: str, category: str) -> dict:
+    return {
+        "id": asset_id,
+        "externalId": f"external_{asset_id}",
+        "content": "",
+        "jsonContent": "",
+        "jsonMetadata": {},
+        "latestLabel": {
+            "jsonResponse": {"CLASSIFICATION_JOB": {"categories": [{"name": category}]}},
+            "isSentBackToQueue": False,
+            "labelType": "DEFAULT",
+        },
+    }
+
+
+@pytest.fixture()
+def kili(mocker: pytest_mock.MockerFixture) -> LabelClientMethods:
+    mocker.patch.object(AbstractExporter, "_check_and_ensure_asset_access", return_value=None)
+    kili = LabelClientMethods()
+    kili.api_endpoint = "https://"  # type: ignore
+    kili.api_key = ""  # type: ignore
+    kili.kili_api_gateway = mocker.MagicMock()
+    kili.kili_api_gateway.get_project.return_value = {
+        "inputType": "TEXT",
+        "dataConnections": None,
+        "id": "fake_proj_id",
+        "title": "fake_proj_title",
+        "description": "fake_proj_description",
+        "jsonInterface": {"jobs": {}},
+    }
+    kili.graphql_client = mocker.MagicMock()  # pyright: ignore[reportGeneralTypeIssues]
+    kili.http_client = mocker.MagicMock()  # pyright: ignore[reportGeneralTypeIssues]
+    return kili
+
+
+def _mock_project_assets(mocker: pytest_mock.MockerFixture, assets: list[dict]):
+    """Mock the fetch of the assets of the project, returning the mock of the full fetch."""
+    mocker.patch(
+        "kili.services.export.format.base.fetch_asset_versions",
+        return_value={
+            asset["id"]: {"updatedAt": asset["updatedAt"], "labelIds": []} for asset in assets
+        },
+    )
+    return mocker.patch(
+        "kili.services.export.format.base.fetch_assets",
+        side_effect=lambda *_, asset_ids, **__: [
+            {key: value for key, value in asset.items() if key != "updatedAt"}
+            for asset in assets
+            if not asset_ids or asset["id"] in asset_ids
+        ],
+    )
+
+
+def test_incremental_export_converts_only_the_changed_assets(
+    mocker: pytest_mock.MockerFixture, kili: LabelClientMethods, tmp_path: Path
+):
+    export_file = tmp_path / "export.zip"
+    _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_3", "A"), "updatedAt": "2024-01-01"},
+        ],
+    )
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+
+    fetch_assets = _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "B"), "updatedAt": "2024-01-02"},
+        ],
+    )
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+
+    assert fetch_assets.call_args.kwargs["asset_ids"] == ["asset_2"]
+    with ZipFile(export_file) as z_f:
+        assert sorted(z_f.namelist()) == [
+            "README.kili.txt",
+            "labels/",
+            "labels/external_asset_1.json",
+            "labels/external_asset_2.json",
+        ]
+        asset_2 = json.loads(z_f.read("labels/external_asset_2.json"))
+    assert asset_2["latestLabel"]["jsonResponse"]["CLASSIFICATION_JOB"]["categories"] == [
+        {"name": "B"}
+    ]
+    manifest = json.loads((tmp_path / "export.zip.manifest.json").read_text())
+    assert sorted(manifest["assets"]) == ["asset_1", "asset_2"]
+    assert list(manifest["assets"]["asset_2"]["files"]) == ["labels/external_asset_2.json"]
+    assert manifest["assets"]["asset_2"]["updatedAt"] == "2024-01-02"
+
+
+def test_incremental_export_does_not_fetch_the_assets_of_an_up_to_date_export(
+    mocker: pytest_mock.MockerFixture, kili: LabelClientMethods, tmp_path: Path
+):
+    export_file = tmp_path / "export.zip"
+    assets = [{**_asset("asset_1", "A"), "updatedAt": "2024-01-01"}]
+    _mock_project_assets(mocker, assets)
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+    exported_archive = export_file.read_bytes()
+
+    fetch_assets = _mock_project_assets(mocker, assets)
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+
+    fetch_assets.assert_not_called()
+    assert export_file.read_bytes() == exported_archive
+
+
+def test_incremental_export_fails_if_the_previous_archive_was_modified(
+    mocker: pytest_mock.MockerFixture, kili: LabelClientMethods, tmp_path: Path
+):
+    export_file = tmp_path / "export.zip"
+    _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "A"), "updatedAt": "2024-01-01"},
+        ],
+    )
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+    with ZipFile(export_file, "w") as z_f:
+        z_f.writestr("labels/external_asset_1.json", "{}")
+
+    _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "B"), "updatedAt": "2024-01-02"},
+        ],
+    )
+    with pytest.raises(IncrementalExportError, match="external_asset_1.json"):
+        kili.export_labels(
+            "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+        )
+
+    assert not (tmp_path / "export.zip.partial").exists()
+
+
+def test_incremental_export_fails_if_a_file_was_removed_from_the_previous_archive(
+    mocker: pytest_mock.MockerFixture, kili: LabelClientMethods, tmp_path: Path
+):
+    export_file = tmp_path / "export.zip"
+    _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "A"), "updatedAt": "2024-01-01"},
+        ],
+    )
+    kili.export_labels(
+        "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+    )
+    with ZipFile(export_file, "w") as z_f:
+        z_f.writestr("labels/external_asset_2.json", "{}")
+
+    _mock_project_assets(
+        mocker,
+        [
+            {**_asset("asset_1", "A"), "updatedAt": "2024-01-01"},
+            {**_asset("asset_2", "B"), "updatedAt": "2024-01-02"},
+        ],
+    )
+    with pytest.raises(IncrementalExportError, match="external_asset_1.json is missing"):
+        kili.export_labels(
+            "fake_proj_id", str(export_file), fmt="kili", with_assets=False, incremental=True
+        )
+
+    assert not (tmp_path / "export.zip.partial").exists()
+
+
+def test_incremental_export_is_not_compatible_with_a_single_file(
+    mocker: pytest_mock.MockerFixture, kili: LabelClientMethods, tmp_path: Path
+):
+    _mock_project_assets(mocker, [])
+
+    with pytest.raises(NotCompatibleOptions):
+        kili.export_labels(
+            "fake_proj_id",
+            str(tmp_path / "export.zip"),
+            fmt="kili",
+            single_file=True,
+            incremental=True,
+        )
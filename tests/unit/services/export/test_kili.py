@@ -4,6 +4,7 @@ from tempfile import NamedTemporaryFile, TemporaryDirectory
 from typing import TYPE_CHECKING
 from zipfile import ZipFile
 
+import pytest
 import pytest_mock
 from kili_formats import convert_to_pixel_coords
 
@@ -540,9 +541,59 @@ def test_save_assets_export_with_external_id_containing_slash(
                 "jsonContent": f.name,
             }
         ]
-        export_folder = tmp_path / "export_folder"
-        exporter._save_assets_export(assets, Path(export_folder))  # pylint: disable=protected-access
-        assert Path(exporter.base_folder / "labels/a/b.png.json").is_file()
+        export_file = tmp_path / "export.zip"
+        exporter._save_assets_export(assets, export_file)  # pylint: disable=protected-access
+        with ZipFile(export_file) as z_f:
+            assert "labels/a/b.png.json" in z_f.namelist()
+
+
+@pytest.mark.parametrize(
+    ("label_format", "single_file", "filename", "expected_data"),
+    [
+        (
+            "kili",
+            True,
+            "data.json",
+            json.dumps([{"externalId": "a", "id": 1}, {"externalId": "b", "id": 2}], indent=4),
+        ),
+        (
+            "kili_jsonl",
+            False,
+            "data.jsonl",
+            '{"externalId":"a","id":1}\n{"externalId":"b","id":2}\n',
+        ),
+    ],
+)
+def test_save_assets_export_into_a_single_file(
+    mocker: pytest_mock.MockerFixture,
+    tmp_path: Path,
+    label_format: str,
+    single_file: bool,
+    filename: str,
+    expected_data: str,
+):
+    mocker.patch.object(KiliExporter, "__init__", return_value=None)
+    exporter = KiliExporter()  # type: ignore  # pylint: disable=no-value-for-parameter
+    exporter.logger = mocker.MagicMock()
+    exporter.with_assets = False
+    exporter.single_file = single_file
+    exporter.export_root_folder = tmp_path
+    exporter.label_format = label_format  # type: ignore
+    exporter.project_id = "fake_proj_id"  # type: ignore
+    exporter.export_type = "latest"
+    exporter.project = {  # type: ignore
+        "id": "fake_proj_id",
+        "title": "fake_proj_title",
+        "description": "fake_proj_description",
+        "inputType": "TEXT",
+    }
+    assets = iter([{"id": 1, "externalId": "a"}, {"id": 2, "externalId": "b"}])
+
+    export_file = tmp_path / "export.zip"
+    exporter._save_assets_export(assets, export_file)  # pylint: disable=protected-access
+
+    with ZipFile(export_file) as z_f:
+        assert z_f.read(filename).decode("utf-8") == expected_data
 
 
 def test_kili_export_labels_geojson(mocker: pytest_mock.MockerFixture):
@@ -0,0 +1,20 @@
+import operator
+from functools import partial
+
+import pytest
+
+from kili.services.export.process_pool import map_assets
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2])
+def test_map_assets_yields_the_conversions_in_the_order_of_the_assets(workers):
+    assets = iter(range(23))
+
+    converted = list(map_assets(operator.neg, assets, workers, chunk_size=3))
+
+    assert converted == [(i, -i) for i in range(23)]
+
+
+def test_map_assets_raises_the_errors_of_the_processes():
+    with pytest.raises(ZeroDivisionError):
+        list(map_assets(partial(operator.truediv, 1), [1, 0, 2], workers=2, chunk_size=1))
@@ -6,7 +6,7 @@ from kili_formats import convert_from_kili_to_voc_format
 from kili.presentation.client.label import LabelClientMethods
 from kili.services.export import VocExporter
 from kili.services.export.exceptions import NotCompatibleOptions
-from kili.services.export.format.voc import _process_asset
+from kili.services.export.format.voc import _convert_asset
 from tests.fakes.fake_data import (
     asset_image_1,
     asset_image_1_with_0_rotation,
@@ -117,7 +117,7 @@ def test_when_exporting_to_voc_given_a_project_with_data_connection_then_it_shou
         )
 
 
-def test_process_asset_image_with_external_id(tmp_path: Path):
+def test_convert_asset_image_with_external_id():
     asset = {
         "latestLabel": {
             "jsonResponse": {
@@ -148,12 +148,11 @@ def test_process_asset_image_with_external_id(tmp_path: Path):
         "resolution": {"width": 1920, "height": 1080},
         "content": "fakecontent",
     }
-    label_path = Path(tmp_path) / "labels"
-    _process_asset(asset, label_path, "IMAGE", ["JOB_0"])
-    assert Path(label_path / "a/b.png.xml").is_file()
+    labels_files = _convert_asset(asset, "IMAGE", ["JOB_0"])
+    assert [filename for filename, _ in labels_files] == ["a/b.png.xml"]
 
 
-def test_process_asset_image_with_latest_labels(tmp_path: Path):
+def test_convert_asset_image_with_latest_labels():
     """Test that multiple labels create separate XML files with label suffix."""
     asset = {
         "latestLabels": [
@@ -212,8 +211,9 @@ def test_process_asset_image_with_latest_labels(tmp_path: Path):
         "resolution": {"width": 1920, "height": 1080},
         "content": "fakecontent",
     }
-    label_path = Path(tmp_path) / "labels"
-    _process_asset(asset, label_path, "IMAGE", ["JOB_0"])
+    labels_files = _convert_asset(asset, "IMAGE", ["JOB_0"])
     # Should create two XML files with label suffixes
-    assert Path(label_path / "multi_label_label1.xml").is_file()
-    assert Path(label_path / "multi_label_label2.xml").is_file()
+    assert [filename for filename, _ in labels_files] == [
+        "multi_label_label1.xml",
+        "multi_label_label2.xml",
+    ]
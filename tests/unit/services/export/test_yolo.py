@@ -1,5 +1,6 @@
 # pylint: disable=missing-docstring
 
+from datetime import datetime
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -9,6 +10,7 @@ from kili_formats import convert_from_kili_to_yolo_format
 from kili.adapters.http_client import HttpClient
 from kili.presentation.client.label import LabelClientMethods
 from kili.services.export import YoloExporter
+from kili.services.export.archive import DirectoryArchiveWriter
 from kili.services.export.format.yolo import (
     YoloExporter,
     _process_asset,
@@ -76,7 +78,7 @@ def test_process_asset_for_job_image_not_served_by_kili():
                 "resolution": {"height": 1000, "width": 1000},
             },
             images_folder,
-            labels_folder,
+            DirectoryArchiveWriter(labels_folder),
             category_ids,
             fake_content_repository,
             with_assets=False,
@@ -112,7 +114,7 @@ def test_process_asset_for_job_frame_not_served_by_kili():
         asset_remote_content, video_filenames = _process_asset(
             asset_video,
             images_folder,
-            labels_folder,
+            DirectoryArchiveWriter(labels_folder),
             category_ids,
             fake_content_repository,
             with_assets=False,
@@ -186,7 +188,7 @@ def test_convert_from_kili_to_yolo_format_no_annotation():
 
 def test_write_class_file_yolo_v4():
     with TemporaryDirectory() as directory:
-        _write_class_file(directory, category_ids, "yolo_v4", "split")
+        _write_class_file(DirectoryArchiveWriter(directory), category_ids, "yolo_v4", "split")
         assert (directory / "classes.txt").is_file()
         with (directory / "classes.txt").open("r") as created_file:
             with open("./tests/unit/services/export/expected/classes.txt") as expected_file:
@@ -195,7 +197,7 @@ def test_write_class_file_yolo_v4():
 
 def test_write_class_file_yolo_v5():
     with TemporaryDirectory() as directory:
-        _write_class_file(directory, category_ids, "yolo_v5", "split")
+        _write_class_file(DirectoryArchiveWriter(directory), category_ids, "yolo_v5", "split")
         assert (directory / "data.yaml").is_file()
         with (directory / "data.yaml").open("r") as created_file:
             with open("./tests/unit/services/export/expected/data_v5.yaml") as expected_file:
@@ -204,7 +206,7 @@ def test_write_class_file_yolo_v5():
 
 def test_write_class_file_yolo_v7():
     with TemporaryDirectory() as directory:
-        _write_class_file(directory, category_ids, "yolo_v7", "split")
+        _write_class_file(DirectoryArchiveWriter(directory), category_ids, "yolo_v7", "split")
         assert (directory / "data.yaml").is_file()
         with (directory / "data.yaml").open("r") as created_file:
             with open("./tests/unit/services/export/expected/data_v7.yaml") as expected_file:
@@ -445,7 +447,7 @@ names: ['F', 'G']
 
 def test_write_labels_to_file_with_external_id_containing_slash(tmp_path: Path):
     _write_labels_to_file(
-        tmp_path,
+        DirectoryArchiveWriter(tmp_path),
         "image/1.jpg",
         [(0, 0.501415026274802, 0.5296278884310182, 0.6727472455849373, 0.5381320101586394)],
     )
@@ -528,7 +530,7 @@ def test_process_asset_with_latest_labels():
                 "resolution": {"height": 1000, "width": 1000},
             },
             images_folder,
-            labels_folder,
+            DirectoryArchiveWriter(labels_folder),
             category_ids,
             fake_content_repository,
             with_assets=False,
@@ -540,3 +542,42 @@ def test_process_asset_with_latest_labels():
         assert (labels_folder / "multi_label_label2.txt").is_file()
         assert len(asset_remote_content) == 2
         assert len(video_filenames) == 0
+
+
+def test_yolo_export_is_the_same_with_several_workers(
+    mocker: pytest_mock.MockerFixture, tmp_path: Path
+):
+    several_assets = [
+        {**assets[0], "id": f"asset_{i}", "externalId": f"trees_{i}"} for i in range(7)
+    ]
+    mocker.patch("kili.services.export.format.base.fetch_assets", return_value=several_assets)
+    mocker.patch.object(YoloExporter, "_has_data_connection", return_value=False)
+    # the archives and their README are dated
+    mocked_datetime = mocker.MagicMock()
+    mocked_datetime.now.return_value = datetime(2024, 1, 1)
+    mocker.patch("kili.services.export.format.base.datetime", mocked_datetime)
+    mocked_time = mocker.MagicMock()
+    mocked_time.localtime.return_value = (2024, 1, 1, 0, 0, 0, 0, 1, 0)
+    mocker.patch("kili.services.export.archive.time", mocked_time)
+
+    kili = LabelClientMethods()
+    kili.api_endpoint = "https://"  # type: ignore
+    kili.api_key = ""  # type: ignore
+    kili.kili_api_gateway = mocker.MagicMock()
+    kili.kili_api_gateway.get_project.return_value = get_project_return_val
+    kili.graphql_client = mocker.MagicMock()  # pyright: ignore[reportGeneralTypeIssues]
+    kili.http_client = mocker.MagicMock()  # pyright: ignore[reportGeneralTypeIssues]
+
+    for workers in (None, 2):
+        kili.export_labels(
+            "clktm4vzz001a0j324elr5dsy",
+            filename=str(tmp_path / f"export_{workers}.zip"),
+            fmt="yolo_v8",
+            layout="split",
+            with_assets=False,
+            workers=workers,
+        )
+
+    with ZipFile(tmp_path / "export_2.zip") as z_f:
+        assert len([name for name in z_f.namelist() if name.endswith(".txt")]) == 15
+    assert (tmp_path / "export_2.zip").read_bytes() == (tmp_path / "export_None.zip").read_bytes()
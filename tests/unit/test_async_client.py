@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest_mock
+from graphql import ExecutionResult
+
+from kili.adapters.kili_api_gateway.async_kili_api_gateway import AsyncKiliAPIGateway
+from kili.adapters.kili_api_gateway.helpers.queries import (
+    AsyncPaginatedGraphQLQuery,
+    QueryOptions,
+)
+from kili.async_client import AsyncKili
+from kili.core.graphql.async_graphql_client import AsyncGraphQLClient
+from kili.core.graphql.clientnames import GraphQLClientName
+from kili.domain.asset import AssetFilters
+from kili.domain.project import ProjectId
+
+
+class FakeAsyncGraphQLClient:
+    def __init__(self, nb_elements: int) -> None:
+        self.elements = [{"id": str(i), "jsonMetadata": "{}"} for i in range(nb_elements)]
+        self.payloads = []
+
+    async def execute(self, query, variables=None, **kwargs):
+        if "count" in query:
+            return {"data": len(self.elements)}
+        self.payloads.append(variables)
+        skip, first = variables["skip"], variables["first"]
+        return {"data": self.elements[skip : skip + first]}
+
+
+async def _collect(async_gen):
+    return [element async for element in async_gen]
+
+
+def test_given_async_paginated_query_when_iterating_then_it_fetches_all_pages():
+    graphql_client = FakeAsyncGraphQLClient(nb_elements=25)
+
+    elements = asyncio.run(
+        _collect(
+            AsyncPaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(  # type: ignore
+                "query assets", {}, QueryOptions(disable_tqdm=True, batch_size=10), "count"
+            )
+        )
+    )
+
+    assert [element["id"] for element in elements] == [str(i) for i in range(25)]
+    assert [payload["skip"] for payload in graphql_client.payloads] == [0, 10, 20]
+    assert [payload["first"] for payload in graphql_client.payloads] == [10, 10, 5]
+
+
+def test_given_async_paginated_query_with_unicity_field_when_first_is_set_then_it_stops():
+    graphql_client = FakeAsyncGraphQLClient(nb_elements=25)
+
+    elements = asyncio.run(
+        _collect(
+            AsyncPaginatedGraphQLQuery(graphql_client).execute_query_from_paginated_call(  # type: ignore
+                "query assets",
+                {},
+                QueryOptions(disable_tqdm=True, first=12, batch_size=10),
+                "count",
+                "id",
+            )
+        )
+    )
+
+    assert len(elements) == 12
+
+
+def test_given_async_gateway_when_listing_assets_then_json_fields_are_loaded():
+    graphql_client = FakeAsyncGraphQLClient(nb_elements=3)
+    gateway = AsyncKiliAPIGateway(graphql_client, MagicMock())  # type: ignore
+
+    assets = asyncio.run(
+        _collect(
+            gateway.list_assets(
+                AssetFilters(project_id=ProjectId("project_id")),
+                ("id", "jsonMetadata"),
+                QueryOptions(disable_tqdm=True),
+            )
+        )
+    )
+
+    assert assets == [{"id": str(i), "jsonMetadata": {}} for i in range(3)]
+
+
+def test_given_async_graphql_client_when_executing_then_it_uses_the_shared_session(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
+    client = AsyncGraphQLClient(
+        endpoint="https://fake_endpoint.kili-technology.com/api/label/v2/graphql",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+    )
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=ExecutionResult({"data": "all good"}))
+    connect_async = mocker.patch.object(
+        client._gql_client, "connect_async", new=AsyncMock(return_value=session)
+    )
+
+    async def run():
+        return await asyncio.gather(*(client.execute("fake_query") for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [{"data": "all good"}] * 5
+    assert connect_async.call_count == 1
+    assert session.execute.call_count == 5
+
+
+def test_given_api_key_in_environment_when_creating_async_kili_then_it_is_used(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch.dict("os.environ", {"KILI_API_KEY": "fake_key"})
+    mocker.patch("kili.async_client.load_config_from_file", return_value={})
+
+    kili = AsyncKili()
+
+    assert kili.api_key == "fake_key"
+    asyncio.run(kili.close())
@@ -1,23 +1,31 @@
 import os
-from time import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import sleep, time
 
 import pytest
 import pytest_mock
 from gql import Client
 from gql.transport import exceptions
 from graphql import ExecutionResult
-from pyrate_limiter import Duration, Rate
-from pyrate_limiter.limiter import Limiter
 
 from kili.adapters.http_client import HttpClient
 from kili.core.constants import MAX_CALLS_PER_MINUTE
-from kili.core.graphql.graphql_client import GraphQLClient, GraphQLClientName
-from kili.exceptions import GraphQLError
+from kili.core.graphql.circuit_breaker import CircuitBreaker
+from kili.core.graphql.graphql_client import (
+    GraphQLClient,
+    GraphQLClientName,
+    GraphQLResponseInfo,
+)
+from kili.core.graphql.rate_limiter import CallRateLimiter, RateLimiter
+from kili.core.graphql.retry_budget import RetryBudget
+from kili.core.graphql.transport import HttpExchange
+from kili.exceptions import CircuitOpenError, GraphQLError
 
 
 def test_graphql_client_cache_cant_get_kili_version(mocker):
     """Test when we can't get the kili version from the backend."""
-    mocker.patch("kili.core.graphql.graphql_client.Client", return_value=None)
+    mocker.patch("kili.core.graphql.graphql_client.CachedValidationClient", return_value=None)
     mocker.patch.object(GraphQLClient, "_get_kili_app_version", return_value=None)
 
     _ = GraphQLClient(
@@ -48,7 +56,9 @@ def test_schema_caching_requires_cache_dir():
 
 
 def test_skip_checks_disable_local_validation(mocker: pytest_mock.MockerFixture):
-    mocker_gql = mocker.patch("kili.core.graphql.graphql_client.Client", return_value=None)
+    mocker_gql = mocker.patch(
+        "kili.core.graphql.graphql_client.CachedValidationClient", return_value=None
+    )
     mocker.patch.dict(os.environ, {"KILI_SDK_SKIP_CHECKS": "true"})
     client = GraphQLClient(
         endpoint="",
@@ -67,10 +77,10 @@ def test_skip_checks_disable_local_validation(mocker: pytest_mock.MockerFixture)
 
 def test_rate_limiting(mocker: pytest_mock.MockerFixture):
     mocker.patch("kili.core.graphql.graphql_client.GraphQLClient._get_kili_app_version")
-    mocker.patch("kili.core.graphql.graphql_client.gql", side_effect=lambda x: x)
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
     mocker.patch(
         "kili.core.graphql.graphql_client._limiter",
-        new=Limiter(Rate(MAX_CALLS_PER_MINUTE, Duration.SECOND * 5), max_delay=120 * 1000),
+        new=CallRateLimiter(MAX_CALLS_PER_MINUTE, period=5),
     )
     client = GraphQLClient(
         endpoint="",
@@ -109,7 +119,7 @@ def test_rate_limiting(mocker: pytest_mock.MockerFixture):
 def test_given_gql_client_when_the_server_refuses_wrong_query_then_it_does_no_retry(
     mocker: pytest_mock.MockerFixture,
 ):
-    mocker.patch("kili.core.graphql.graphql_client.gql", side_effect=lambda x: x)
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
 
     nb_times_called = 0
 
@@ -157,7 +167,7 @@ def test_given_gql_client_when_the_server_refuses_wrong_query_then_it_does_no_re
 def test_given_gql_client_when_the_server_returns_flagsmith_error_then_it_retries(
     mocker: pytest_mock.MockerFixture,
 ):
-    mocker.patch("kili.core.graphql.graphql_client.gql", side_effect=lambda x: x)
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
 
     nb_times_called = 0
 
@@ -301,3 +311,362 @@ def test_given_variables_when_i_remove_null_values_then_it_works(variables: dict
 
     # Then
     assert output == expected
+
+
+def test_given_concurrent_client_when_threads_execute_queries_then_requests_run_in_parallel(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
+
+    in_flight = max_in_flight = 0
+    counter_lock = threading.Lock()
+
+    def mocked_backend_response(self, *args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with counter_lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        sleep(0.05)
+        self.transport.response_headers = {"x-complexity": "3"}
+        with counter_lock:
+            in_flight -= 1
+        return ExecutionResult({"data": "all good"}, extensions=None)
+
+    mocker.patch.object(Client, "execute", autospec=True, side_effect=mocked_backend_response)
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+        max_concurrent_requests=4,
+    )
+    client._gql_client.fetch_schema_from_transport = False
+
+    # When
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.execute(query="fake_query"), range(16)))
+
+    # Then
+    assert all(result["data"] == "all good" for result in results)
+    assert 1 < max_in_flight <= 4
+    assert client.complexity_consumed == 16 * 3
+
+
+def test_max_concurrent_requests_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrent_requests must be greater than 0"):
+        _ = GraphQLClient(
+            endpoint="",
+            api_key="",
+            client_name=GraphQLClientName.SDK,
+            http_client=HttpClient(
+                kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+            ),
+            enable_schema_caching=False,
+            max_concurrent_requests=0,
+        )
+
+
+def test_given_a_response_when_executing_a_query_then_its_info_is_kept_for_the_thread(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch("kili.core.graphql.document_cache.gql", side_effect=lambda x: x)
+
+    def mocked_backend_response(self, *args, **kwargs):
+        self.transport.response_headers = {"x-complexity": "5", "content-length": "1234"}
+        return ExecutionResult({"data": "all good"}, extensions=None)
+
+    mocker.patch.object(Client, "execute", autospec=True, side_effect=mocked_backend_response)
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+    )
+    client._gql_client.fetch_schema_from_transport = False
+    assert client.last_response_info is None
+
+    # When
+    client.execute(query="fake_query")
+
+    # Then
+    assert client.last_response_info is not None
+    assert client.last_response_info._replace(latency=None) == GraphQLResponseInfo(
+        complexity=5, nb_bytes=1234
+    )
+    assert client.last_response_info.latency is not None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(lambda: client.last_response_info).result() is None
+
+
+def test_given_a_rate_limiter_when_executing_a_query_then_it_is_acquired_and_reported(
+    mocker: pytest_mock.MockerFixture,
+):
+    def mocked_backend_response(self, *args, **kwargs):
+        self.transport.response_headers = {"x-complexity": "7"}
+        return ExecutionResult({"data": 3}, extensions=None)
+
+    mocker.patch.object(Client, "execute", autospec=True, side_effect=mocked_backend_response)
+    rate_limiter = mocker.MagicMock(spec=RateLimiter)
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+        rate_limiter=rate_limiter,
+    )
+    client._gql_client.fetch_schema_from_transport = False
+
+    # When
+    client.execute(query="query countAssets { countAssets }")
+
+    # Then
+    rate_limiter.try_acquire.assert_called_once_with("countAssets")
+    rate_limiter.report.assert_called_once_with("countAssets", 7)
+
+
+def test_given_lazy_bootstrap_when_creating_the_client_then_the_schema_loads_in_background(
+    mocker: pytest_mock.MockerFixture,
+):
+    schema_loaded = threading.Event()
+    mocker.patch.object(
+        GraphQLClient, "_initizalize_graphql_client", side_effect=lambda: schema_loaded.wait(5)
+    )
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        lazy_bootstrap=True,
+    )
+
+    # When
+    schema_loaded.set()
+
+    # Then
+    assert client._gql_client is True
+
+
+def test_given_a_failed_pending_check_when_executing_a_query_then_it_raises(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocker.patch.object(Client, "execute")
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+    )
+
+    # Given
+    check = Future()
+    check.set_exception(ValueError("invalid api key"))
+    client.add_pending_check(check)
+
+    # When
+    with pytest.raises(ValueError, match="invalid api key"):
+        client.execute(query="query countAssets { countAssets }")
+
+    # Then
+    Client.execute.assert_not_called()
+
+
+def test_given_measured_exchanges_when_executing_queries_then_the_bytes_are_recorded_per_operation(
+    mocker: pytest_mock.MockerFixture,
+):
+    def mocked_backend_response(self, *args, **kwargs):
+        self.transport.response_headers = {"x-complexity": "1"}
+        self.transport.last_exchange = HttpExchange(
+            nb_bytes_sent=100, nb_bytes_received=300, nb_bytes_decoded=2000
+        )
+        return ExecutionResult({"data": 3}, extensions=None)
+
+    mocker.patch.object(Client, "execute", autospec=True, side_effect=mocked_backend_response)
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+    )
+
+    # When
+    for _ in range(2):
+        client.execute(query="query countAssets { countAssets }")
+    client.execute(query="query countLabels { countLabels }")
+
+    # Then
+    snapshot = client.metrics.snapshot()
+    assert (
+        snapshot["countAssets"].nb_requests,
+        snapshot["countAssets"].nb_bytes_sent,
+        snapshot["countAssets"].nb_bytes_received,
+        snapshot["countAssets"].nb_bytes_decoded,
+    ) == (2, 200, 600, 4000)
+    assert (
+        snapshot["countLabels"].nb_requests,
+        snapshot["countLabels"].nb_bytes_sent,
+        snapshot["countLabels"].nb_bytes_received,
+        snapshot["countLabels"].nb_bytes_decoded,
+    ) == (1, 100, 300, 2000)
+    assert client.last_response_info is not None
+    assert client.last_response_info._replace(latency=None) == GraphQLResponseInfo(
+        complexity=1, nb_bytes=2000, nb_bytes_sent=100, nb_bytes_received=300
+    )
+
+
+def test_given_a_metrics_sink_when_executing_queries_then_the_metrics_are_recorded_per_operation(
+    mocker: pytest_mock.MockerFixture,
+):
+    def mocked_backend_response(self, *args, **kwargs):
+        self.transport.response_headers = {"x-complexity": "5"}
+        self.transport.last_exchange = HttpExchange(
+            nb_bytes_sent=100, nb_bytes_received=300, nb_bytes_decoded=2000, nb_retries=1
+        )
+        return ExecutionResult({"data": 3}, extensions=None)
+
+    mocker.patch.object(Client, "execute", autospec=True, side_effect=mocked_backend_response)
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+    )
+    sink = mocker.MagicMock()
+    client.metrics.add_sink(sink)
+
+    # When
+    for _ in range(2):
+        client.execute(query="query countAssets { countAssets }")
+
+    # Then
+    metrics = client.metrics.snapshot()["countAssets"]
+    assert metrics.nb_requests == 2
+    assert metrics.nb_errors == 0
+    assert metrics.nb_retries == 2
+    assert metrics.nb_bytes_sent == 200
+    assert metrics.nb_bytes_received == 600
+    assert metrics.complexity == 10
+    assert sum(metrics.latency_histogram) == 2
+    sink.assert_any_call("kili.graphql.complexity", 5, {"operation": "countAssets"})
+
+
+def test_given_a_circuit_breaker_when_the_backend_fails_repeatedly_then_requests_fail_fast(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocked_execute = mocker.patch.object(
+        Client, "execute", side_effect=exceptions.TransportServerError("Bad Gateway", 502)
+    )
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+        circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+    )
+
+    # When
+    for _ in range(2):
+        with pytest.raises(exceptions.TransportServerError):
+            client.execute(query="query countAssets { countAssets }", retry=False)
+    with pytest.raises(CircuitOpenError):
+        client.execute(query="query countAssets { countAssets }", retry=False)
+
+    # Then
+    assert mocked_execute.call_count == 2
+    assert client.metrics.snapshot()["countAssets"].nb_rejected == 1
+    assert client.metrics.gauges()["circuit_breaker.state"] == 2
+
+
+def test_given_a_half_open_circuit_when_the_probe_is_interrupted_then_another_probe_is_sent(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocked_execute = mocker.patch.object(Client, "execute", side_effect=KeyboardInterrupt)
+
+    # Given
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    circuit_breaker.record_failure()
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+        circuit_breaker=circuit_breaker,
+    )
+
+    # When
+    for _ in range(2):
+        with pytest.raises(KeyboardInterrupt):
+            client.execute(query="query countAssets { countAssets }", retry=False)
+
+    # Then
+    assert mocked_execute.call_count == 2
+    assert circuit_breaker.nb_rejected_requests == 0
+
+
+def test_given_a_retry_budget_when_it_is_spent_then_the_failed_requests_are_not_retried(
+    mocker: pytest_mock.MockerFixture,
+):
+    mocked_execute = mocker.patch.object(
+        Client,
+        "execute",
+        side_effect=exceptions.TransportServerError("Failed to fetch data connection", 500),
+    )
+
+    # Given
+    client = GraphQLClient(
+        endpoint="",
+        api_key="",
+        client_name=GraphQLClientName.SDK,
+        http_client=HttpClient(
+            kili_endpoint="https://fake_endpoint.kili-technology.com", api_key="", verify=True
+        ),
+        enable_schema_caching=False,
+        retry_budget=RetryBudget(ratio=0, min_retries=1),
+    )
+
+    # When
+    with pytest.raises(exceptions.TransportServerError):
+        client.execute(query="query countAssets { countAssets }")
+
+    # Then
+    assert mocked_execute.call_count == 2
+    assert client.metrics.gauges()["retry_budget.denied_retries"] == 1
@@ -0,0 +1,90 @@
+import json
+import threading
+
+import pytest
+
+from kili.core.utils.concurrency import ContextThreadPoolExecutor
+from kili.utils.logcontext import log_call
+from kili.utils.tracing import Tracer, tracer
+
+
+@pytest.fixture()
+def started_tracer():
+    tracer.clear()
+    tracer.start()
+    yield tracer
+    tracer.stop()
+    tracer.clear()
+
+
+def test_given_a_started_tracer_when_calling_a_method_then_its_requests_are_its_child_spans(
+    started_tracer, tmp_path
+):
+    @log_call
+    def export_labels():
+        started_tracer.record_span("countAssets", "graphql", duration=0.0, complexity=1)
+        with ContextThreadPoolExecutor(thread_name_prefix="kili-worker") as executor:
+            executor.submit(started_tracer.record_span, "GET storage", "http", 0.0).result()
+
+    export_labels()
+
+    spans = {span.name: span for span in started_tracer.spans()}
+    assert spans["export_labels"].parent_id is None
+    assert spans["export_labels"].category == "sdk"
+    assert spans["countAssets"].parent_id == spans["export_labels"].span_id
+    assert spans["GET storage"].parent_id == spans["export_labels"].span_id
+    assert spans["GET storage"].thread_name == "kili-worker_0"
+
+    started_tracer.export_chrome_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    complete_events = [event for event in events if event["ph"] == "X"]
+    assert [event["name"] for event in complete_events][0] == "export_labels"
+    assert {event["args"]["name"] for event in events if event["ph"] == "M"} == {
+        threading.current_thread().name,
+        "kili-worker_0",
+    }
+
+    started_tracer.export_json(tmp_path / "spans.json")
+    assert len(json.loads((tmp_path / "spans.json").read_text())) == 3
+
+
+def test_given_a_method_returning_a_generator_when_iterating_it_then_its_span_covers_the_iteration(
+    started_tracer,
+):
+    @log_call
+    def list_assets():
+        for page in range(2):
+            started_tracer.record_span("ListAssets", "graphql", duration=0.0, page=page)
+            yield page
+
+    assets = list_assets()
+    started_tracer.record_span("countAssets", "graphql", duration=0.0)
+    assert list(assets) == [0, 1]
+
+    spans = started_tracer.spans()
+    assert [span.name for span in spans] == [
+        "countAssets",
+        "ListAssets",
+        "ListAssets",
+        "list_assets",
+    ]
+    assert spans[0].parent_id is None
+    assert spans[1].parent_id == spans[2].parent_id == spans[3].span_id
+
+
+def test_given_a_failing_call_when_tracing_it_then_the_span_records_the_error(started_tracer):
+    with pytest.raises(ValueError):
+        with started_tracer.span("append_many_to_dataset", "sdk"):
+            raise ValueError
+
+    (span,) = started_tracer.spans()
+    assert span.attributes == {"error": "ValueError"}
+
+
+def test_given_a_stopped_tracer_when_recording_spans_then_nothing_is_kept():
+    stopped_tracer = Tracer()
+
+    with stopped_tracer.span("export_labels", "sdk"):
+        stopped_tracer.record_span("countAssets", "graphql", duration=0.1)
+
+    assert stopped_tracer.spans() == []